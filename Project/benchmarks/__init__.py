@@ -0,0 +1 @@
+"""Throughput benchmarks; run from the Project directory, e.g. `python -m benchmarks.bench_normalization`."""
@@ -0,0 +1,57 @@
+"""Trend event date parsing: per-event strptime chain vs the memoized batch parser.
+
+Dates mix the four formats the trend agent accepts plus some unparseable
+strings; each distinct date string repeats, as in re-fetched news.
+
+Usage: python -m benchmarks.bench_date_parsing [max_events]
+"""
+
+import datetime
+import random
+import sys
+
+from benchmarks.bench_trend_tags import _best_of
+from competitive_intel.utils.dates import DATE_FORMATS, DateParser
+
+
+def _strptime_chain(value):
+    # The trend agent's previous _parse_date
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    return datetime.datetime.now()
+
+
+def _dates(n: int, seed: int = 0):
+    rng = random.Random(seed)
+    base = datetime.datetime(2025, 1, 1)
+    distinct = []
+    for i in range(max(1, n // 5)):
+        fmt = DATE_FORMATS[i % len(DATE_FORMATS)]
+        ts = base + datetime.timedelta(days=rng.randint(0, 365), seconds=rng.randint(0, 86_399))
+        distinct.append(ts.strftime(fmt) if i % 20 else f"{rng.randint(1, 9)} hours ago")
+    return [rng.choice(distinct) for _ in range(n)]
+
+
+def main() -> None:
+    max_events = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    sizes = [n for n in (10_000, 100_000, 1_000_000) if n <= max_events] or [max_events]
+    print(f"{'events':>8s} {'strptime':>10s} {'batch cold':>11s} {'batch warm':>11s}")
+    for n in sizes:
+        dates = _dates(n)
+        t_loop = _best_of(lambda _: [_strptime_chain(d) for d in dates])
+        t_cold = _best_of(lambda _: DateParser().parse_many(dates))
+
+        def primed():
+            parser = DateParser()
+            parser.parse_many(dates)
+            return parser
+
+        t_warm = _best_of(lambda parser: parser.parse_many(dates), setup=primed)
+        print(f"{n:8d} {t_loop:9.3f}s {t_cold:10.3f}s {t_warm:10.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Per-signal `score_signal` vs columnar `score_batch` in the original impact scorer.
+
+Signals mix the default competitors with unknown ones, every event type the
+pipeline emits, keyword-rich descriptions and date strings or datetimes over
+the last two months. The shared date parser sees the timestamps first, so
+neither timing includes parsing new date strings. "agree" counts rows where both paths return the same
+ImpactScore (a row can differ only when the clock crosses a recency bucket
+between the two runs). "cached" re-scores the same signals with a warm
+component cache, so only timing and the final score are recomputed.
+
+Usage: python -m benchmarks.bench_impact_batch [max_signals]
+"""
+
+import datetime
+import logging
+import sys
+
+from benchmarks.bench_trend_tags import _DESCRIPTIONS, _best_of
+from competitive_intel.scoring.cache import ComponentCache
+from competitive_intel.utils.dates import shared_date_parser
+from impact_scoring_agent import ImpactScoringAgent, default_mobile_competitors
+
+_BRANDS = ['Apple', 'Samsung', 'Xiaomi', 'OPPO', 'vivo', 'Huawei', 'OnePlus', 'Honor']
+_TYPES = ['product_launch', 'pricing_change', 'carrier_deal', 'partnership', 'certification', 'preorder', 'other']
+_EXTRA = ["with STC and du in KSA", "20% off for White Friday in Egypt", "on Snapdragon 8 Gen 4",
+          "after a major DxOMark result", "ahead of MWC Barcelona", ""]
+
+
+def _signals(n: int):
+    now = datetime.datetime.now(datetime.timezone.utc)
+    out = []
+    for i in range(n):
+        ts = now - datetime.timedelta(minutes=37 * i % (60 * 24 * 60))
+        out.append({'competitor': _BRANDS[i % len(_BRANDS)],
+                    'event_type': _TYPES[i % len(_TYPES)],
+                    'text': f"{_DESCRIPTIONS[i % len(_DESCRIPTIONS)]} {_EXTRA[i % len(_EXTRA)]} #{i}",
+                    'timestamp': ts.strftime('%Y-%m-%d %H:%M:%S') if i % 2 else ts,
+                    'labels': [_TYPES[i % len(_TYPES)], _TYPES[(i // 7) % len(_TYPES)]]})
+    return out
+
+
+def main() -> None:
+    logging.disable(logging.INFO)
+    max_signals = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    sizes = [n for n in (1_000, 10_000, 100_000) if n <= max_signals] or [max_signals]
+    print(f"{'signals':>8s} {'score_signal':>13s} {'score_batch':>12s} {'speedup':>8s} {'agree':>8s} {'cached':>9s}")
+    for n in sizes:
+        signals = _signals(n)
+        shared_date_parser().parse_many([s['timestamp'] for s in signals])
+        scorer = ImpactScoringAgent(default_mobile_competitors())
+        scorer.score_signals(signals[:1])  # builds the keyword matcher
+        t_single = _best_of(lambda _: [scorer.score_signal(s) for s in signals], repeat=1 if n > 10_000 else 3)
+        t_batch = _best_of(lambda _: scorer.score_signals(signals))
+        single = [scorer.score_signal(s) for s in signals]
+        agree = sum(a == b for a, b in zip(single, scorer.score_signals(signals)))
+        scorer.component_cache = ComponentCache(max_entries=n)
+        scorer.score_signals(signals)
+        t_cached = _best_of(lambda _: scorer.score_signals(signals))
+        print(f"{n:8d} {t_single:12.3f}s {t_batch:11.3f}s {t_single / t_batch:7.1f}x {agree:8d} {t_cached:8.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Normalize-once vs per-stage normalization on a 50k-event run.
+
+Usage: python -m benchmarks.bench_normalization [n_events]
+"""
+
+import gc
+import sys
+import time
+
+from competitive_intel.agents.event_classification_agent import EventClassificationInterface
+from competitive_intel.agents.impact_scoring_agent import ImpactScoringInterface
+from competitive_intel.utils.common import coerce_datetime, generate_demo_items
+from competitive_intel.utils.event_store import NormalizedEventStore
+
+
+def _raw_items(n: int):
+    comps = ["Samsung", "Apple", "Xiaomi", "OPPO", "vivo", "Huawei", "Google", "OnePlus", "Nothing"]
+    per_comp = max(1, n // len(comps))
+    return generate_demo_items(comps, ["US", "EU", "KSA", "UAE", "IN"], per_comp, days=30)
+
+
+def run_per_stage(raw):
+    """Previous flow: classify and score each normalize, n_score re-parses dates."""
+    classify, scorer = EventClassificationInterface(), ImpactScoringInterface()
+    classified = classify.classify_items(raw)
+    for ev in classified:
+        ev['date'] = coerce_datetime(ev.get('date'))
+    return scorer.score_events(classified)
+
+
+def run_normalize_once(raw):
+    classify, scorer = EventClassificationInterface(), ImpactScoringInterface()
+    store = NormalizedEventStore()
+    store.ingest(raw)
+    classified = classify.classify_items(store.records())
+    return scorer.score_events(classified, store=store)
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    raw = _raw_items(n)
+    print(f"events: {len(raw)}")
+    for name, fn in (("per-stage normalization", run_per_stage), ("normalize once (store)", run_normalize_once)):
+        best = float("inf")
+        for _ in range(3):
+            # Like timeit, keep the collector out of the measurement
+            gc.collect()
+            gc.disable()
+            t0 = time.perf_counter()
+            fn(raw)
+            best = min(best, time.perf_counter() - t0)
+            gc.enable()
+        print(f"{name:26s} {best:7.3f}s  {len(raw)/best:10.0f} events/s (best of 3)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Region-aware batch scoring: text scans saved by structured regions, and impact by region.
+
+Signals are the `bench_impact_batch` mix; a share of them carry a structured
+region (as search results do), the rest leave it to the text. "scans" counts
+texts the scorer searched for region names, which only happens for signals
+without a region. The distribution table scores the 100%-structured signals
+with the default weights and with an example override for EG and KSA
+(timing weighted up).
+
+Usage: python -m benchmarks.bench_region_scoring [signals]
+"""
+
+import logging
+import sys
+
+import numpy as np
+
+from benchmarks.bench_impact_batch import _BRANDS, _signals
+from benchmarks.bench_trend_tags import _best_of
+from competitive_intel.utils.dates import shared_date_parser
+from impact_scoring_agent import ImpactScoringAgent, default_mobile_competitors
+
+_REGIONS = ['KSA', 'UAE', 'EG', 'IN', 'EU', 'US', 'CN']
+_OVERRIDES = {'EG': {'timing': 0.35, 'competitor_size': 0.25}, 'KSA': {'timing': 0.35, 'competitor_size': 0.25}}
+
+
+def _with_regions(signals, share: float):
+    # Regions cycle once per cycle of brands, so every region sees every brand
+    return [{**s, 'region': _REGIONS[i // len(_BRANDS) % len(_REGIONS)] if i % 10 < share * 10 else None}
+            for i, s in enumerate(signals)]
+
+
+def _distribution(scorer, signals):
+    scores = scorer.score_signals(signals)
+    by_region = {}
+    for s, final, urgency in zip(signals, scores.final_score.tolist(), scores.urgency.tolist()):
+        by_region.setdefault(s['region'], []).append((final, urgency in ('immediate', 'high')))
+    return by_region
+
+
+def main() -> None:
+    logging.disable(logging.INFO)
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    signals = _signals(n)
+    shared_date_parser().parse_many([s['timestamp'] for s in signals])
+    print(f"{'structured':>10s} {'scans':>8s} {'score_batch':>12s}")
+    for share in (0.0, 0.5, 0.9, 1.0):
+        batch = _with_regions(signals, share)
+        scorer = ImpactScoringAgent(default_mobile_competitors())
+        scorer.score_signals(batch[:1])  # builds the keyword matchers
+        scorer.region_text_scans = 0
+        scorer.score_signals(batch)
+        scans = scorer.region_text_scans
+        t = _best_of(lambda _: scorer.score_signals(batch))
+        print(f"{share:10.0%} {scans:8d} {t:11.3f}s")
+
+    batch = _with_regions(signals, 1.0)
+    default = _distribution(ImpactScoringAgent(default_mobile_competitors()), batch)
+    override = _distribution(ImpactScoringAgent(default_mobile_competitors(), region_weights=_OVERRIDES), batch)
+    print(f"\n{'region':>6s} {'signals':>8s} {'mean':>6s} {'p50':>5s} {'p90':>5s} {'high+':>6s}"
+          f" | {'mean':>6s} {'p90':>5s} {'high+':>6s}  (EG/KSA override)")
+    for region in sorted(default):
+        rows = np.array(default[region])
+        over = np.array(override[region])
+        print(f"{region:>6s} {len(rows):8d} {rows[:, 0].mean():6.2f} {np.percentile(rows[:, 0], 50):5.1f}"
+              f" {np.percentile(rows[:, 0], 90):5.1f} {rows[:, 1].mean():6.1%}"
+              f" | {over[:, 0].mean():6.2f} {np.percentile(over[:, 0], 90):5.1f} {over[:, 1].mean():6.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Per-call cost of the trend window's facet counts as the window grows.
+
+Compares re-counting every event in the window (what the analyzers did with
+a DataFrame per call) with the history's running counters, on a call where
+the window slid by one day and 1% new events arrived.
+
+Usage: python -m benchmarks.bench_trend_counters [max_events]
+"""
+
+import datetime
+import sys
+
+from benchmarks.bench_trend_tags import _DESCRIPTIONS, _best_of
+from competitive_intel.trends.counters import FacetCounts, TrendCounts, event_facets
+from competitive_intel.trends.history import TrendEventHistory
+from competitive_intel.trends.tags import TrendTagger
+
+_BRANDS = ['Apple', 'Samsung', 'Oppo', 'Xiaomi', 'Vivo', 'OnePlus', 'Honor', None]
+_TYPES = ['product_launch', 'pricing_change', 'partnership', 'marketing_campaign']
+_WINDOW_DAYS = 90
+
+
+def _events(n: int, end: datetime.datetime, span: datetime.timedelta, first_id: int = 0):
+    """`n` events spread evenly over `span` ending at `end`."""
+    step = span / max(n, 1)
+    return [{'id': f"E{first_id + i}",
+             'description': _DESCRIPTIONS[i % len(_DESCRIPTIONS)],
+             'competitor': _BRANDS[i % len(_BRANDS)],
+             'event_type': _TYPES[i % len(_TYPES)],
+             'date': end - step * i}
+            for i in range(n)]
+
+
+def _history(events, tagger: TrendTagger) -> TrendEventHistory:
+    def keyer(ev, ts):
+        tags = tagger.names_of(tagger.tag_event(ev))
+        return event_facets(ev.get('event_type'), tags, ts.month), ev.get('competitor')
+    history = TrendEventHistory(lambda d: d, keyer=keyer)
+    history.extend(events)
+    return history
+
+
+def _recount(history: TrendEventHistory, tagger: TrendTagger, now: datetime.datetime) -> TrendCounts:
+    counts = FacetCounts()
+    for ev in history.window(_WINDOW_DAYS, now):
+        tags = tagger.names_of(tagger.tag_event(ev))
+        counts.add(event_facets(ev.get('event_type'), tags, ev['date'].month), ev.get('competitor'))
+    return TrendCounts(counts)
+
+
+def main() -> None:
+    max_events = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    sizes = [n for n in (1_000, 10_000, 100_000, 1_000_000) if n <= max_events] or [max_events]
+    now = datetime.datetime(2025, 6, 30, 12)
+    later = now + datetime.timedelta(days=1)
+    print(f"{'window':>8s} {'recount':>10s} {'counters':>10s}   (next call: window slid 1 day, 1% new events)")
+    for n in sizes:
+        tagger = TrendTagger(cache_size=2 * n)
+        events = _events(n, now, datetime.timedelta(days=_WINDOW_DAYS))
+        fresh = _events(n // 100, later, datetime.timedelta(days=1), first_id=n)
+
+        def primed():
+            history = _history(events, tagger)
+            history.counts(_WINDOW_DAYS, now)
+            history.extend(fresh)
+            return history
+
+        t_recount = _best_of(lambda h: _recount(h, tagger, later).total, setup=primed)
+        t_counters = _best_of(lambda h: h.counts(_WINDOW_DAYS, later).total, setup=primed)
+        print(f"{n:8d} {t_recount:9.4f}s {t_counters:9.4f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Per-call trend keyword tagging cost as the trend window grows.
+
+Compares the analyzers' previous per-pattern `str.contains` scans with the
+single-pass tag matrix, cold (first call) and warm (the next call, where
+only newly arrived events are tagged).
+
+Usage: python -m benchmarks.bench_trend_tags [max_events]
+"""
+
+import gc
+import sys
+import time
+
+import pandas as pd
+
+from competitive_intel.trends.tags import TrendTagger
+
+# The patterns the analyzers scanned for, one full pass each
+_PATTERNS = [
+    r'\b5G\b',
+    'AI|artificial intelligence|machine learning|ML|neural|smart',
+    'processor|chipset|performance|speed|RAM|storage|benchmark',
+    'increase|raise|higher',
+    'decrease|reduce|lower|discount',
+    'premium|flagship|ultra|pro max',
+    'camera|MP|megapixel|photo|photography|video|lens|zoom',
+    r'\d+MP|\d+\s*megapixel',
+    'video|4K|8K|recording',
+    'fast charging|wireless charging|mAh|battery|power|charge',
+    'display|screen|OLED|AMOLED|refresh rate|120Hz|90Hz|foldable',
+    'partnership|collaboration|alliance|deal',
+]
+
+_DESCRIPTIONS = [
+    "Samsung Galaxy S25 Ultra with 200MP camera, AI photography, and 5G enhancements",
+    "iPhone 16 Pro: advanced on-device AI processing, optimized 5G modem",
+    "Oppo reduces Find X8 Pro price by 15% with fast charging upgrade promo",
+    "Xiaomi 15 Pro adds 120W fast charging and wireless charging improvements",
+    "OnePlus partners with professional photographers for AI photo campaign",
+    "Vivo announces partnership with Zeiss for next-gen camera tech",
+    "Nothing Phone 4 introduces unique design and AI-powered interface",
+    "Honor opens flagship store in Riyadh",
+]
+
+
+def _events(n: int, offset: int = 0):
+    return [{'id': f"E{offset + i}", 'description': f"{_DESCRIPTIONS[(offset + i) % len(_DESCRIPTIONS)]} #{offset + i}"}
+            for i in range(n)]
+
+
+def _best_of(fn, repeat: int = 3, setup=None) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        arg = setup() if setup else None
+        gc.collect()
+        gc.disable()
+        t0 = time.perf_counter()
+        fn(arg)
+        best = min(best, time.perf_counter() - t0)
+        gc.enable()
+    return best
+
+
+def _primed(events):
+    tagger = TrendTagger()
+    tagger.matrix(events)
+    return tagger
+
+
+def main() -> None:
+    max_events = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    sizes = [n for n in (1_000, 10_000, 50_000, 100_000, 500_000) if n <= max_events] or [max_events]
+    print(f"{'window':>8s} {'str.contains':>13s} {'tags cold':>10s} {'tags warm':>10s}   (warm = next call, 1% new events)")
+    for n in sizes:
+        events = _events(n)
+        desc = pd.Series([ev['description'] for ev in events])
+
+        t_scan = _best_of(lambda _: [desc.str.contains(p, case=False, na=False) for p in _PATTERNS])
+        t_cold = _best_of(lambda _: TrendTagger().matrix(events))
+        # Next call: the window slid by 1%; only the new events miss the cache
+        window = events[n // 100:] + _events(n // 100, offset=n)
+        t_warm = _best_of(lambda tagger: tagger.matrix(window), setup=lambda: _primed(events))
+        print(f"{n:8d} {t_scan:12.3f}s {t_cold:9.3f}s {t_warm:9.3f}s")
+
+
+if __name__ == "__main__":
+    main()
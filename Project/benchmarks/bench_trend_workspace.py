@@ -0,0 +1,73 @@
+"""Construction cost and memory of the columnar trend workspace vs a DataFrame.
+
+Events carry the nested fields the pipeline attaches (entities, metadata,
+impact_breakdown). `pd.DataFrame(events)` keeps all of them as object
+columns; the workspace projects only the columns the trend analyzers read.
+Deep memory counts the description strings once for both. "ws cold" tags
+and parses every event, which the DataFrame path leaves to the analyzers'
+`str.contains` scans, so it is expected to be slower than `pd.DataFrame`;
+"ws warm" reuses a tagger and date parser that have seen the events, as the
+trend agent's shared ones have.
+
+Usage: python -m benchmarks.bench_trend_workspace [max_events]
+"""
+
+import datetime
+import sys
+
+import pandas as pd
+
+from benchmarks.bench_trend_tags import _DESCRIPTIONS, _best_of
+from competitive_intel.trends import workspace as ws_module
+from competitive_intel.trends.tags import TrendTagger
+from competitive_intel.trends.workspace import TrendWorkspace
+from competitive_intel.utils.dates import DateParser
+
+_BRANDS = ['Apple', 'Samsung', 'Oppo', 'Xiaomi', 'Vivo', 'OnePlus', 'Honor', None]
+_TYPES = ['product_launch', 'pricing_change', 'partnership', 'marketing_campaign']
+_REGIONS = ['US', 'EU', 'IN', 'SA', None]
+
+
+def _events(n: int):
+    end = datetime.datetime(2025, 6, 30, 12)
+    return [{'id': f"E{i}",
+             'description': f"{_DESCRIPTIONS[i % len(_DESCRIPTIONS)]} #{i}",
+             'competitor': _BRANDS[i % len(_BRANDS)],
+             'event_type': _TYPES[i % len(_TYPES)],
+             'region': _REGIONS[i % len(_REGIONS)],
+             'date': (end - datetime.timedelta(minutes=7 * i)).strftime('%Y-%m-%d %H:%M:%S'),
+             'impact': (i % 100) / 10.0,
+             'entities': {'products': [f"Model {i % 50}"], 'prices': []},
+             'metadata': {'source': 'bench', 'url': f"https://example.com/{i}"},
+             'impact_breakdown': {'market': 5.0, 'timing': 7.5, 'competitor': 6.0}}
+            for i in range(n)]
+
+
+def _mb(nbytes: float) -> str:
+    return f"{nbytes / 2 ** 20:8.1f}MB"
+
+
+def main() -> None:
+    max_events = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    sizes = [n for n in (10_000, 100_000, 1_000_000) if n <= max_events] or [max_events]
+    print(f"{'events':>8s} {'DataFrame':>10s} {'ws cold':>10s} {'ws warm':>10s} "
+          f"{'df deep':>10s} {'ws arrays':>10s} {'ws deep':>10s}")
+    for n in sizes:
+        events = _events(n)
+        text_bytes = sum(sys.getsizeof(ev['description']) for ev in events)
+        t_df = _best_of(lambda _: pd.DataFrame(events))
+        t_cold = _best_of(lambda _: TrendWorkspace.from_events(events, DateParser(), TrendTagger(cache_size=n)))
+        parser, tagger = DateParser(), TrendTagger(cache_size=n)
+        ws = TrendWorkspace.from_events(events, parser, tagger)
+        t_warm = _best_of(lambda _: TrendWorkspace.from_events(events, parser, tagger))
+        df_bytes = pd.DataFrame(events).memory_usage(deep=True).sum()
+        print(f"{n:8d} {t_df:9.3f}s {t_cold:9.3f}s {t_warm:9.3f}s {_mb(df_bytes):>10s} {_mb(ws.nbytes):>10s} "
+              f"{_mb(ws.nbytes + text_bytes):>10s}")
+        if ws_module.pa is not None:
+            print(f"{'':8s} to_arrow {_best_of(lambda _: ws.to_arrow()):9.3f}s")
+    if ws_module.pa is None:
+        print("pyarrow not installed: Arrow export not measured")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,12 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import os
 
+from competitive_intel.classification.cascade import CascadeConfig, LLMEscalator, run_cascade
+from competitive_intel.classification.labels import canonical_label
+from competitive_intel.classification.language_packs import label_scores, multilingual_groups
+from competitive_intel.utils.event_store import NormalizedEvent
+from competitive_intel.utils.keywords import KeywordMatcher
+
 _OrigClassifier = None
 if os.environ.get("CI_USE_ORIGINAL_CLASSIFIER") == "1":
     try:
@@ -9,22 +15,51 @@ if os.environ.get("CI_USE_ORIGINAL_CLASSIFIER") == "1":
         _OrigClassifier = None
 
 
+# Rule-based fallback: first matching rule wins; hit ratios feed `all_scores`
+_FALLBACK_RULES = [
+    ("product_launch", ["launch", "unveil", "announce", "debut", "pre-order", "preorder", "flagship", "available"]),
+    ("pricing_change", ["price", "discount", "deal", "offer", "% off", "reduce", "cut"]),
+    ("marketing_campaign", ["campaign", "advert", "marketing", "influencer", "promotion"]),
+    ("expansion", ["expand", "enter market", "opening", "launch in", "store", "retail"]),
+    ("partnership", ["partner", "operator", "carrier", "alliance", "collaborat"]),
+]
+_FALLBACK_LABELS = [label for label, _ in _FALLBACK_RULES]
+# English rules and the ar/hi/zh packs share one matcher: one scan per text
+_FALLBACK_MATCHER = KeywordMatcher(multilingual_groups(_FALLBACK_RULES))
+
+
 class EventClassificationInterface:
     def __init__(self) -> None:
         self.classifier = _OrigClassifier() if _OrigClassifier else None
+        self.escalator = LLMEscalator()
+        self.last_metrics: Dict[str, Any] = {}
 
-    def classify_items(self, items: list[Dict[str, Any]]) -> list[Dict[str, Any]]:
+    def classify_items(self, items: list[Dict[str, Any]], config: Optional[Dict[str, Any]] = None) -> list[Dict[str, Any]]:
+        """Classify items with the fast classifier.
+
+        Items may be raw articles or `NormalizedEvent` records from the
+        pipeline's normalize stage; the latter are used as-is.
+        With `config['classification_mode'] == 'cascade'`, uncertain items are
+        escalated to the LLM in batches and `self.last_metrics` reports the
+        escalation rate, LLM calls avoided and agreement rate.
+        Non-English items (see `NormalizedEvent.language`) are classified
+        with the matching language pack rather than the English-only
+        original classifier.
+        Every output carries `labels` (primary label first); with
+        `config['multi_label']` it also lists each other label scoring at
+        least `config['label_threshold']` (default 0.1).
+        """
+        cfg = config or {}
+        multi_label = bool(cfg.get('multi_label'))
+        label_threshold = float(cfg.get('label_threshold', 0.1))
         outputs = []
         for it in items:
-            # Normalize
-            try:
-                from competitive_intel.utils.common import normalize_event_dict
-                norm = normalize_event_dict(it)
-            except Exception:
-                norm = it
-            text = (norm.get('description') or f"{it.get('title','')}. {it.get('summary','') or it.get('description','')}").strip()
-            if self.classifier:
-                res = self.classifier.classify_event(text, {"source": norm.get("source", ""), "link": it.get("link", "")})
+            norm = it if isinstance(it, NormalizedEvent) else NormalizedEvent.from_raw(it)
+            text = norm['text']
+            lang = norm.get('language') or 'en'
+            if self.classifier and lang == 'en':
+                res = self.classifier.classify_event(text, {"source": norm.get("source", ""), "link": norm.get("link", "")},
+                                                     multi_label=multi_label, label_threshold=label_threshold)
                 entities = res.extracted_entities or {}
                 if not entities.get('companies') and norm.get('competitor'):
                     entities['companies'] = [norm.get('competitor')]
@@ -35,6 +70,7 @@ class EventClassificationInterface:
                     metadata['source'] = norm.get('source')
                 outputs.append({
                     "event_type": res.event_type.value,
+                    "labels": [canonical_label(l.value) for l in (res.labels or [res.event_type])],
                     "confidence": res.confidence_score,
                     "reasoning": res.reasoning,
                     "entities": entities,
@@ -43,36 +79,49 @@ class EventClassificationInterface:
                     "description": norm.get("description") or text,
                     "date": norm.get("date"),
                     "source": norm.get("source"),
+                    "region": norm.get("region"),
+                    "language": lang,
+                    "id": norm.get("id"),
                 })
             else:
-                t = text.lower()
-                if any(k in t for k in ["launch", "unveil", "announce", "debut", "pre-order", "preorder", "flagship", "available", "preorder"]):
-                    ev = "product_launch"
-                elif any(k in t for k in ["price", "discount", "deal", "offer", "% off", "reduce", "cut"]):
-                    ev = "pricing_change"
-                elif any(k in t for k in ["campaign", "advert", "marketing", "influencer", "promotion"]):
-                    ev = "marketing_campaign"
-                elif any(k in t for k in ["expand", "enter market", "opening", "launch in", "store", "retail"]):
-                    ev = "expansion"
-                else:
-                    ev = "unknown"
+                scores = label_scores(_FALLBACK_MATCHER.group_scores(text), _FALLBACK_LABELS, lang)
+                ev = next((label for label in _FALLBACK_LABELS if scores[label]), "unknown")
+                labels = [ev]
+                if multi_label and ev != "unknown":
+                    labels += [label for label, sc in sorted(scores.items(), key=lambda x: x[1], reverse=True)
+                               if label != ev and sc >= label_threshold]
                 outputs.append({
                     "event_type": ev,
-                    "confidence": 0.5,
-                    "reasoning": "Rule-based fallback classification.",
+                    "labels": labels,
+                    # Keyword share of the chosen label, on the original classifier's scale
+                    "confidence": scores.get(ev, 0.0),
+                    "reasoning": "Rule-based fallback classification." if lang == 'en' else f"Rule-based classification ({lang} keyword pack).",
                     "entities": {
                         'companies': [norm.get('competitor')] if norm.get('competitor') else [],
                         'locations': [norm.get('region')] if norm.get('region') else []
                     },
                     "metadata": {
                         'source': norm.get('source'),
-                        'id': norm.get('id')
+                        'id': norm.get('id'),
+                        'language': lang,
+                        'all_scores': scores,
                     },
                     "competitor": norm.get("competitor"),
                     "description": norm.get("description") or text,
                     "date": norm.get("date"),
                     "source": norm.get("source"),
+                    "region": norm.get("region"),
+                    "language": lang,
+                    "id": norm.get("id"),
                 })
+
+        if cfg.get('classification_mode') == 'cascade':
+            cascade_cfg = CascadeConfig.from_config(cfg)
+            self.escalator.model = cascade_cfg.model
+            escalate = self.escalator.classify_batch if self.escalator.available else None
+            self.last_metrics = run_cascade(outputs, escalate, cascade_cfg)
+        else:
+            self.last_metrics = {'mode': 'fast', 'total': len(outputs), 'escalated': 0, 'llm_calls': 0}
         return outputs
 
 
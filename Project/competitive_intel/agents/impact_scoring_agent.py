@@ -1,6 +1,19 @@
-from typing import Dict, Any
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional
+import logging
 import os
 
+from competitive_intel.classification.aggregator import ClassificationAggregator
+from competitive_intel.classification.labels import event_labels
+from competitive_intel.scoring.cache import shared_component_cache
+from competitive_intel.scoring.provenance import shared_provenance_store
+from competitive_intel.scoring.rescoring import shared_rescoring_service
+from competitive_intel.trends.bursts import BurstDetector
+from competitive_intel.utils.common import normalize_event_dict
+from competitive_intel.utils.event_store import NormalizedEventStore
+
+logger = logging.getLogger(__name__)
+
 _OrigImpactScorer = None
 default_mobile_competitors = lambda: {}
 
@@ -12,42 +25,146 @@ if os.environ.get("CI_USE_ORIGINAL_IMPACT") == "1":
         default_mobile_competitors = lambda: {}
 
 
+def _heuristic_base(label: str) -> float:
+    if 'launch' in label: return 7.5
+    if 'pricing' in label or 'price' in label: return 7.0
+    if 'carrier' in label or 'partnership' in label: return 6.8
+    if 'campaign' in label or 'marketing' in label: return 6.0
+    if 'certification' in label: return 5.5
+    return 5.0
+
+
+def _signal_timestamp(rec: Dict[str, Any]) -> Any:
+    """Parsed date, else the unparseable value as given (neutral timing), else None (no date).
+
+    This is also the date in the component cache key: stable across re-crawls,
+    and None for undated events, which the cache skips.
+    """
+    return rec['date'] if rec.get('date') is not None else rec.get('date_raw')
+
+
+def _burst_adjustment(alert):
+    """(impact, urgency) -> (impact, urgency) with a burst alert's boost and escalation."""
+    return lambda impact, urgency: (round(min(10.0, impact + alert.impact_boost), 1),
+                                    alert.escalate_urgency(urgency))
+
+
+def impact_reasoning(ev: Dict[str, Any]) -> str:
+    """Reasoning text for a scored event.
+
+    Events scored by the original scorer carry an `impact_explanation` (the
+    component scores and context) instead of text; it is rendered here, at
+    display or export time.
+    """
+    explanation = ev.get('impact_explanation')
+    if explanation is not None:
+        return str(explanation)
+    return ev.get('impact_reasoning', '')
+
+
 class ImpactScoringInterface:
     def __init__(self) -> None:
         self.scorer = _OrigImpactScorer(default_mobile_competitors()) if _OrigImpactScorer else None
+        # Calibrated weights file (python -m competitive_intel.scoring.calibration); re-read when it changes
+        self.weights_path = os.environ.get("CI_IMPACT_WEIGHTS")
+        self._refresh_weights()
+        # Re-crawled events reuse their time-invariant components across runs; timing is recomputed
+        if self.scorer is not None:
+            self.scorer.component_cache = shared_component_cache()
+        # Scored events are kept current as they age (see RescoringService.apply in the dashboard)
+        self.rescoring = shared_rescoring_service(self.scorer) if self.scorer is not None else None
+        # Score provenance for audits (python -m competitive_intel.scoring.provenance DIR EVENT_ID)
+        provenance_dir = os.environ.get("CI_PROVENANCE_DIR")
+        self.provenance = shared_provenance_store(provenance_dir) if self.scorer is not None and provenance_dir else None
+        self.last_metrics: Dict[str, Any] = {}
 
-    def score_events(self, events: list[Dict[str, Any]]) -> list[Dict[str, Any]]:
-        scored = []
+    def _refresh_weights(self) -> None:
+        if self.scorer is None or not self.weights_path:
+            return
+        try:
+            if not self.scorer.refresh_weights() and not self.scorer.weights_version:
+                self.scorer.load_weights(self.weights_path)
+        except (OSError, ValueError):
+            pass  # no usable file yet: keep the current weights
+
+    def score_events(self, events: list[Dict[str, Any]], store: Optional[NormalizedEventStore] = None,
+                     aggregator: Optional[ClassificationAggregator] = None,
+                     bursts: Optional[BurstDetector] = None) -> list[Dict[str, Any]]:
+        """Score classified events.
+
+        With a `store`, competitor/date/id come from the normalized record and
+        are not re-derived; otherwise each event is normalized here.
+        Each scored event is also added to `aggregator` when one is given.
+        With a `bursts` detector, events observed during a competitor spike
+        get a higher impact and urgency and carry the alert as `burst`.
+        """
+        self._refresh_weights()
+        signals = []
         for idx, ev in enumerate(events, 1):
-            # Normalize
-            try:
-                from competitive_intel.utils.common import normalize_event_dict
+            rec = store.get(ev.get('id')) if store is not None else None
+            if rec is not None:
+                signals.append({
+                    'id': rec['id'],
+                    'competitor': rec['competitor'],
+                    'event_type': ev.get('event_type') or 'other',
+                    'text': ev.get('description') or rec['description'],
+                    'timestamp': _signal_timestamp(rec),
+                    'region': rec.get('region') or '',
+                    'labels': event_labels(ev),
+                })
+            else:
                 nev = normalize_event_dict(ev)
-            except Exception:
-                nev = ev
-            signal = {
-                'id': nev.get('id') or f'E{idx:04d}',
-                'competitor': nev.get('competitor') or (ev.get('entities', {}).get('companies', ['Unknown'])[0] if isinstance(ev.get('entities'), dict) else 'Unknown'),
-                'event_type': nev.get('event_type', 'other'),
-                'text': nev.get('description', ''),
-                'timestamp': nev.get('date'),
-            }
+                signals.append({
+                    'id': nev.get('id') or f'E{idx:04d}',
+                    'competitor': nev.get('competitor') or (ev.get('entities', {}).get('companies', ['Unknown'])[0] if isinstance(ev.get('entities'), dict) else 'Unknown'),
+                    'event_type': nev.get('event_type', 'other'),
+                    'text': nev.get('description', ''),
+                    'timestamp': _signal_timestamp(nev),
+                    'region': nev.get('region') or '',
+                    'labels': event_labels(ev),
+                })
+        alerts = bursts.observe_batch(signals) if bursts is not None else [None] * len(signals)
+        # The original scorer scores all signals in one columnar batch
+        cache = self.scorer.component_cache if self.scorer else None
+        before = cache.stats() if cache is not None else None
+        if self.scorer:
+            now = datetime.now(timezone.utc)
+            components = self.scorer.signal_components(signals, now)
+            scores = self.scorer.score_components(components, now)
+        else:
+            scores = [None] * len(signals)
+        if cache is not None:
+            after = cache.stats()
+            hits, misses = after.hits - before.hits, after.misses - before.misses
+            self.last_metrics = {'events': len(signals), 'cache_hits': hits, 'cache_misses': misses,
+                                 'cache_hit_rate': round(hits / (hits + misses), 4) if hits + misses else 0.0,
+                                 'cache_entries': after.entries, 'cache_evictions': after.evictions}
+        else:
+            self.last_metrics = {'events': len(signals)}
+        if self.rescoring is not None:
+            adjustments = [_burst_adjustment(a) if a is not None else None for a in alerts]
+            # Only parsed dates age; raw (unparseable) and missing dates keep their score
+            self.rescoring.track([s['id'] for s in signals], components, scores, now,
+                                 dated=[isinstance(s.get('timestamp'), datetime) for s in signals],
+                                 adjustments=adjustments)
+        if self.provenance is not None:
+            try:
+                self.provenance.append([s['id'] for s in signals], components, scores, self.scorer, now,
+                                       bursts=[a.impact_boost if a is not None else 0.0 for a in alerts])
+            except OSError as e:
+                logger.warning(f"Score provenance not recorded: {e}")
+
+        scored = []
+        for ev, signal, alert, score in zip(events, signals, alerts, scores):
             if self.scorer:
-                score = self.scorer.score_signal(signal)
                 ev_out = {**ev, 'impact': score.final_score, 'urgency': score.urgency, 'impact_breakdown': {
                     'size': score.competitor_size_score,
                     'event': score.event_significance_score,
                     'timing': score.timing_score,
-                }, 'impact_reasoning': score.reasoning}
+                }, 'impact_explanation': score.explanation}
             else:
-                # Heuristic scoring by event_type and brand size cues
-                et = (signal.get('event_type') or 'other').lower()
-                base = 5.0
-                if 'launch' in et: base = 7.5
-                elif 'pricing' in et or 'price' in et: base = 7.0
-                elif 'carrier' in et or 'operator' in signal.get('text',''): base = 6.8
-                elif 'campaign' in et or 'marketing' in et: base = 6.0
-                elif 'certification' in et: base = 5.5
+                # Heuristic scoring by the strongest label and brand size cues
+                base = max(_heuristic_base(l) for l in signal['labels'])
                 # Big brands boost
                 comp = (signal.get('competitor') or '').lower()
                 if comp in ('samsung','apple','huawei'): base += 1.0
@@ -55,7 +172,11 @@ class ImpactScoringInterface:
                 final = max(0.0, min(10.0, base))
                 urgency = 'immediate' if final >= 8.0 else 'high' if final >= 7.0 else 'medium' if final >= 5.0 else 'low'
                 ev_out = {**ev, 'impact': round(final,1), 'urgency': urgency, 'impact_breakdown': {'size': final-1, 'event': final, 'timing': 6.0}, 'impact_reasoning': 'Heuristic fallback score'}
+            if alert is not None:
+                ev_out['impact'], ev_out['urgency'] = _burst_adjustment(alert)(ev_out['impact'], ev_out['urgency'])
+                ev_out['impact_breakdown'] = {**ev_out['impact_breakdown'], 'burst': alert.impact_boost}
+                ev_out['burst'] = alert.to_dict()
             scored.append(ev_out)
+            if aggregator is not None:
+                aggregator.add_event(ev_out)
         return scored
-
-
@@ -1,17 +1,46 @@
-from typing import List, Dict, Any
+import heapq
+import io
+import os
+from typing import List, Dict, Any, Optional
 from datetime import datetime
 
-try:
-    from report_generator_agent import MobileMarketReportGenerator as _OrigReportGen  # type: ignore
-except Exception:
-    _OrigReportGen = None
+from competitive_intel.classification.aggregator import ClassificationAggregator
+from competitive_intel.trends.charts import shared_renderer
+
+_OrigReportGen = None
+if os.environ.get("CI_USE_ORIGINAL_REPORTS") == "1":
+    try:
+        from report_generator_agent import MobileMarketReportGenerator as _OrigReportGen  # type: ignore
+    except Exception:
+        _OrigReportGen = None
+
+
+def _trend_delta_lines(deltas: Optional[Dict[str, Any]]) -> List[str]:
+    """One line per brand and change type, e.g. "Samsung - new: AI Integration in Mobile Devices"."""
+    if not deltas or not deltas.get('baseline_date'):
+        return []
+    lines = []
+    for brand, changes in sorted((deltas.get('brands') or {}).items()):
+        for status in ("new", "strengthening", "weakening", "disappeared"):
+            if changes.get(status):
+                lines.append(f"{brand} - {status}: {', '.join(changes[status])}")
+    return lines or ["No material changes"]
+
+
+def _trend_chart_png(daily_brief: Optional[Dict[str, Any]], timeout: float = 10.0) -> Optional[bytes]:
+    """The trend dashboard the pipeline queued for this brief, from the shared chart cache."""
+    key = (daily_brief or {}).get('trend_chart')
+    return shared_renderer().get(key, 'png', timeout=timeout) if key else None
 
 
 class ReportGeneratorInterface:
     def __init__(self) -> None:
         self.agent = _OrigReportGen() if _OrigReportGen else None
 
-    def generate_daily(self, events: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def generate_daily(self, events: List[Dict[str, Any]], aggregator: Optional[ClassificationAggregator] = None,
+                       trend_deltas: Optional[Dict[str, Any]] = None,
+                       trend_chart: Optional[str] = None) -> Dict[str, Any]:
+        """Daily brief over `events`; `aggregator`, when given, must have counted the same events."""
         if self.agent:
             # Minimal transform: the original expects dataclasses; we will pass an empty list
             # and instead synthesize a summary from our events for display.
@@ -19,29 +48,24 @@ class ReportGeneratorInterface:
         else:
             brief = {"report_type": "Daily Brief"}
 
-        # Build a lightweight summary from our event dicts for UI
+        # Summary counts come from the streaming aggregator (built here in one
+        # pass when the caller did not keep one while producing the events)
+        agg = aggregator if aggregator is not None else ClassificationAggregator.from_events(events)
         today = datetime.now().date()
-        def _to_dt(x):
-            if isinstance(x, datetime):
-                return x
-            if isinstance(x, str):
-                try:
-                    return datetime.fromisoformat(x.replace('Z',''))
-                except Exception:
-                    return datetime.now()
-            return datetime.now()
-
-        today_events = [e for e in events if _to_dt(e.get('date')).date() == today]
-        critical = [e for e in events if str(e.get('urgency','')).lower() in ("immediate","critical","high")]
+        critical_levels = ("immediate", "critical", "high")
+        # Highest-impact critical events of the population the summary counts
+        critical = heapq.nlargest(10, (e for e in events if str(e.get('urgency','')).lower() in critical_levels),
+                                  key=lambda e: e.get('impact') or 0.0)
 
         brief.update({
             "date": today.isoformat(),
             "summary": {
-                "total_events": len(events),
-                "today_events": len(today_events),
-                "critical_or_high": len(critical),
-                "companies_mentioned": sorted(list({e.get('competitor','Unknown') for e in events}))
+                "total_events": agg.total,
+                "today_events": agg.count_on(today),
+                "critical_or_high": agg.count_urgency(critical_levels),
+                "companies_mentioned": sorted(agg.competitors)
             },
+            "classification": agg.report(),
             "critical_events": [
                 {
                     "title": (e.get('description') or '')[:80],
@@ -50,9 +74,15 @@ class ReportGeneratorInterface:
                     "impact": e.get('impact', 0.0),
                     "urgency": e.get('urgency','')
                 }
-                for e in critical[:10]
+                for e in critical
             ]
         })
+        # Week-over-week trend changes from the snapshot store (no re-analysis of raw events)
+        if trend_deltas is not None:
+            brief["trend_deltas"] = trend_deltas
+        # Cache key of the trend dashboard rendered in the background (see trends/charts.py)
+        if trend_chart:
+            brief["trend_chart"] = trend_chart
 
         return brief
 
@@ -133,6 +163,22 @@ class ReportGeneratorInterface:
             for ev in daily_brief.get('critical_events', [])[:10]:
                 write_line(f"- [{ev.get('urgency','')}] {ev.get('competitor','')}: {ev.get('title','')}")
 
+            delta_lines = _trend_delta_lines(daily_brief.get('trend_deltas'))
+            if delta_lines:
+                _hr()
+                pdf.set_font("Helvetica", style="B", size=12)
+                write_line(f"Trend Changes since {daily_brief['trend_deltas']['baseline_date']}")
+                pdf.set_font("Helvetica", size=11)
+                for line in delta_lines:
+                    write_line(f"- {line}")
+
+            chart = _trend_chart_png(daily_brief)
+            if chart:
+                _hr()
+                pdf.set_font("Helvetica", style="B", size=12)
+                write_line("Trend Dashboard")
+                pdf.image(io.BytesIO(chart), w=pdf.w - pdf.l_margin - pdf.r_margin)
+
             try:
                 out = pdf.output(dest='S')
                 # fpdf2 may return str or bytearray depending on version; normalize to bytes
@@ -158,6 +204,11 @@ class ReportGeneratorInterface:
         lines.append("Critical/High Events:")
         for ev in daily_brief.get('critical_events', [])[:10]:
             lines.append(f"• [{ev.get('urgency','')}] {ev.get('competitor','')}: {ev.get('title','')}")
+        delta_lines = _trend_delta_lines(daily_brief.get('trend_deltas'))
+        if delta_lines:
+            lines.append("")
+            lines.append(f"Trend Changes since {daily_brief['trend_deltas']['baseline_date']}:")
+            lines.extend(f"• {line}" for line in delta_lines)
         return ("\n".join(lines)).encode('utf-8')
 
     def export_actions_pdf(self, final_events: List[Dict[str, Any]], filename: str = None) -> str | bytes:
@@ -348,6 +399,19 @@ class ReportGeneratorInterface:
                 _mcell(f"- [{ev.get('urgency','')}] {ev.get('competitor','')}: {ev.get('title','')}")
             pdf.ln(2)
 
+            delta_lines = _trend_delta_lines((daily_brief or {}).get('trend_deltas'))
+            if delta_lines:
+                _section(f"Trend Changes since {daily_brief['trend_deltas']['baseline_date']}")
+                for line in delta_lines:
+                    _mcell(f"- {line}")
+                pdf.ln(2)
+
+            chart = _trend_chart_png(daily_brief)
+            if chart:
+                _section("Trend Dashboard")
+                pdf.image(io.BytesIO(chart), w=_usable_w())
+                pdf.ln(2)
+
             # Strategy (first part)
             if plan:
                 _section("Executive Summary")
@@ -394,6 +458,11 @@ class ReportGeneratorInterface:
         for ev in (daily_brief or {}).get('critical_events', [])[:10]:
             lines.append(f"- [{ev.get('urgency','')}] {ev.get('competitor','')}: {ev.get('title','')}")
         lines.append("")
+        delta_lines = _trend_delta_lines((daily_brief or {}).get('trend_deltas'))
+        if delta_lines:
+            lines.append(f"Trend Changes since {daily_brief['trend_deltas']['baseline_date']}:")
+            lines.extend(f"- {line}" for line in delta_lines)
+            lines.append("")
         if plan:
             lines.append("Executive Summary:")
             lines.append(plan.get('executive_summary',''))
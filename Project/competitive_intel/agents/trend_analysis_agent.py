@@ -25,7 +25,8 @@ class TrendAnalysisInterface:
                 insights.append({'title': 'Event type distribution', 'type': 'summary', 'significance': 'Medium', 'confidence': 0.7, 'data': dict(et_counts)})
                 insights.append({'title': 'Top event types', 'type': 'summary', 'significance': 'Medium', 'confidence': 0.7, 'data': dict(top)})
             if comp_counts:
-                insights.append({'title': 'Most active competitors', 'type': 'summary', 'significance': 'Medium', 'confidence': 0.7, 'data': dict(comp_counts.most_common(5))})
+                insights.append({'title': 'Most active competitors', 'type': 'summary', 'significance': 'Medium', 'confidence': 0.7, 'data': dict(comp_counts.most_common(5)),
+                                 'brand_counts': dict(comp_counts)})
             return insights
         return self.agent.analyze_mobile_trends(classified_events, time_window_days=120)
 
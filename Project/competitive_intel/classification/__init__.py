@@ -0,0 +1,15 @@
+"""Classification helpers shared by the event classification agent."""
+
+from .aggregator import ClassificationAggregator
+from .cascade import CascadeConfig, LLMEscalator, needs_escalation, run_cascade
+from .labels import canonical_label, event_labels
+
+__all__ = [
+    "ClassificationAggregator",
+    "CascadeConfig",
+    "LLMEscalator",
+    "needs_escalation",
+    "run_cascade",
+    "canonical_label",
+    "event_labels",
+]
@@ -0,0 +1,177 @@
+"""Streaming, mergeable aggregation of classification results.
+
+Counters are updated as each result is produced, so the report at the end of
+a run is read from the counters instead of re-scanning every result.
+Aggregators built on separate shards or processes combine with `merge`
+(or `+=`); `to_dict`/`from_dict` give a JSON-safe form to ship between them.
+"""
+
+from __future__ import annotations
+
+from collections import Counter, defaultdict
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+HIGH_CONFIDENCE = 0.7
+HISTOGRAM_BINS = 10
+
+
+def _day_key(value: Any) -> str:
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, str) and value:
+        try:
+            return datetime.fromisoformat(value.replace('Z', '')).date().isoformat()
+        except ValueError:
+            pass
+    return "unknown"
+
+
+class ClassificationAggregator:
+    """Incremental counts over classified (and optionally scored) events."""
+
+    def __init__(self) -> None:
+        self.total = 0
+        self.high_confidence = 0
+        self.event_types: Counter = Counter()
+        self.labels: Counter = Counter()
+        self.confidence_sum: Dict[str, float] = defaultdict(float)
+        self.histogram: List[int] = [0] * HISTOGRAM_BINS
+        self.companies: Counter = Counter()
+        self.competitors: Counter = Counter()
+        self.entities: Dict[str, Counter] = defaultdict(Counter)
+        self.urgency: Counter = Counter()
+        self.days: Counter = Counter()
+
+    # ---- Updates ----
+    def add(self, event_type: str, confidence: float,
+            entities: Optional[Dict[str, List[str]]] = None,
+            labels: Optional[Iterable[str]] = None,
+            competitor: Optional[str] = None,
+            urgency: Optional[str] = None,
+            when: Any = None) -> None:
+        et = str(event_type or 'unknown')
+        conf = min(1.0, max(0.0, float(confidence or 0.0)))
+        self.total += 1
+        self.event_types[et] += 1
+        self.confidence_sum[et] += conf
+        self.histogram[min(HISTOGRAM_BINS - 1, int(conf * HISTOGRAM_BINS))] += 1
+        if conf >= HIGH_CONFIDENCE:
+            self.high_confidence += 1
+        for label in (labels or [et]):
+            self.labels[str(label)] += 1
+        for kind, values in (entities or {}).items():
+            for v in values or []:
+                self.entities[kind][v] += 1
+        self.companies.update((entities or {}).get('companies') or ([competitor] if competitor else []))
+        if competitor:
+            self.competitors[competitor] += 1
+        if urgency:
+            self.urgency[str(urgency).lower()] += 1
+        if when is not None:
+            self.days[_day_key(when)] += 1
+
+    def add_result(self, result: Any) -> None:
+        """Add a `ClassificationResult` from the original classifier."""
+        et = getattr(result.event_type, 'value', result.event_type)
+        labels = [getattr(l, 'value', l) for l in (getattr(result, 'labels', None) or [])]
+        self.add(et, result.confidence_score, result.extracted_entities, labels or None)
+
+    def add_event(self, ev: Dict[str, Any]) -> None:
+        """Add a classified/scored event dict as produced by the pipeline."""
+        self.add(
+            ev.get('event_type'),
+            ev.get('confidence', 0.0),
+            ev.get('entities') if isinstance(ev.get('entities'), dict) else None,
+            ev.get('labels'),
+            ev.get('competitor'),
+            ev.get('urgency'),
+            ev.get('date'),
+        )
+
+    @classmethod
+    def from_events(cls, events: Iterable[Dict[str, Any]]) -> "ClassificationAggregator":
+        agg = cls()
+        for ev in events:
+            agg.add_event(ev)
+        return agg
+
+    # ---- Merging ----
+    def merge(self, other: "ClassificationAggregator") -> "ClassificationAggregator":
+        self.total += other.total
+        self.high_confidence += other.high_confidence
+        self.event_types.update(other.event_types)
+        self.labels.update(other.labels)
+        for et, s in other.confidence_sum.items():
+            self.confidence_sum[et] += s
+        self.histogram = [a + b for a, b in zip(self.histogram, other.histogram)]
+        self.companies.update(other.companies)
+        self.competitors.update(other.competitors)
+        for kind, counts in other.entities.items():
+            self.entities[kind].update(counts)
+        self.urgency.update(other.urgency)
+        self.days.update(other.days)
+        return self
+
+    def __iadd__(self, other: "ClassificationAggregator") -> "ClassificationAggregator":
+        return self.merge(other)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'total': self.total,
+            'high_confidence': self.high_confidence,
+            'event_types': dict(self.event_types),
+            'labels': dict(self.labels),
+            'confidence_sum': dict(self.confidence_sum),
+            'histogram': list(self.histogram),
+            'companies': dict(self.companies),
+            'competitors': dict(self.competitors),
+            'entities': {k: dict(v) for k, v in self.entities.items()},
+            'urgency': dict(self.urgency),
+            'days': dict(self.days),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ClassificationAggregator":
+        agg = cls()
+        agg.total = int(data.get('total', 0))
+        agg.high_confidence = int(data.get('high_confidence', 0))
+        agg.event_types.update(data.get('event_types', {}))
+        agg.labels.update(data.get('labels', {}))
+        for et, s in data.get('confidence_sum', {}).items():
+            agg.confidence_sum[et] += float(s)
+        agg.histogram = [int(x) for x in data.get('histogram', agg.histogram)]
+        agg.companies.update(data.get('companies', {}))
+        agg.competitors.update(data.get('competitors', {}))
+        for kind, counts in data.get('entities', {}).items():
+            agg.entities[kind].update(counts)
+        agg.urgency.update(data.get('urgency', {}))
+        agg.days.update(data.get('days', {}))
+        return agg
+
+    # ---- Reads ----
+    def count_on(self, day: date) -> int:
+        return self.days.get(day.isoformat(), 0)
+
+    def count_urgency(self, levels: Iterable[str]) -> int:
+        return sum(self.urgency.get(u, 0) for u in levels)
+
+    def report(self, top_n: int = 5) -> Dict[str, Any]:
+        """Summary report; cost depends on distinct keys, not on events seen."""
+        width = 1.0 / HISTOGRAM_BINS
+        return {
+            "total_events": self.total,
+            "event_distribution": dict(self.event_types),
+            "label_distribution": dict(self.labels),
+            "average_confidence_by_type": {et: self.confidence_sum[et] / n for et, n in self.event_types.items()},
+            "confidence_histogram": {
+                f"{i * width:.1f}-{(i + 1) * width:.1f}": n for i, n in enumerate(self.histogram)
+            },
+            "top_mentioned_companies": dict(self.companies.most_common(top_n)),
+            "entity_frequencies": {kind: dict(c.most_common(top_n)) for kind, c in self.entities.items()},
+            "urgency_distribution": dict(self.urgency),
+            "high_confidence_events": self.high_confidence,
+            "classification_accuracy_estimate": self.high_confidence / self.total if self.total else 0,
+        }
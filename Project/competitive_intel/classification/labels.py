@@ -0,0 +1,34 @@
+"""Event label helpers shared by classification, threat summaries and scoring."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+# The original classifier and the LLM do not always agree on spelling.
+_LABEL_ALIASES = {
+    "pricing_changes": "pricing_change",
+    "pricing": "pricing_change",
+    "launch": "product_launch",
+    "marketing": "marketing_campaign",
+    "carrier_deal": "partnership",
+    "other": "unknown",
+}
+
+
+def canonical_label(label: Any) -> str:
+    s = str(label or "unknown").strip().lower().replace(" ", "_").replace("-", "_")
+    return _LABEL_ALIASES.get(s, s)
+
+
+def event_labels(event: Dict[str, Any]) -> List[str]:
+    """Canonical labels of a classified event, primary label first.
+
+    Falls back to `event_type` for events classified without labels.
+    """
+    raw = event.get("labels") or [event.get("event_type")]
+    out: List[str] = []
+    for label in raw:
+        c = canonical_label(label)
+        if c not in out:
+            out.append(c)
+    return out
@@ -0,0 +1,73 @@
+"""Per-language keyword packs for the rule-based classifier and retrieval.
+
+Each pack mirrors the English fallback labels. Packs are compiled into the
+same `KeywordMatcher` as the English rules (one group per label and
+language), so a text is still scanned once whatever its language.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+LANGUAGE_PACKS: Dict[str, Dict[str, List[str]]] = {
+    "ar": {
+        "product_launch": ["تطلق", "إطلاق", "اطلاق", "تكشف", "تعلن", "الإعلان عن", "الرائد", "طلب مسبق", "الحجز المسبق", "متوفر"],
+        "pricing_change": ["سعر", "أسعار", "خصم", "تخفيض", "عرض", "عروض"],
+        "marketing_campaign": ["حملة", "تسويق", "تسويقية", "مؤثرين", "ترويج"],
+        "expansion": ["توسع", "تتوسع", "افتتاح", "متجر", "فرع", "دخول السوق", "التجزئة"],
+        "partnership": ["شراكة", "شريك", "مشغل", "اتفاقية", "تحالف", "تعاون"],
+    },
+    "hi": {
+        "product_launch": ["लॉन्च", "पेश", "अनावरण", "घोषणा", "प्री-ऑर्डर", "फ्लैगशिप", "उपलब्ध"],
+        "pricing_change": ["कीमत", "दाम", "छूट", "डिस्काउंट", "ऑफर", "कटौती", "सस्ता"],
+        "marketing_campaign": ["अभियान", "विज्ञापन", "मार्केटिंग", "प्रचार", "इन्फ्लुएंसर"],
+        "expansion": ["विस्तार", "स्टोर", "रिटेल", "बाजार में प्रवेश", "शोरूम"],
+        "partnership": ["साझेदारी", "पार्टनर", "ऑपरेटर", "समझौता", "गठजोड़", "सहयोग"],
+    },
+    "zh": {
+        "product_launch": ["发布", "推出", "亮相", "首发", "预售", "预订", "旗舰", "上市", "开售"],
+        "pricing_change": ["价格", "降价", "优惠", "折扣", "补贴", "售价", "直降"],
+        "marketing_campaign": ["营销", "广告", "宣传", "推广", "代言"],
+        "expansion": ["扩张", "进军", "开设", "门店", "零售", "拓展"],
+        "partnership": ["合作", "伙伴", "运营商", "联盟", "签约"],
+    },
+}
+
+# Device/industry terms used by retrieval to keep native-language articles on topic
+MOBILE_TERMS: Dict[str, List[str]] = {
+    "ar": ["هاتف", "هواتف", "جوال", "ذكي", "كاميرا", "بطارية", "معالج", "الجيل الخامس", "ذكاء اصطناعي"],
+    "hi": ["फोन", "फ़ोन", "स्मार्टफोन", "मोबाइल", "कैमरा", "बैटरी", "प्रोसेसर", "5जी", "एआई"],
+    "zh": ["手机", "智能手机", "相机", "影像", "电池", "芯片", "处理器", "人工智能"],
+}
+
+# Native spellings of tracked brands
+BRAND_NAMES: Dict[str, Dict[str, List[str]]] = {
+    "ar": {"Apple": ["أبل", "آبل"], "Samsung": ["سامسونج", "سامسونغ"], "Xiaomi": ["شاومي"],
+           "OPPO": ["أوبو"], "vivo": ["فيفو"], "Huawei": ["هواوي"]},
+    "hi": {"Apple": ["एप्पल", "ऐपल"], "Samsung": ["सैमसंग"], "Xiaomi": ["शाओमी"],
+           "OPPO": ["ओप्पो"], "vivo": ["वीवो"], "Huawei": ["हुआवेई"]},
+    "zh": {"Apple": ["苹果"], "Samsung": ["三星"], "Xiaomi": ["小米"],
+           "OPPO": ["欧珀"], "vivo": ["维沃"], "Huawei": ["华为"]},
+}
+
+
+def pack_group(label: str, lang: str) -> str:
+    """Matcher group name of a label's keywords in a language pack."""
+    return f"{label}@{lang}"
+
+
+def multilingual_groups(rules: Iterable[Tuple[str, Sequence[str]]]) -> Dict[str, List[str]]:
+    """English (label, keywords) rules plus every pack, as matcher groups."""
+    groups = {label: list(kws) for label, kws in rules}
+    for lang, pack in LANGUAGE_PACKS.items():
+        for label, kws in pack.items():
+            groups[pack_group(label, lang)] = list(kws)
+    return groups
+
+
+def label_scores(group_scores: Dict[str, float], labels: Iterable[str], lang: str) -> Dict[str, float]:
+    """Per-label score: the English rule's, or the language pack's when higher."""
+    return {
+        label: max(group_scores.get(label, 0.0), group_scores.get(pack_group(label, lang), 0.0))
+        for label in labels
+    }
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+import os
+import sqlite3
+from datetime import date
+from typing import Any, Dict, List, Optional
 
 try:
     from langgraph.graph import StateGraph, END
@@ -15,6 +18,71 @@ from .agents.impact_scoring_agent import ImpactScoringInterface
 from .agents.strategic_analyst_agent import StrategicAnalystInterface
 from .agents.action_recommender_agent import ActionRecommenderInterface
 from .agents.report_generator_agent import ReportGeneratorInterface
+from .classification.aggregator import ClassificationAggregator
+from .classification.labels import event_labels
+from .scoring.selection import select_for_analysis
+from .trends.bursts import BurstConfig, shared_detector
+from .trends.charts import shared_renderer
+from .trends.snapshots import DEFAULT_SNAPSHOT_PATH, shared_snapshot_store
+from .utils.common import generate_demo_items
+from .utils.event_store import NormalizedEventStore
+
+
+def _summarize_threats(evts: List[Dict[str, Any]]) -> List[str]:
+    """Threat lines from each event's classification labels."""
+    out_th = []
+    for e in evts:
+        comp = e.get('competitor','')
+        labels = event_labels(e)
+        if 'pricing_change' in labels:
+            out_th.append(f"Pricing pressure from {comp}")
+        if 'product_launch' in labels:
+            out_th.append(f"Flagship launch momentum by {comp}")
+        if 'partnership' in labels:
+            out_th.append(f"Operator/retail visibility shift toward {comp}")
+    return list(dict.fromkeys(out_th))[:6]
+
+
+def _burst_detector(config: Dict[str, Any]):
+    """Process-wide burst detector for this config (None when disabled)."""
+    cfg = config or {}
+    if not cfg.get("burst_detection", True):
+        return None
+    return shared_detector(BurstConfig.from_config(cfg))
+
+
+def _new_bursts(scored: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [ev['burst'] for ev in scored if (ev.get('burst') or {}).get('new')]
+
+
+def _trend_deltas(config: Dict[str, Any], insights: List[Any]) -> Optional[Dict[str, Any]]:
+    """Save today's trend snapshot and diff it against last week's (None unless enabled).
+
+    Opt-in: `config["trend_snapshots"]` (a path, or True for DEFAULT_SNAPSHOT_PATH)
+    or the CI_TREND_SNAPSHOTS environment variable names the SQLite file.
+    """
+    cfg = config or {}
+    path = cfg.get("trend_snapshots", os.environ.get("CI_TREND_SNAPSHOTS"))
+    if not path:
+        return None
+    if path is True:
+        path = DEFAULT_SNAPSHOT_PATH
+    try:
+        store = shared_snapshot_store(path)
+        today = date.today()
+        store.save(insights, today)
+        return store.delta_report(today, days=int(cfg.get("trend_delta_days", 7) or 7),
+                                  min_change=float(cfg.get("trend_delta_min_change", 0.2)))
+    except sqlite3.Error:
+        return None
+
+
+def _trend_chart(config: Dict[str, Any], insights: List[Any]) -> Optional[str]:
+    """Queue the trend dashboard render in the background; returns its cache key."""
+    if not insights or not (config or {}).get("trend_charts", True):
+        return None
+    key, _ = shared_renderer().submit(insights, "png")
+    return key
 
 
 def build_langgraph_pipeline() -> Any:
@@ -49,8 +117,6 @@ def build_langgraph_pipeline() -> Any:
         raw_items = data.get('clean') or data.get('raw') or []
         # Fallback demo data if retrieval produced nothing (e.g., offline or missing deps)
         if not raw_items:
-            from datetime import datetime, timedelta
-            now = datetime.now()
             comp_list = list(state.get('competitors', {}).keys()) or [
                 "Samsung","Apple","Xiaomi","OPPO","vivo","Huawei","Google","OnePlus","Nothing"
             ]
@@ -58,40 +124,22 @@ def build_langgraph_pipeline() -> Any:
             cfg = state.get('config', {}) or {}
             max_items = int(cfg.get("max_articles_per_company", 10) or 10)
             days = int(cfg.get("search_timeframe_days", 7) or 7)
-            templates = [
-                ("product_launch", "launch", "announces new flagship with AI camera and 5G"),
-                ("pricing_change", "pricing", "introduces price cuts across key models"),
-                ("partnership", "partnership", "signs operator partnership in {region}"),
-                ("marketing_campaign", "marketing", "launches regional marketing push focusing on camera"),
-                ("expansion", "expansion", "expands retail footprint in {region}")
-            ]
-            raw_items = []
-            idx = 0
-            for comp in comp_list:
-                for i in range(max_items):
-                    region = reg_list[(idx + i) % len(reg_list)]
-                    t = templates[(idx + i) % len(templates)]
-                    age_hours = min(days*24 - 1, (idx + i) * 6)
-                    if age_hours < 0:
-                        age_hours = 0
-                    title = f"{comp} {t[1].replace('_',' ')} in {region}"
-                    summary = t[2].format(region=region)
-                    raw_items.append({
-                        'title': title,
-                        'summary': summary,
-                        'company': comp,
-                        'region': region,
-                        'published': (now - timedelta(hours=age_hours)).isoformat(),
-                        'source': f"{comp} News",
-                        'link': f"https://example.com/{comp.lower()}-{t[0]}-{region.lower()}"
-                    })
-                idx += 1
+            raw_items = generate_demo_items(comp_list, reg_list, max_items, days, spikes=cfg.get("demo_spikes"))
         state['raw'] = raw_items
         return state
 
+    def n_normalize(state: State) -> State:
+        # Canonicalize competitor, date, id and source once for all later stages
+        store = NormalizedEventStore()
+        store.ingest(state.get('raw', []))
+        state['store'] = store
+        return state
+
     def n_classify(state: State) -> State:
         agents = _ensure_agents(state)
-        state['classified'] = agents['classify'].classify_items(state.get('raw', []))
+        store = state.get('store') or NormalizedEventStore()
+        state['classified'] = agents['classify'].classify_items(store.records(), config=state.get('config', {}))
+        state['classification_metrics'] = getattr(agents['classify'], 'last_metrics', {})
         for ev in state.get('classified', []):
             ev.setdefault('event_type', 'unknown')
             ev.setdefault('competitor', 'Unknown')
@@ -101,29 +149,27 @@ def build_langgraph_pipeline() -> Any:
     def n_trends(state: State) -> State:
         agents = _ensure_agents(state)
         state['trends'] = agents['trends'].analyze(state.get('classified', []))
+        state['trend_deltas'] = _trend_deltas(state.get('config', {}), state['trends'])
+        state['trend_chart'] = _trend_chart(state.get('config', {}), state['trends'])
         return state
 
     def n_score(state: State) -> State:
         agents = _ensure_agents(state)
-        # normalize dates
-        from datetime import datetime
-        for ev in state.get('classified', []):
-            dt = ev.get('date')
-            if isinstance(dt, str):
-                try:
-                    ev['date'] = datetime.fromisoformat(dt.replace('Z',''))
-                except Exception:
-                    ev['date'] = datetime.now()
-            elif not isinstance(dt, datetime):
-                ev['date'] = datetime.now()
-        state['scored'] = agents['scorer'].score_events(state.get('classified', []))
+        # Dates were coerced to datetime by the normalize stage
+        state['aggregator'] = ClassificationAggregator()
+        state['scored'] = agents['scorer'].score_events(state.get('classified', []), store=state.get('store'),
+                                                        aggregator=state['aggregator'],
+                                                        bursts=_burst_detector(state.get('config', {})))
+        state['bursts'] = _new_bursts(state['scored'])
+        state['scoring_metrics'] = getattr(agents['scorer'], 'last_metrics', {})
         return state
 
     def n_analyze(state: State) -> State:
         agents = _ensure_agents(state)
         results: List[Dict[str, Any]] = []
         import asyncio
-        for ev in state.get('scored', [])[:10]:
+        # Highest impact/urgency/recency first, capped per competitor (analyst_top_k, analyst_per_competitor)
+        for ev in select_for_analysis(state.get('scored', []), state.get('config', {})):
             analyze_func = agents['analyst'].analyze
             if asyncio.iscoroutinefunction(analyze_func):
                 try:
@@ -164,19 +210,6 @@ def build_langgraph_pipeline() -> Any:
         combined_contexts = [(ev.get('strategic') or {}).get('strategic_context','') for ev in state.get('strategic', []) if (ev.get('strategic') or {}).get('strategic_context')]
         combined_context = ". ".join([c.strip().rstrip('.') for c in combined_contexts])
 
-        def _summarize_threats(evts: List[Dict[str, Any]]) -> List[str]:
-            out_th = []
-            for e in evts:
-                comp = e.get('competitor','')
-                et   = e.get('event_type','')
-                if 'pricing' in str(et).lower():
-                    out_th.append(f"Pricing pressure from {comp}")
-                if 'launch' in str(et).lower():
-                    out_th.append(f"Flagship launch momentum by {comp}")
-                if 'partnership' in str(et).lower() or 'operator' in (e.get('description','').lower()):
-                    out_th.append(f"Operator/retail visibility shift toward {comp}")
-            return list(dict.fromkeys(out_th))[:6]
-
         def _pillars() -> List[str]:
             return [
                 "Defend value with selective promos and clear superiority claims",
@@ -224,11 +257,15 @@ def build_langgraph_pipeline() -> Any:
 
     def n_report(state: State) -> State:
         agents = _ensure_agents(state)
-        state['daily_report'] = agents['reports'].generate_daily(state.get('final', []))
+        # The aggregator counted every scored event, so the brief lists critical events from the same set
+        state['daily_report'] = agents['reports'].generate_daily(state.get('scored', []), aggregator=state.get('aggregator'),
+                                                                 trend_deltas=state.get('trend_deltas'),
+                                                                 trend_chart=state.get('trend_chart'))
         return state
 
     # Register nodes
     sg.add_node('retrieve', n_retrieve)
+    sg.add_node('normalize', n_normalize)
     sg.add_node('classify', n_classify)
     sg.add_node('trends', n_trends)
     sg.add_node('score', n_score)
@@ -297,7 +334,8 @@ def build_langgraph_pipeline() -> Any:
 
     # Edges
     sg.set_entry_point('retrieve')
-    sg.add_edge('retrieve', 'classify')
+    sg.add_edge('retrieve', 'normalize')
+    sg.add_edge('normalize', 'classify')
     sg.add_edge('classify', 'trends')
     sg.add_edge('trends', 'score')
     sg.add_edge('score', 'analyze')
@@ -342,64 +380,30 @@ def run_with_langgraph(competitors: Dict[str, Any], regions: List[str], config:
         fetched = retrieve.run(competitors, regions, config)
         raw_items = (fetched.get("clean") or fetched.get("raw") or [])
         if not raw_items:
-            from datetime import datetime, timedelta
-            now = datetime.now()
             comp_list = list(competitors.keys()) or ["Samsung","Apple","Xiaomi","OPPO","vivo","Huawei","Google","OnePlus","Nothing"]
             reg_list = regions or ["US","EU","KSA","UAE","IN"]
             max_items = int(config.get("max_articles_per_company", 10) or 10)
             days = int(config.get("search_timeframe_days", 7) or 7)
-            templates = [
-                ("product_launch", "launch", "announces new flagship with AI camera and 5G"),
-                ("pricing_change", "pricing", "introduces price cuts across key models"),
-                ("partnership", "partnership", "signs operator partnership in {region}"),
-                ("marketing_campaign", "marketing", "launches regional marketing push focusing on camera"),
-                ("expansion", "expansion", "expands retail footprint in {region}")
-            ]
-            raw_items = []
-            idx = 0
-            for comp in comp_list:
-                for i in range(max_items):
-                    region = reg_list[(idx + i) % len(reg_list)]
-                    t = templates[(idx + i) % len(templates)]
-                    age_hours = min(days*24 - 1, (idx + i) * 6)
-                    if age_hours < 0: age_hours = 0
-                    title = f"{comp} {t[1].replace('_',' ')} in {region}"
-                    summary = t[2].format(region=region)
-                    raw_items.append({
-                        'title': title,
-                        'summary': summary,
-                        'company': comp,
-                        'region': region,
-                        'published': (now - timedelta(hours=age_hours)).isoformat(),
-                        'source': f"{comp} News",
-                        'link': f"https://example.com/{comp.lower()}-{t[0]}-{region.lower()}"
-                    })
-                idx += 1
-
-        classified = classify.classify_items(raw_items)
+            raw_items = generate_demo_items(comp_list, reg_list, max_items, days, spikes=config.get("demo_spikes"))
+
+        store = NormalizedEventStore()
+        store.ingest(raw_items)
+        classified = classify.classify_items(store.records(), config=config)
         for ev in classified:
             ev.setdefault('event_type', 'unknown')
             ev.setdefault('competitor', 'Unknown')
             ev.setdefault('description', '')
 
         trend_insights = trends.analyze(classified)
+        trend_deltas = _trend_deltas(config, trend_insights)
+        trend_chart = _trend_chart(config, trend_insights)
 
-        from datetime import datetime
-        for ev in classified:
-            dt = ev.get('date')
-            if isinstance(dt, str):
-                try:
-                    ev['date'] = datetime.fromisoformat(dt.replace('Z',''))
-                except Exception:
-                    ev['date'] = datetime.now()
-            elif not isinstance(dt, datetime):
-                ev['date'] = datetime.now()
-
-        scored = scorer.score_events(classified)
+        aggregator = ClassificationAggregator()
+        scored = scorer.score_events(classified, store=store, aggregator=aggregator, bursts=_burst_detector(config))
 
         # Run analyst synchronously
         strategic_results: List[Dict[str, Any]] = []
-        for ev in scored[:10]:
+        for ev in select_for_analysis(scored, config):
             try:
                 res = analyst.analyze(ev)
                 # If coroutine, run immediately
@@ -447,11 +451,7 @@ def run_with_langgraph(competitors: Dict[str, Any], regions: List[str], config:
                 "Strengthen after-sales and trade-in to reduce churn",
                 "Double down on regional hero SKUs aligned to price bands",
             ],
-            'threats': [t for t in (
-                (f"Pricing pressure from {ev.get('competitor','')}") if 'pricing' in str(ev.get('event_type','')).lower() else None,
-                (f"Flagship launch momentum by {ev.get('competitor','')}") if 'launch' in str(ev.get('event_type','')).lower() else None,
-                (f"Operator/retail visibility shift toward {ev.get('competitor','')}") if ('partnership' in str(ev.get('event_type','')).lower() or 'operator' in (ev.get('description','').lower())) else None,
-            ) if t]
+            'threats': _summarize_threats(scored),
         }
         aggregated = {
             'strategy_overview': combined_context[:1000],
@@ -471,16 +471,21 @@ def run_with_langgraph(competitors: Dict[str, Any], regions: List[str], config:
                 'risks': ['Margin compression', 'Channel conflicts']
             }
         }
-        daily = reports.generate_daily(final_with_actions)
+        daily = reports.generate_daily(scored, aggregator=aggregator, trend_deltas=trend_deltas,
+                                       trend_chart=trend_chart)
         return {
             'raw': raw_items,
             'classified': classified,
             'trends': trend_insights,
+            'trend_deltas': trend_deltas,
             'scored': scored,
+            'bursts': _new_bursts(scored),
             'strategic': strategic_results,
             'final': final_with_actions,
             'aggregated': aggregated,
             'daily_report': daily,
+            'classification_metrics': classify.last_metrics,
+            'scoring_metrics': scorer.last_metrics,
         }
 
     result = graph.invoke(state)
@@ -490,11 +495,15 @@ def run_with_langgraph(competitors: Dict[str, Any], regions: List[str], config:
         'raw': result.get('raw', []),
         'classified': result.get('classified', []),
         'trends': result.get('trends', []),
+        'trend_deltas': result.get('trend_deltas'),
         'scored': result.get('scored', []),
+        'bursts': result.get('bursts', []),
         'strategic': result.get('strategic', []),
         'final': result.get('final', []),
         'aggregated': result.get('aggregated', {}),
         'daily_report': result.get('daily_report', {}),
+        'classification_metrics': result.get('classification_metrics', {}),
+        'scoring_metrics': result.get('scoring_metrics', {}),
     }
     # If graph produced nothing, run the synchronous fallback
     if not out['raw'] and not out['classified'] and not out['final']:
@@ -0,0 +1,17 @@
+"""Impact scoring building blocks used by the impact scoring agent."""
+
+from .cache import CacheStats, ComponentCache, event_key, shared_component_cache
+from .columns import TimestampColumns, calendar_fields, encode, py_round, timestamp_columns
+from .features import FeatureSnapshot, FeatureTable
+from .industry_calendar import CalendarEntry, IndustryCalendar, shared_calendar
+from .rescoring import RescoringService, TrackedScore, UrgencyChange, shared_rescoring_service
+from .selection import SelectionConfig, TopK, priority_key, select_for_analysis, top_k
+
+__all__ = [
+    "CacheStats", "ComponentCache", "event_key", "shared_component_cache",
+    "TimestampColumns", "calendar_fields", "encode", "py_round", "timestamp_columns",
+    "FeatureSnapshot", "FeatureTable",
+    "CalendarEntry", "IndustryCalendar", "shared_calendar",
+    "RescoringService", "TrackedScore", "UrgencyChange", "shared_rescoring_service",
+    "SelectionConfig", "TopK", "priority_key", "select_for_analysis", "top_k",
+]
@@ -0,0 +1,117 @@
+"""Cache of the time-invariant parts of impact scores, keyed by event content.
+
+Re-crawled events come back with the same competitor, type, text, date,
+labels and region, and everything the scorer derives from them except recency
+stays the same: size and event-significance scores, reasoning inputs,
+timestamp and the business-hours and calendar timing terms. `ComponentCache`
+keeps those in an LRU keyed by the event's fields and the scorer's config
+version, so a changed profile, base score or calendar never reuses stale
+entries. Timing and the final score are recomputed from the cached parts at
+read time. `stats()` reports hits, misses and evictions.
+
+The date in the key must be stable across fetches: the pipeline passes the
+parsed date, or the raw string when it does not parse (scored with neutral
+timing, so still time-invariant). Signals with no date at all are timed at
+"now" and get no key.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+
+def event_key(competitor: Any, event_type: Any, text: Any, timestamp: Any, labels: Any = None,
+              region: Any = None) -> Optional[Hashable]:
+    """The signal fields the scorer reads, as a hashable key (None when a field is unhashable)."""
+    key = (competitor, event_type, text, timestamp, tuple(labels) if isinstance(labels, list) else labels, region)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {**asdict(self), 'hit_rate': round(self.hit_rate, 4)}
+
+
+class ComponentCache:
+    """Thread-safe LRU of per-event score components."""
+
+    def __init__(self, max_entries: int = 200_000) -> None:
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[Hashable, Hashable], Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+
+    def get_many(self, keys: Sequence[Optional[Hashable]], version: Hashable) -> List[Optional[Any]]:
+        """Cached value per key (None on a miss); None keys are skipped and not counted."""
+        out: List[Optional[Any]] = []
+        hits = misses = 0
+        with self._lock:
+            entries = self._entries
+            for key in keys:
+                if key is None:
+                    out.append(None)
+                    continue
+                value = entries.get((key, version))
+                if value is None:
+                    misses += 1
+                else:
+                    hits += 1
+                    entries.move_to_end((key, version))
+                out.append(value)
+            self._stats.hits += hits
+            self._stats.misses += misses
+        return out
+
+    def put_many(self, keys: Sequence[Hashable], version: Hashable, values: Sequence[Any]) -> None:
+        with self._lock:
+            entries = self._entries
+            for key, value in zip(keys, values):
+                entries[(key, version)] = value
+                entries.move_to_end((key, version))
+            evicted = max(0, len(entries) - self.max_entries)
+            for _ in range(evicted):
+                entries.popitem(last=False)
+            self._stats.evictions += evicted
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(self._stats.hits, self._stats.misses, self._stats.evictions, len(self._entries))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._stats = CacheStats()
+
+
+_shared: Optional[ComponentCache] = None
+_shared_lock = threading.Lock()
+
+
+def shared_component_cache() -> ComponentCache:
+    """Process-wide cache, so successive pipeline runs reuse components of re-crawled events."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = ComponentCache()
+        return _shared
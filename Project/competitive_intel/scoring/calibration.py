@@ -0,0 +1,282 @@
+"""Offline calibration of the impact scorer's weights against rated events.
+
+A labeled CSV holds past events with an analyst (or LLM) impact rating.
+The scorer's own `score_batch` supplies each row's component scores (size,
+event significance, timing) and primary event type. A least-squares fit of
+
+    rating ~ w_size * size + w_event * event + w_timing * timing + offset[event type]
+
+gives the component weights (kept non-negative) and, for event types with
+enough rows, a ridge-shrunk offset that is folded into the type's base score
+(`offset / w_event`). The weights file is versioned JSON that the scorer
+applies with `load_weights` and re-reads with `refresh_weights` when it
+changes. `CalibrationReport` compares the Spearman rank correlation of the
+current and calibrated scores with the ratings, on the fitted rows and on a
+held-out split.
+
+Usage: python -m competitive_intel.scoring.calibration labeled.csv --out impact_weights.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import datetime
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_WEIGHTS_PATH = "impact_weights.json"
+COMPONENTS = ("competitor_size", "event_significance", "timing")
+
+# First column present wins
+_COLUMNS = {
+    'rating': ('rating', 'impact_rating', 'human_rating', 'llm_rating', 'score'),
+    'competitor': ('competitor', 'brand'),
+    'event_type': ('event_type', 'type'),
+    'text': ('text', 'description', 'title'),
+    'timestamp': ('timestamp', 'date'),
+    'region': ('region',),
+    'labels': ('labels',),
+    'rated_at': ('rated_at',),
+}
+
+
+@dataclass
+class CalibratedWeights:
+    version: int
+    weights: Dict[str, float]
+    event_scores: Dict[str, float]  # event type value -> base score
+    created: str = ""
+    source: str = ""
+    metrics: Dict[str, Any] = field(default_factory=dict)
+    # Hand-set per-region overrides (region code -> component -> weight); kept across calibrations
+    region_weights: Dict[str, Dict[str, float]] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: str) -> "CalibratedWeights":
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        weights = {k: float(v) for k, v in (data.get('weights') or {}).items() if k in COMPONENTS}
+        if not weights:
+            raise ValueError(f"{path}: no component weights")
+        region_weights = {str(region): {k: float(v) for k, v in (w or {}).items() if k in COMPONENTS}
+                          for region, w in (data.get('region_weights') or {}).items()}
+        return cls(int(data.get('version', 0)), weights,
+                   {str(k): float(v) for k, v in (data.get('event_scores') or {}).items()},
+                   str(data.get('created', '')), str(data.get('source', '')), dict(data.get('metrics') or {}),
+                   {region: w for region, w in region_weights.items() if w})
+
+    def save(self, path: str = DEFAULT_WEIGHTS_PATH) -> int:
+        """Write as the next version of `path` (replaced atomically; its region weights are kept
+        unless this sets some); returns the version."""
+        try:
+            previous = CalibratedWeights.load(path)
+            self.version = previous.version + 1
+            self.region_weights = self.region_weights or previous.region_weights
+        except (OSError, ValueError):
+            self.version = max(self.version, 1)
+        self.created = self.created or datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds')
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(asdict(self), f, indent=2)
+        os.replace(tmp, path)
+        return self.version
+
+
+@dataclass
+class CalibrationReport:
+    rows: int
+    fitted_rows: int
+    holdout_rows: int
+    weights_before: Dict[str, float]
+    weights_after: Dict[str, float]
+    event_scores_changed: Dict[str, Tuple[float, float]]  # type -> (before, after)
+    spearman: Dict[str, Tuple[float, float]]              # split -> (before, after)
+
+    def render(self) -> str:
+        lines = [f"rows: {self.rows} (fitted {self.fitted_rows}, holdout {self.holdout_rows})",
+                 "weights:"]
+        for k in COMPONENTS:
+            lines.append(f"  {k:20s} {self.weights_before.get(k, 0.0):6.3f} -> {self.weights_after.get(k, 0.0):6.3f}")
+        if self.event_scores_changed:
+            lines.append("event base scores:")
+            for k, (a, b) in sorted(self.event_scores_changed.items()):
+                lines.append(f"  {k:20s} {a:6.2f} -> {b:6.2f}")
+        lines.append("spearman rank correlation with ratings (before -> after):")
+        for split, (a, b) in self.spearman.items():
+            lines.append(f"  {split:8s} {a:6.3f} -> {b:6.3f} ({b - a:+.3f})")
+        return "\n".join(lines)
+
+
+def _column(frame: pd.DataFrame, name: str, required: bool = True) -> Optional[pd.Series]:
+    for c in _COLUMNS[name]:
+        if c in frame.columns:
+            return frame[c]
+    if required:
+        raise ValueError(f"labeled data needs a {name!r} column (one of {', '.join(_COLUMNS[name])})")
+    return None
+
+
+def read_labeled(path: Union[str, pd.DataFrame], rating_max: float = 10.0) -> pd.DataFrame:
+    """Labeled events as columns competitor, event_type, text, timestamp, region, labels, rated_at, rating.
+
+    Ratings are rescaled from 0..`rating_max` to the scorer's 0..10; rows
+    without a numeric rating are dropped. `labels` may be a list or a string
+    separated by ";" or "|".
+    """
+    raw = pd.read_csv(path) if isinstance(path, str) else path
+    rating = pd.to_numeric(_column(raw, 'rating'), errors='coerce') * (10.0 / rating_max)
+    out = pd.DataFrame({
+        'competitor': _column(raw, 'competitor'),
+        'event_type': _column(raw, 'event_type'),
+        'text': _column(raw, 'text').fillna(""),
+        'timestamp': _column(raw, 'timestamp'),
+        'rating': rating,
+    })
+    for name in ('region', 'labels', 'rated_at'):
+        col = _column(raw, name, required=False)
+        out[name] = col if col is not None else None
+    out['labels'] = [v.replace("|", ";").split(";") if isinstance(v, str) else v if isinstance(v, list) else None
+                     for v in out['labels']]
+    return out[out['rating'].notna()].reset_index(drop=True)
+
+
+def _none(values: Sequence[Any]) -> List[Any]:
+    return [None if isinstance(v, float) and np.isnan(v) else v for v in values]
+
+
+def score_frame(scorer: Any, frame: pd.DataFrame, now: Optional[datetime.datetime] = None):
+    """`score_batch` over labeled rows, at each row's `rated_at` when given, else at `now`.
+
+    Returns (components (n, 3), primary event type codes, error mask, final scores).
+    """
+    n = len(frame)
+    comps = np.zeros((n, 3))
+    codes = np.zeros(n, dtype=np.int64)
+    error = np.zeros(n, dtype=bool)
+    final = np.zeros(n)
+    default = now or datetime.datetime.now(datetime.timezone.utc)
+    groups: Dict[datetime.datetime, List[int]] = {}
+    for i, t in enumerate(pd.to_datetime(frame['rated_at'], errors='coerce', utc=True)):
+        groups.setdefault(default if pd.isna(t) else t.to_pydatetime(), []).append(i)
+    for when, rows in groups.items():
+        part = frame.iloc[rows]
+        batch = scorer.score_batch(
+            _none(part['competitor'].tolist()), _none(part['event_type'].tolist()), part['text'].tolist(),
+            _none(part['timestamp'].tolist()), labels=part['labels'].tolist(), regions=_none(part['region'].tolist()),
+            now=when)
+        ex = batch.explanations
+        comps[rows] = np.column_stack([ex.size_score, ex.event_score, ex.timing_score])
+        codes[rows] = ex.event_types
+        error[rows] = ex.error
+        final[rows] = batch.final_score
+    return comps, codes, error, final
+
+
+def spearman(a: np.ndarray, b: np.ndarray) -> float:
+    if len(a) < 2:
+        return float('nan')
+    return float(pd.Series(a).rank().corr(pd.Series(b).rank()))
+
+
+def fit_weights(components: np.ndarray, codes: np.ndarray, ratings: np.ndarray, n_types: int,
+                ridge: float = 10.0, min_rows: int = 20) -> Tuple[np.ndarray, Dict[int, float]]:
+    """Least-squares component weights (non-negative) and per-type offsets for types with `min_rows` rows.
+
+    Each offset is shrunk as if its type had `ridge` more rows with no offset.
+    """
+    counts = np.bincount(codes, minlength=n_types)
+    kinds = np.flatnonzero(counts >= min_rows)
+    dummies = (codes[:, None] == kinds[None, :]).astype(np.float64)
+    active = list(range(components.shape[1]))
+    while True:
+        a = np.hstack([components[:, active], dummies])
+        # Ridge rows shrink the offsets only; the component weights are unpenalised
+        penalty = np.hstack([np.zeros((len(kinds), len(active))), np.sqrt(ridge) * np.eye(len(kinds))])
+        coef, *_ = np.linalg.lstsq(np.vstack([a, penalty]), np.concatenate([ratings, np.zeros(len(kinds))]), rcond=None)
+        w = coef[:len(active)]
+        if (w >= 0).all() or not active:
+            break
+        active.pop(int(np.argmin(w)))
+    weights = np.zeros(components.shape[1])
+    weights[active] = coef[:len(active)]
+    return weights, dict(zip(kinds.tolist(), coef[len(active):].tolist()))
+
+
+def calibrate(scorer: Any, frame: pd.DataFrame, holdout: float = 0.2, ridge: float = 10.0, min_rows: int = 20,
+              now: Optional[datetime.datetime] = None, seed: int = 0,
+              source: str = "") -> Tuple[CalibratedWeights, CalibrationReport]:
+    """Fit weights and event base scores for `scorer` on the labeled rows of `frame`."""
+    comps, codes, error, before = score_frame(scorer, frame, now)
+    ratings = frame['rating'].to_numpy(dtype=np.float64)
+    usable = np.flatnonzero(~error)
+    rng = np.random.default_rng(seed)
+    held = np.zeros(len(frame), dtype=bool)
+    held[rng.permutation(usable)[:int(len(usable) * holdout)]] = True
+    train = np.setdiff1d(usable, np.flatnonzero(held))
+    if len(train) < 3:
+        raise ValueError(f"need at least 3 scorable rated rows to calibrate, got {len(train)}")
+
+    # Primary-type codes index the scorer's event-type enum in definition order
+    event_types = list(type(next(iter(scorer.event_scores))))
+    w, offsets = fit_weights(comps[train], codes[train], ratings[train], len(event_types), ridge, min_rows)
+    weights = dict(zip(COMPONENTS, (round(float(x), 4) for x in w)))
+    event_scores = {}
+    changed = {}
+    for code, offset in offsets.items():
+        et = event_types[code]
+        old = float(scorer.event_scores.get(et, 5.0))
+        new = old if weights['event_significance'] <= 0 else \
+            round(min(10.0, max(0.0, old + offset / weights['event_significance'])), 2)
+        event_scores[et.value] = new
+        if new != old:
+            changed[et.value] = (old, new)
+
+    # Score with the candidate settings on a shallow copy (profiles and features are shared, unchanged)
+    candidate = copy.copy(scorer)
+    candidate.weights = {**scorer.weights, **weights}
+    candidate.event_scores = {**scorer.event_scores, **{et: event_scores[et.value] for et in event_types
+                                                        if et.value in event_scores}}
+    candidate.component_cache = None  # candidate components must not enter the shared cache
+    after = score_frame(candidate, frame, now)[3]
+    splits = {'fitted': train, 'holdout': np.flatnonzero(held)}
+    correlations = {name: (spearman(before[idx], ratings[idx]), spearman(after[idx], ratings[idx]))
+                    for name, idx in splits.items() if len(idx) >= 2}
+    metrics = {f"spearman_{name}": {'before': round(a, 4), 'after': round(b, 4)} for name, (a, b) in correlations.items()}
+    metrics['rows'] = int(len(train))
+    report = CalibrationReport(len(frame), int(len(train)), int(held.sum()), dict(scorer.weights), weights,
+                               changed, correlations)
+    return CalibratedWeights(0, weights, event_scores, source=source, metrics=metrics), report
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Calibrate impact scoring weights from rated events.")
+    parser.add_argument("csv", help="labeled events: competitor, event_type, description, date, rating")
+    parser.add_argument("--out", default=DEFAULT_WEIGHTS_PATH, help="weights file to write (next version)")
+    parser.add_argument("--rating-max", type=float, default=10.0, help="top of the rating scale")
+    parser.add_argument("--holdout", type=float, default=0.2, help="share of rows held out for the report")
+    parser.add_argument("--ridge", type=float, default=10.0, help="shrinkage of per-event-type offsets (pseudo-rows)")
+    parser.add_argument("--min-rows", type=int, default=20, help="rows an event type needs for its own base")
+    parser.add_argument("--as-of", help="scoring time for rows without rated_at (default: now)")
+    parser.add_argument("--dry-run", action="store_true", help="report only; do not write the weights file")
+    args = parser.parse_args(argv)
+
+    # The original scorer (repository root), as the pipeline loads it with CI_USE_ORIGINAL_IMPACT=1
+    from impact_scoring_agent import ImpactScoringAgent, default_mobile_competitors
+
+    scorer = ImpactScoringAgent(default_mobile_competitors())
+    now = datetime.datetime.fromisoformat(args.as_of) if args.as_of else None
+    frame = read_labeled(args.csv, args.rating_max)
+    weights, report = calibrate(scorer, frame, args.holdout, args.ridge, args.min_rows, now, source=args.csv)
+    print(report.render())
+    if not args.dry_run:
+        print(f"wrote {args.out} (version {weights.save(args.out)})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Column helpers for batch impact scoring.
+
+Per-value work (profile lookups, event-type parsing, reasoning text) runs
+once per distinct value of a dictionary-encoded column. Timestamps become
+two `datetime64[us]` columns: the UTC instant that recency is measured
+from, and the wall-clock time the calendar rules read (weekday, hour, month,
+day), which for aware datetimes is in their own timezone, as `score_signal`
+reads them.
+"""
+
+from __future__ import annotations
+
+import datetime
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from competitive_intel.utils.dates import DateParser, shared_date_parser
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+_US = datetime.timedelta(microseconds=1)
+_NAT_INT = int(np.datetime64('NaT', 'us').astype(np.int64))
+
+
+def encode(values: Sequence[Any]) -> Tuple[np.ndarray, List[Any]]:
+    """(codes, distinct values) in first-seen order; unhashable values get code -1."""
+    lookup: Dict[Any, int] = {}
+    codes = np.empty(len(values), dtype=np.int64)
+    for i, v in enumerate(values):
+        try:
+            codes[i] = lookup.setdefault(v, len(lookup))
+        except TypeError:
+            codes[i] = -1
+    return codes, list(lookup)
+
+
+@dataclass
+class TimestampColumns:
+    instant: np.ndarray      # datetime64[us], UTC
+    wall: np.ndarray         # datetime64[us], the value's own wall-clock time
+    missing: np.ndarray      # None: scored as "now"
+    unparseable: np.ndarray  # strings (or NaT) that are not dates: neutral timing
+    invalid: np.ndarray      # values score_signal cannot score at all
+
+
+def timestamp_columns(values: Sequence[Any], now: datetime.datetime,
+                      parser: Optional[DateParser] = None) -> TimestampColumns:
+    """Timestamp columns for `score_batch`.
+
+    Strings go through the shared date parser and, like naive datetimes, are
+    read as UTC. A `datetime64` array is taken as naive UTC with NaT as
+    unparseable. `now` must be timezone-aware.
+    """
+    n = len(values)
+    now_us = (now.astimezone(datetime.timezone.utc).replace(tzinfo=None) - _EPOCH) // _US
+    if isinstance(values, np.ndarray) and np.issubdtype(values.dtype, np.datetime64):
+        wall = values.astype('datetime64[us]')
+        bad = np.isnat(wall)
+        none = np.zeros(n, dtype=bool)
+        return TimestampColumns(wall.copy(), wall, none, bad, none.copy())
+    instant = np.full(n, _NAT_INT, dtype=np.int64)
+    wall = np.full(n, _NAT_INT, dtype=np.int64)
+    missing = np.zeros(n, dtype=bool)
+    invalid = np.zeros(n, dtype=bool)
+    strings: Dict[int, str] = {}
+    for i, v in enumerate(values):
+        if v is None:
+            missing[i] = True
+            instant[i] = wall[i] = now_us
+        elif isinstance(v, str):
+            strings[i] = v
+        elif isinstance(v, datetime.datetime):
+            offset = v.utcoffset()
+            local = (v.replace(tzinfo=None) - _EPOCH) // _US
+            wall[i] = local
+            instant[i] = local - offset // _US if offset is not None else local
+        else:
+            invalid[i] = True
+    unparseable = np.zeros(n, dtype=bool)
+    if strings:
+        idx = np.fromiter(strings, dtype=np.int64, count=len(strings))
+        parsed = (parser or shared_date_parser()).parse_many(list(strings.values())).view(np.int64)
+        instant[idx] = wall[idx] = parsed
+        unparseable[idx] = parsed == _NAT_INT
+    return TimestampColumns(instant.view('datetime64[us]'), wall.view('datetime64[us]'),
+                            missing, unparseable, invalid)
+
+
+def calendar_fields(wall: np.ndarray) -> Dict[str, np.ndarray]:
+    """weekday (Monday 0), hour, month (1-12) and day of month for `datetime64` values."""
+    days = wall.astype('datetime64[D]')
+    months = wall.astype('datetime64[M]')
+    return {
+        'weekday': (days.astype(np.int64) + 3) % 7,  # 1970-01-01 was a Thursday
+        'hour': (wall - days).astype('timedelta64[h]').astype(np.int64),
+        'month': months.astype(np.int64) % 12 + 1,
+        'day': (days - months.astype('datetime64[D]')).astype(np.int64) + 1,
+    }
+
+
+def py_round(values: np.ndarray, ndigits: int = 1) -> np.ndarray:
+    """Python's `round` element-wise; `np.round` rounds some ties the other way."""
+    distinct, inverse = np.unique(values, return_inverse=True)
+    return np.array([round(v, ndigits) for v in distinct.tolist()], dtype=np.float64)[inverse.ravel()]
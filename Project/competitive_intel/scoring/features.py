@@ -0,0 +1,100 @@
+"""Versioned, copy-on-write table of per-competitor scoring features.
+
+Rows are derived once from their source (a competitor profile) by a build
+function. Readers take the current `FeatureSnapshot` with one attribute read
+and no lock; its mappings are never changed after publication. Writers copy
+the mappings under a lock, rebuild only the changed rows and publish the copy
+with the next version, so concurrent scoring workers never see a half-applied
+update. Rows for keys outside the table (default profiles of unknown
+competitors) are built on demand, cached per version and never added to it.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Generic, Hashable, Mapping, Optional, TypeVar
+
+Row = TypeVar("Row")
+
+
+@dataclass(frozen=True)
+class FeatureSnapshot(Generic[Row]):
+    version: int
+    sources: Mapping[Hashable, Any]
+    rows: Mapping[Hashable, Row]
+
+    def get(self, key: Any) -> Optional[Row]:
+        """Row for `key`, or None (also for unhashable keys)."""
+        try:
+            return self.rows.get(key)
+        except TypeError:
+            return None
+
+
+class FeatureTable(Generic[Row]):
+    """key -> row, rebuilt copy-on-write when a source is added or changed."""
+
+    def __init__(self, build: Callable[[Hashable, Any], Row], sources: Optional[Mapping[Hashable, Any]] = None,
+                 max_derived: int = 10_000) -> None:
+        self._build = build
+        self._lock = threading.Lock()
+        self.max_derived = max_derived
+        self._derived: Dict[Any, Row] = {}
+        self._snapshot: FeatureSnapshot[Row] = FeatureSnapshot(0, MappingProxyType({}), MappingProxyType({}))
+        if sources:
+            self.replace(sources)
+
+    @property
+    def version(self) -> int:
+        return self._snapshot.version
+
+    def snapshot(self) -> FeatureSnapshot[Row]:
+        return self._snapshot
+
+    def get(self, key: Any) -> Optional[Row]:
+        return self._snapshot.get(key)
+
+    def _publish(self, sources: Dict[Hashable, Any], rows: Dict[Hashable, Row]) -> int:
+        version = self._snapshot.version + 1
+        self._derived = {}
+        self._snapshot = FeatureSnapshot(version, MappingProxyType(sources), MappingProxyType(rows))
+        return version
+
+    def put(self, key: Hashable, source: Any) -> int:
+        """Add or replace one source; returns the new version."""
+        with self._lock:
+            row = self._build(key, source)
+            snap = self._snapshot
+            return self._publish({**snap.sources, key: source}, {**snap.rows, key: row})
+
+    def update(self, key: Hashable, change: Callable[[Any], Any]) -> Optional[int]:
+        """Replace the source for `key` with `change(source)`; None when `key` is absent."""
+        with self._lock:
+            snap = self._snapshot
+            if key not in snap.sources:
+                return None
+            source = change(snap.sources[key])
+            row = self._build(key, source)
+            return self._publish({**snap.sources, key: source}, {**snap.rows, key: row})
+
+    def replace(self, sources: Mapping[Hashable, Any]) -> int:
+        """Rebuild every row (new sources, or new settings the build function reads)."""
+        with self._lock:
+            sources = dict(sources)
+            return self._publish(sources, {key: self._build(key, src) for key, src in sources.items()})
+
+    def rebuild(self) -> int:
+        return self.replace(self._snapshot.sources)
+
+    def derived(self, key: Any, make: Callable[[], Row]) -> Row:
+        """Row for a key outside the table, built by `make` once per version."""
+        derived = self._derived
+        row = derived.get(key)
+        if row is None:
+            row = make()
+            if len(derived) >= self.max_derived:
+                derived.clear()
+            derived[key] = row
+        return row
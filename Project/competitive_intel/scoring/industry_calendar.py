@@ -0,0 +1,230 @@
+"""Industry calendar for impact timing boosts (launch seasons, trade shows, retail peaks).
+
+Entries are read from a JSON file (`industry_calendar.json` next to this
+module by default). An entry covers whole months every year, month/day
+ranges every year, or explicit date ranges (no dates: every day), and applies
+to its regions, competitors and event types ("*" for any). An entry with
+keywords applies only when the signal text mentions one of them. Entries
+of the same group do not stack: each group adds its largest active boost,
+group by group in file order.
+
+Active entries are bitmasks: one per day in a per-year table, and one per
+region, competitor, event type and keyword match. A lookup ANDs five masks
+and reads the group boosts for the result, and `boost_columns` does the same
+over NumPy columns for batch scoring.
+"""
+
+from __future__ import annotations
+
+import datetime
+import json
+import os
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+DEFAULT_CALENDAR_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "industry_calendar.json")
+
+ANY = "*"
+MAX_ENTRIES = 63  # masks are int64
+
+_ORDINAL_1970 = datetime.date(1970, 1, 1).toordinal()
+
+
+@dataclass(frozen=True)
+class CalendarEntry:
+    name: str
+    group: str
+    boost: float
+    months: Tuple[int, ...] = ()
+    month_days: Tuple[Tuple[int, int, int], ...] = ()           # (month, first day, last day)
+    dates: Tuple[Tuple[datetime.date, datetime.date], ...] = ()  # inclusive ranges
+    regions: Tuple[str, ...] = (ANY,)
+    competitors: Tuple[str, ...] = (ANY,)                        # lower-case names
+    event_types: Tuple[str, ...] = (ANY,)
+    keywords: Tuple[str, ...] = ()                               # lower-case substrings
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "CalendarEntry":
+        return cls(
+            name=str(d['name']),
+            group=str(d.get('group') or d['name']),
+            boost=float(d['boost']),
+            months=tuple(int(m) for m in d.get('months', ())),
+            month_days=tuple((int(m), int(a), int(b)) for m, a, b in d.get('month_days', ())),
+            dates=tuple((datetime.date.fromisoformat(a), datetime.date.fromisoformat(b)) for a, b in d.get('dates', ())),
+            regions=tuple(str(r).upper() if r != ANY else ANY for r in d.get('regions', (ANY,))),
+            competitors=tuple(str(c).lower() for c in d.get('competitors', (ANY,))),
+            event_types=tuple(str(e).lower() for e in d.get('event_types', (ANY,))),
+            keywords=tuple(str(k).lower() for k in d.get('keywords', ())),
+        )
+
+    @property
+    def every_day(self) -> bool:
+        return not (self.months or self.month_days or self.dates)
+
+    def covers_days(self, ordinals: np.ndarray, months: np.ndarray, days: np.ndarray) -> np.ndarray:
+        """Boolean mask of the given days (proleptic ordinals with their month and day) the entry covers."""
+        if self.every_day:
+            return np.ones(len(ordinals), dtype=bool)
+        out = np.isin(months, self.months)
+        for m, a, b in self.month_days:
+            out |= (months == m) & (days >= a) & (days <= b)
+        for a, b in self.dates:
+            out |= (ordinals >= a.toordinal()) & (ordinals <= b.toordinal())
+        return out
+
+
+def _bits(indices: Iterable[int]) -> int:
+    mask = 0
+    for i in indices:
+        mask |= 1 << i
+    return mask
+
+
+class IndustryCalendar:
+    """Per-day index of calendar entries with O(1) boost lookups."""
+
+    def __init__(self, entries: Sequence[CalendarEntry]) -> None:
+        if len(entries) > MAX_ENTRIES:
+            raise ValueError(f"an industry calendar holds at most {MAX_ENTRIES} entries, got {len(entries)}")
+        self.entries = list(entries)
+        self.groups: List[str] = list(dict.fromkeys(e.group for e in self.entries))
+        group_of = [self.groups.index(e.group) for e in self.entries]
+        self._boosts = [(group_of[i], e.boost) for i, e in enumerate(self.entries)]
+        self.no_keyword_mask = _bits(i for i, e in enumerate(self.entries) if not e.keywords)
+        self.keyword_entries = [i for i, e in enumerate(self.entries) if e.keywords]
+        self._any_region = _bits(i for i, e in enumerate(self.entries) if ANY in e.regions)
+        self._any_competitor = _bits(i for i, e in enumerate(self.entries) if ANY in e.competitors)
+        self._any_event_type = _bits(i for i, e in enumerate(self.entries) if ANY in e.event_types)
+        self._region_masks: Dict[Any, int] = {}
+        self._competitor_masks: Dict[Any, int] = {}
+        self._event_type_masks: Dict[Any, int] = {}
+        self._group_boosts: Dict[int, Tuple[float, ...]] = {}
+        self._years: Tuple[int, int, np.ndarray] = (1, 0, np.zeros(0, dtype=np.int64))  # first, last year, masks
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: Optional[str] = None) -> "IndustryCalendar":
+        with open(path or DEFAULT_CALENDAR_PATH, encoding="utf-8") as f:
+            data = json.load(f)
+        entries = data['entries'] if isinstance(data, dict) else data
+        return cls([CalendarEntry.from_dict(d) for d in entries])
+
+    # ---- per-day table ----
+    def _year_table(self, first: int, last: int) -> Tuple[int, np.ndarray]:
+        """Day masks from Jan 1 of `first` (or earlier) on, covering every day up to Dec 31 of `last`."""
+        start, end, table = self._years
+        if start <= first and last <= end:
+            return start, table
+        with self._lock:
+            start, end, table = self._years
+            if len(table):
+                first, last = min(first, start), max(last, end)
+            lo = datetime.date(first, 1, 1).toordinal()
+            hi = datetime.date(last, 12, 31).toordinal()
+            ordinals = np.arange(lo, hi + 1, dtype=np.int64)
+            days = (ordinals - _ORDINAL_1970).astype('datetime64[D]')
+            month_start = days.astype('datetime64[M]')
+            months = month_start.astype(np.int64) % 12 + 1
+            mdays = (days - month_start.astype('datetime64[D]')).astype(np.int64) + 1
+            masks = np.zeros(len(ordinals), dtype=np.int64)
+            for i, e in enumerate(self.entries):
+                masks[e.covers_days(ordinals, months, mdays)] |= np.int64(1) << i
+            self._years = (first, last, masks)
+            return first, masks
+
+    def day_mask(self, day: datetime.date) -> int:
+        first, table = self._year_table(day.year, day.year)
+        return int(table[day.toordinal() - datetime.date(first, 1, 1).toordinal()])
+
+    def day_masks(self, days: np.ndarray) -> np.ndarray:
+        """Masks for a `datetime64` column (0 for NaT)."""
+        days = days.astype('datetime64[D]')
+        valid = ~np.isnat(days)
+        out = np.zeros(len(days), dtype=np.int64)
+        if not valid.any():
+            return out
+        years = days[valid].astype('datetime64[Y]').astype(np.int64) + 1970
+        first, table = self._year_table(int(years.min()), int(years.max()))
+        offset = (days[valid] - np.datetime64(f"{first:04d}-01-01", 'D')).astype(np.int64)
+        out[valid] = table[offset]
+        return out
+
+    # ---- facet masks ----
+    def region_mask(self, region: Any) -> int:
+        mask = self._region_masks.get(region)
+        if mask is None:
+            code = region.strip().upper() if isinstance(region, str) else None
+            mask = self._any_region | _bits(i for i, e in enumerate(self.entries) if code and code in e.regions)
+            self._region_masks[region] = mask
+        return mask
+
+    def competitor_mask(self, competitor: Any) -> int:
+        mask = self._competitor_masks.get(competitor)
+        if mask is None:
+            name = competitor.lower() if isinstance(competitor, str) else None
+            mask = self._any_competitor | _bits(i for i, e in enumerate(self.entries) if name and name in e.competitors)
+            self._competitor_masks[competitor] = mask
+        return mask
+
+    def event_type_mask(self, event_type: Any) -> int:
+        mask = self._event_type_masks.get(event_type)
+        if mask is None:
+            ev = event_type.lower() if isinstance(event_type, str) else None
+            mask = self._any_event_type | _bits(i for i, e in enumerate(self.entries) if ev and ev in e.event_types)
+            self._event_type_masks[event_type] = mask
+        return mask
+
+    def keyword_mask(self, text: str) -> int:
+        """Entries without keywords, plus those whose keywords the (lower-cased) text mentions."""
+        return self.no_keyword_mask | _bits(
+            i for i in self.keyword_entries if any(k in text for k in self.entries[i].keywords))
+
+    def keyword_groups(self) -> Dict[str, List[str]]:
+        """Keyword matcher groups `calendar:<entry index>` for batch keyword masks."""
+        return {f"calendar:{i}": list(self.entries[i].keywords) for i in self.keyword_entries}
+
+    # ---- boosts ----
+    def group_boosts(self, mask: int) -> Tuple[float, ...]:
+        """Boost added by each group (in order) for a mask of active entries."""
+        boosts = self._group_boosts.get(mask)
+        if boosts is None:
+            out = [0.0] * len(self.groups)
+            for i, (g, boost) in enumerate(self._boosts):
+                if mask >> i & 1 and boost > out[g]:
+                    out[g] = boost
+            boosts = self._group_boosts[mask] = tuple(out)
+        return boosts
+
+    def boosts(self, day: datetime.date, region: Any, competitor: Any, event_type: Any, text: str) -> Tuple[float, ...]:
+        """Group boosts for one signal."""
+        return self.group_boosts(self.day_mask(day) & self.region_mask(region) & self.competitor_mask(competitor)
+                                 & self.event_type_mask(event_type) & self.keyword_mask(text))
+
+    def boost_columns(self, masks: np.ndarray) -> np.ndarray:
+        """(len(masks), len(groups)) group boosts for a column of active-entry masks."""
+        distinct, inverse = np.unique(masks, return_inverse=True)
+        table = np.array([self.group_boosts(int(m)) for m in distinct.tolist()], dtype=np.float64)
+        return table.reshape(len(distinct), len(self.groups))[inverse.ravel()]
+
+    def active(self, day: datetime.date, region: Any = None, competitor: Any = None,
+               event_type: Any = None, text: str = "") -> List[str]:
+        """Names of the entries that apply (for explanations and debugging)."""
+        mask = (self.day_mask(day) & self.region_mask(region) & self.competitor_mask(competitor)
+                & self.event_type_mask(event_type) & self.keyword_mask(text.lower()))
+        return [e.name for i, e in enumerate(self.entries) if mask >> i & 1]
+
+
+_shared: Dict[str, IndustryCalendar] = {}
+
+
+def shared_calendar(path: Optional[str] = None) -> IndustryCalendar:
+    """Process-wide calendar per data file."""
+    path = path or DEFAULT_CALENDAR_PATH
+    cal = _shared.get(path)
+    if cal is None:
+        cal = _shared[path] = IndustryCalendar.load(path)
+    return cal
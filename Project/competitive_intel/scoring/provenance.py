@@ -0,0 +1,320 @@
+"""Append-only store of impact score provenance, one fixed-width record per scored event.
+
+A record holds what a score was made of: the component and final scores
+(in tenths), urgency, event time and scoring time, the business-hours,
+calendar and burst terms, and ids for the competitor, region, weight set and
+up to `RULE_SLOTS` fired rules (event-significance rules and active calendar
+entries). The ids point into a dictionary of strings that is also append only,
+so a record never changes once written.
+
+A store is a directory with `records.bin` (a 16-byte header, then packed
+`RECORD` structs) and `dictionary.txt` (one string per line; id = line
+number). `ProvenanceStore.records()` memory-maps the records, and `why(id)`
+finds an event's records by scanning the mapped id-hash column, so audits over
+months of scores never load per-event dicts. Appends are serialized within a
+process (use `shared_provenance_store`); one process should write a store.
+
+Usage: python -m competitive_intel.scoring.provenance STORE_DIR EVENT_ID [--all]
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import os
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+MAGIC = b"CIPROV01"
+HEADER_SIZE = 16
+RULE_SLOTS = 12
+URGENCIES = ("low", "medium", "high", "immediate")
+NO_TIME = np.iinfo(np.int64).min
+
+# Record flags
+ERROR, UNPARSEABLE, RULES_TRUNCATED = 1, 2, 4
+
+RECORD = np.dtype([
+    ('event', '<u8'),             # first 8 bytes of blake2b(event id)
+    ('scored_at', '<i8'),         # microseconds since the epoch (UTC)
+    ('event_time', '<i8'),        # microseconds since the epoch; NO_TIME when unknown
+    ('final', 'u1'),              # scores in tenths (0-100)
+    ('size', 'u1'),
+    ('event_score', 'u1'),
+    ('timing', 'u1'),
+    ('business_hours', 'i1'),     # timing terms in tenths
+    ('calendar', 'i1'),
+    ('burst', 'i1'),
+    ('urgency', 'u1'),            # index into URGENCIES
+    ('flags', 'u1'),
+    ('competitor', '<u4'),        # dictionary ids (0: none)
+    ('region', '<u4'),
+    ('weights', '<u4'),
+    ('rules', '<u2', (RULE_SLOTS,)),
+])
+
+
+def event_hash(event_id: Any) -> int:
+    return int.from_bytes(hashlib.blake2b(str(event_id).encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def _us(dt: datetime) -> int:
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return (dt - datetime(1970, 1, 1, tzinfo=timezone.utc)) // timedelta(microseconds=1)
+
+
+def _time(us: int) -> Optional[datetime]:
+    return None if us == NO_TIME else datetime(1970, 1, 1, tzinfo=timezone.utc) + timedelta(microseconds=int(us))
+
+
+def _tenths(values: Any, lo: int, hi: int) -> np.ndarray:
+    return np.clip(np.rint(np.asarray(values, dtype=np.float64) * 10), lo, hi)
+
+
+@dataclass
+class Provenance:
+    """One decoded record."""
+    event_hash: int
+    scored_at: datetime
+    event_time: Optional[datetime]
+    final: float
+    size: float
+    event_score: float
+    timing: float
+    business_hours: float
+    calendar: float
+    burst: float
+    urgency: str
+    competitor: str
+    region: str
+    weights: str
+    rules: List[str] = field(default_factory=list)
+    flags: int = 0
+
+    def render(self) -> str:
+        """Why the event got its score, as one line."""
+        parts = [f"{min(10.0, self.final + self.burst):.1f} ({self.urgency})"]
+        if self.flags & ERROR:
+            return f"{parts[0]}: scoring failed"
+        parts.append(f"size {self.size:.1f}, event {self.event_score:.1f}, timing {self.timing:.1f} [{self.weights}]")
+        if self.burst:
+            parts.append(f"base {self.final:.1f} + burst {self.burst:.1f}")
+        terms = [f"business hours {self.business_hours:+.1f}"] if self.business_hours else []
+        if self.calendar:
+            terms.append(f"calendar {self.calendar:+.1f}")
+        if self.flags & UNPARSEABLE:
+            terms.append("unparseable date")
+        elif self.event_time is not None:
+            terms.append(f"age {timedelta(seconds=int((self.scored_at - self.event_time).total_seconds()))}")
+        if terms:
+            parts.append("timing: " + ", ".join(terms))
+        for kind in ("rule", "calendar"):
+            names = [r.split(":", 1)[1] for r in self.rules if r.startswith(kind + ":")]
+            if names:
+                parts.append(f"{kind}: " + ", ".join(names))
+        if self.flags & RULES_TRUNCATED:
+            parts.append("(more rules fired than recorded)")
+        head = " | ".join(parts)
+        return f"{self.competitor or 'Unknown'}{f' ({self.region})' if self.region else ''} @ " \
+               f"{self.scored_at.isoformat(timespec='seconds')}: {head}"
+
+
+class ProvenanceStore:
+    """Append-only provenance records and their string dictionary in one directory."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+        self.records_path = os.path.join(path, "records.bin")
+        self.dictionary_path = os.path.join(path, "dictionary.txt")
+        self._lock = threading.Lock()
+        self._strings: List[str] = [""]           # id 0 is "none"
+        self._ids: Dict[str, int] = {"": 0}
+        if os.path.exists(self.dictionary_path):
+            with open(self.dictionary_path, "rb") as f:
+                data = f.read()
+            complete = data[:data.rfind(b"\n") + 1]
+            if len(complete) != len(data):
+                # A partial last line is from a crashed append, and no record uses it yet
+                with open(self.dictionary_path, "r+b") as f:
+                    f.truncate(len(complete))
+            for line in complete.decode("utf-8").split("\n")[:-1]:
+                self._add_string(line)
+        self._open_records()
+
+    def _open_records(self) -> None:
+        header = MAGIC + np.uint32(RECORD.itemsize).tobytes() + bytes(4)
+        if not os.path.exists(self.records_path) or os.path.getsize(self.records_path) == 0:
+            with open(self.records_path, "wb") as f:
+                f.write(header)
+            return
+        with open(self.records_path, "rb") as f:
+            found = f.read(HEADER_SIZE)
+        if found[:12] != header[:12]:
+            raise ValueError(f"{self.records_path}: not a provenance file of this format")
+        # A crash mid-append can leave a partial record; drop it
+        size = os.path.getsize(self.records_path)
+        whole = HEADER_SIZE + (size - HEADER_SIZE) // RECORD.itemsize * RECORD.itemsize
+        if whole != size:
+            with open(self.records_path, "r+b") as f:
+                f.truncate(whole)
+
+    def _add_string(self, s: str) -> int:
+        self._ids[s] = len(self._strings)
+        self._strings.append(s)
+        return self._ids[s]
+
+    def _intern(self, values: Sequence[str], new: List[str]) -> List[int]:
+        ids = []
+        for v in values:
+            v = v.replace("\n", " ")
+            i = self._ids.get(v)
+            if i is None:
+                i = self._add_string(v)
+                new.append(v)
+            ids.append(i)
+        return ids
+
+    def string(self, string_id: int) -> str:
+        return self._strings[string_id] if 0 <= string_id < len(self._strings) else f"#{string_id}"
+
+    def append(self, event_ids: Sequence[Any], components: Any, scores: Any, scorer: Any,
+               now: Optional[datetime] = None, bursts: Optional[Sequence[float]] = None) -> int:
+        """Record the scores of one batch (`components` and `scores` from the same
+        `signal_components`/`score_components` call); returns the records written."""
+        n = len(event_ids)
+        if not n:
+            return 0
+        now = now or datetime.now(timezone.utc)
+        rule_names = ['rule:' + r for r in scorer.significance_rules]
+        calendar_names = ['calendar:' + e.name for e in scorer.calendar.entries]
+        rec = np.zeros(n, dtype=RECORD)
+        rec['event'] = [event_hash(e) for e in event_ids]
+        rec['scored_at'] = _us(now)
+        rec['event_time'] = components.instant.view(np.int64)
+        rec['final'] = _tenths(scores.final_score, 0, 100)
+        rec['size'] = _tenths(scores.competitor_size_score, 0, 100)
+        rec['event_score'] = _tenths(scores.event_significance_score, 0, 100)
+        rec['timing'] = _tenths(scores.timing_score, 0, 100)
+        terms = components.timing_terms
+        rec['business_hours'] = _tenths(terms[:, 0], -128, 127)
+        rec['calendar'] = _tenths(terms[:, 1:].sum(axis=1) if terms.shape[1] > 1 else 0.0, -128, 127)
+        rec['burst'] = _tenths(bursts if bursts is not None else 0.0, -128, 127)
+        rec['urgency'] = [URGENCIES.index(u) if u in URGENCIES else 0 for u in scores.urgency.tolist()]
+        rec['flags'] = np.where(components.error, ERROR, 0) | np.where(components.unparseable, UNPARSEABLE, 0)
+
+        new: List[str] = []
+        with self._lock:
+            names = [c[0] if isinstance(c, tuple) else c for c in components.competitors]
+            rec['competitor'] = np.array(self._intern([str(c) for c in names], new) + [0],
+                                         dtype=np.uint32)[components.competitor_codes]
+            rec['region'] = np.array(self._intern([r or "" for r in components.regions], new) + [0],
+                                     dtype=np.uint32)[components.region_codes]
+            version = getattr(scorer, 'weights_version', 0)
+            weight_sets = []
+            for r in components.regions:
+                w = scorer.weights_for(r)
+                weight_sets.append(f"v{version} size={w['competitor_size']:g} event={w['event_significance']:g} "
+                                   f"timing={w['timing']:g}")
+            rec['weights'] = np.array(self._intern(weight_sets, new) + [0], dtype=np.uint32)[components.region_codes]
+            # Rule slots per distinct (rules, calendar) pair; most batches have few
+            pairs, inverse = np.unique(np.stack([components.rules, components.calendar_mask], axis=1), axis=0,
+                                       return_inverse=True)
+            slots = np.zeros((len(pairs), RULE_SLOTS), dtype=np.uint16)
+            truncated = np.zeros(len(pairs), dtype=bool)
+            for k, (rules, active) in enumerate(pairs.tolist()):
+                fired = ([rule_names[j] for j in range(len(rule_names)) if rules >> j & 1]
+                         + [calendar_names[j] for j in range(len(calendar_names)) if active >> j & 1])
+                ids = self._intern(fired[:RULE_SLOTS], new)
+                slots[k, :len(ids)] = ids
+                truncated[k] = len(fired) > RULE_SLOTS
+            inverse = inverse.ravel()
+            rec['rules'] = slots[inverse]
+            rec['flags'] |= np.where(truncated[inverse], RULES_TRUNCATED, 0).astype(np.uint8)
+            # Dictionary first, so every id in a written record resolves
+            if new:
+                try:
+                    with open(self.dictionary_path, "ab") as f:
+                        f.write("".join(s + "\n" for s in new).encode("utf-8"))
+                except OSError:
+                    for s in new:
+                        del self._ids[s]
+                    del self._strings[len(self._strings) - len(new):]
+                    raise
+            with open(self.records_path, "ab") as f:
+                f.write(rec.tobytes())
+        return n
+
+    def __len__(self) -> int:
+        return (os.path.getsize(self.records_path) - HEADER_SIZE) // RECORD.itemsize
+
+    def records(self) -> np.ndarray:
+        """All records, memory-mapped read-only (an empty array when there are none)."""
+        n = len(self)
+        if not n:
+            return np.zeros(0, dtype=RECORD)
+        return np.memmap(self.records_path, dtype=RECORD, mode="r", offset=HEADER_SIZE, shape=(n,))
+
+    def decode(self, rec: np.void) -> Provenance:
+        return Provenance(
+            event_hash=int(rec['event']),
+            scored_at=_time(int(rec['scored_at'])),
+            event_time=_time(int(rec['event_time'])),
+            final=int(rec['final']) / 10, size=int(rec['size']) / 10, event_score=int(rec['event_score']) / 10,
+            timing=int(rec['timing']) / 10, business_hours=int(rec['business_hours']) / 10,
+            calendar=int(rec['calendar']) / 10, burst=int(rec['burst']) / 10,
+            urgency=URGENCIES[int(rec['urgency'])] if rec['urgency'] < len(URGENCIES) else "low",
+            competitor=self.string(int(rec['competitor'])), region=self.string(int(rec['region'])),
+            weights=self.string(int(rec['weights'])),
+            rules=[self.string(int(r)) for r in rec['rules'] if r],
+            flags=int(rec['flags']),
+        )
+
+    def history(self, event_id: Any) -> List[Provenance]:
+        """Every record of an event, oldest first."""
+        records = self.records()
+        return [self.decode(records[i]) for i in np.flatnonzero(records['event'] == np.uint64(event_hash(event_id)))]
+
+    def why(self, event_id: Any) -> Optional[Provenance]:
+        """The event's latest record (None when it was never recorded)."""
+        history = self.history(event_id)
+        return history[-1] if history else None
+
+
+_shared: Dict[str, ProvenanceStore] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_provenance_store(path: str) -> ProvenanceStore:
+    """Process-wide store per directory, so every writer shares one dictionary."""
+    key = os.path.abspath(path)
+    with _shared_lock:
+        store = _shared.get(key)
+        if store is None:
+            store = _shared[key] = ProvenanceStore(path)
+        return store
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Explain recorded impact scores.")
+    parser.add_argument("store", help="provenance directory (CI_PROVENANCE_DIR)")
+    parser.add_argument("event_id")
+    parser.add_argument("--all", action="store_true", help="every recorded score, not just the latest")
+    args = parser.parse_args(argv)
+    store = ProvenanceStore(args.store)
+    found = store.history(args.event_id) if args.all else [p for p in [store.why(args.event_id)] if p]
+    if not found:
+        print(f"No provenance for {args.event_id!r} in {args.store} ({len(store)} records)")
+        return 1
+    for p in found:
+        print(p.render())
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,236 @@
+"""Incremental re-scoring of scored events as they age.
+
+An impact score changes with time only through its recency bucket (under 6h,
+1d, 3d, 1w, 30d, older), and urgency follows the score. `RescoringService`
+keeps each tracked event's time-invariant components (see the scorer's
+`signal_components`) in a heap ordered by the instant its age next crosses a
+bucket boundary. `refresh(now)` pops only the events whose boundary has
+passed, re-scores them in one batch with the scorer's `score_components`, and
+pushes the urgency changes to subscribers. Undated and unparseable events
+never change and are not queued.
+"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Recency buckets of the scorer's timing score
+BUCKET_BOUNDARIES = (timedelta(hours=6), timedelta(days=1), timedelta(days=3), timedelta(weeks=1),
+                     timedelta(days=30))
+_BOUNDARIES_US = np.array([b // timedelta(microseconds=1) for b in BUCKET_BOUNDARIES], dtype=np.int64)
+_NAT = np.iinfo(np.int64).min
+
+# (impact, urgency) -> (impact, urgency), e.g. a burst alert's boost
+Adjustment = Callable[[float, str], tuple]
+Subscriber = Callable[[List["UrgencyChange"]], None]
+
+
+def _now_us(now: Optional[datetime]) -> int:
+    now = now or datetime.now(timezone.utc)
+    if now.tzinfo is None:
+        now = now.replace(tzinfo=timezone.utc)
+    return (now - datetime(1970, 1, 1, tzinfo=timezone.utc)) // timedelta(microseconds=1)
+
+
+def next_boundaries(instants_us: np.ndarray, now_us: int) -> np.ndarray:
+    """Microsecond instant of each event's next bucket boundary after `now_us` (-1 when none is left)."""
+    instants_us = np.asarray(instants_us, dtype=np.int64)
+    due = instants_us[:, None] + _BOUNDARIES_US[None, :]
+    ahead = due > now_us
+    out = np.where(ahead.any(axis=1), due[np.arange(len(due)), ahead.argmax(axis=1)], -1)
+    out[instants_us == _NAT] = -1
+    return out
+
+
+@dataclass
+class UrgencyChange:
+    event_id: Hashable
+    before: str
+    after: str
+    impact: float
+    at: datetime
+
+
+@dataclass
+class TrackedScore:
+    """Current score of a tracked event (impact and urgency include its adjustment)."""
+    impact: float
+    urgency: str
+    score: Any                    # the scorer's ImpactScore
+    components: tuple             # ScoreComponents row
+    adjust: Optional[Adjustment]
+    due: int                      # next boundary in microseconds since the epoch; -1 when none
+
+
+class RescoringService:
+    """Tracked events by next bucket boundary; `refresh` re-scores only the ones that crossed it."""
+
+    def __init__(self, scorer: Any = None, max_events: int = 100_000) -> None:
+        self.scorer = scorer
+        self.max_events = max_events
+        self._tracked: "OrderedDict[Hashable, TrackedScore]" = OrderedDict()
+        self._heap: List[tuple] = []          # (due, seq, event id); stale entries are skipped
+        self._seq = 0
+        self._subscribers: List[Subscriber] = []
+        self._lock = threading.Lock()
+        self._components_type: Any = None     # the scorer's ScoreComponents, to rebuild batches from rows
+        self.rescored = 0
+
+    def _push(self, event_id: Hashable, due: int) -> None:
+        if due >= 0:
+            self._seq += 1
+            heapq.heappush(self._heap, (due, self._seq, event_id))
+
+    def _compact(self) -> None:
+        # Re-tracked and evicted events leave stale entries behind
+        if len(self._heap) > 2 * len(self._tracked) + 1024:
+            self._heap = []
+            for event_id, entry in self._tracked.items():
+                self._push(event_id, entry.due)
+
+    @staticmethod
+    def _adjusted(score: Any, adjust: Optional[Adjustment]) -> tuple:
+        if adjust is None:
+            return score.final_score, score.urgency
+        return adjust(score.final_score, score.urgency)
+
+    def track(self, event_ids: Sequence[Hashable], components: Any, scores: Any,
+              now: Optional[datetime] = None, dated: Optional[Sequence[bool]] = None,
+              adjustments: Optional[Sequence[Optional[Adjustment]]] = None) -> None:
+        """Start (or restart) tracking events scored at `now` from `components`.
+
+        `dated` marks events that had a timestamp (undated ones are scored
+        against `now` and never re-scored); `adjustments` are applied to each
+        re-score's impact and urgency.
+        """
+        self._components_type = type(components)
+        rows = components.rows()
+        due = next_boundaries(components.instant.view(np.int64), _now_us(now))
+        if dated is not None:
+            due = np.where(np.asarray(dated, dtype=bool), due, -1)
+        adjustments = adjustments or [None] * len(rows)
+        with self._lock:
+            for i, (event_id, row, adjust) in enumerate(zip(event_ids, rows, adjustments)):
+                score = scores[i]
+                impact, urgency = self._adjusted(score, adjust)
+                entry = TrackedScore(impact, urgency, score, row, adjust, int(due[i]))
+                self._tracked[event_id] = entry
+                self._tracked.move_to_end(event_id)
+                self._push(event_id, entry.due)
+            while len(self._tracked) > self.max_events:
+                self._tracked.popitem(last=False)
+            self._compact()
+
+    def untrack(self, event_id: Hashable) -> None:
+        with self._lock:
+            self._tracked.pop(event_id, None)
+
+    def current(self, event_id: Hashable) -> Optional[TrackedScore]:
+        return self._tracked.get(event_id)
+
+    def __len__(self) -> int:
+        return len(self._tracked)
+
+    def next_due(self) -> Optional[datetime]:
+        """When the next tracked event changes bucket (None when no event will)."""
+        with self._lock:
+            while self._heap:
+                due, _, event_id = self._heap[0]
+                entry = self._tracked.get(event_id)
+                if entry is not None and entry.due == due:
+                    return datetime(1970, 1, 1, tzinfo=timezone.utc) + timedelta(microseconds=due)
+                heapq.heappop(self._heap)
+        return None
+
+    def subscribe(self, callback: Subscriber) -> Callable[[], None]:
+        """Call `callback(changes)` after each refresh that changed urgencies; returns an unsubscribe function."""
+        with self._lock:
+            self._subscribers.append(callback)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+        return unsubscribe
+
+    def refresh(self, now: Optional[datetime] = None) -> List[UrgencyChange]:
+        """Re-score the events whose bucket changed by `now`; returns (and publishes) the urgency changes."""
+        if self.scorer is None:
+            return []
+        now = now or datetime.now(timezone.utc)
+        now_us = _now_us(now)
+        with self._lock:
+            ids: List[Hashable] = []
+            while self._heap and self._heap[0][0] <= now_us:
+                due, _, event_id = heapq.heappop(self._heap)
+                entry = self._tracked.get(event_id)
+                if entry is not None and entry.due == due:
+                    entry.due = -1
+                    ids.append(event_id)
+            entries = [self._tracked[i] for i in ids]
+        if not entries:
+            return []
+        # Components are plain rows, so the batch is rebuilt without touching the events
+        components = self._components_type.from_rows([e.components for e in entries])
+        scores = self.scorer.score_components(components, now)
+        due = next_boundaries(components.instant.view(np.int64), now_us)
+        changes: List[UrgencyChange] = []
+        with self._lock:
+            for i, (event_id, entry) in enumerate(zip(ids, entries)):
+                if self._tracked.get(event_id) is not entry:
+                    continue  # re-tracked or evicted meanwhile
+                score = scores[i]
+                impact, urgency = self._adjusted(score, entry.adjust)
+                if urgency != entry.urgency:
+                    changes.append(UrgencyChange(event_id, entry.urgency, urgency, impact, now))
+                entry.impact, entry.urgency, entry.score, entry.due = impact, urgency, score, int(due[i])
+                self._push(event_id, entry.due)
+            self.rescored += len(entries)
+            subscribers = list(self._subscribers)
+        if changes:
+            for callback in subscribers:
+                try:
+                    callback(changes)
+                except Exception:
+                    logger.exception("Urgency subscriber failed")
+        return changes
+
+    def apply(self, events: Iterable[Dict[str, Any]], now: Optional[datetime] = None) -> int:
+        """Refresh, then update scored event dicts (by `id`) in place to their current scores."""
+        self.refresh(now)
+        updated = 0
+        for ev in events:
+            entry = self._tracked.get(ev.get('id'))
+            if entry is None or (ev.get('impact'), ev.get('urgency')) == (entry.impact, entry.urgency):
+                continue
+            ev['impact'], ev['urgency'] = entry.impact, entry.urgency
+            ev['impact_breakdown'] = {**(ev.get('impact_breakdown') or {}), 'timing': entry.score.timing_score}
+            if 'impact_explanation' in ev:
+                ev['impact_explanation'] = entry.score.explanation
+            updated += 1
+        return updated
+
+
+_shared: Optional[RescoringService] = None
+_shared_lock = threading.Lock()
+
+
+def shared_rescoring_service(scorer: Any = None) -> RescoringService:
+    """Process-wide service, so the pipeline tracks what the dashboard shows; `scorer` replaces its scorer."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = RescoringService()
+        if scorer is not None:
+            _shared.scorer = scorer
+        return _shared
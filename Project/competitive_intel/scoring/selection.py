@@ -0,0 +1,171 @@
+"""Top-K selection of scored events for the strategic analyst.
+
+`TopK` streams events through a bounded min-heap ordered by (impact,
+urgency, recency), earlier events winning ties, and never holds more than
+`k` selected events plus `k` spares. A per-competitor quota caps how many of
+the selected events one competitor can take. The result is what a full sort
+followed by a greedy pass would give: events best-first, skipping events whose
+competitor is at its quota. When `backfill` is on and too few competitors
+filled the slots, the best over-quota events fill the rest.
+"""
+
+from __future__ import annotations
+
+import datetime
+import heapq
+from dataclasses import dataclass, field
+from itertools import count
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple, Union
+
+from competitive_intel.utils.dates import shared_date_parser
+
+URGENCY_RANK = {"immediate": 3, "high": 2, "medium": 1, "low": 0}
+
+Quota = Union[int, Dict[str, int], None]
+
+
+def _recency(value: Any) -> float:
+    if isinstance(value, str):
+        value = shared_date_parser().parse(value)
+    if isinstance(value, datetime.datetime):
+        return value.timestamp()
+    if isinstance(value, datetime.date):
+        return datetime.datetime(value.year, value.month, value.day).timestamp()
+    return float('-inf')
+
+
+def priority_key(ev: Dict[str, Any]) -> Tuple[float, int, float]:
+    """(impact, urgency rank, date as a timestamp) of a scored event; larger is more important."""
+    try:
+        impact = float(ev.get('impact') or 0.0)
+    except (TypeError, ValueError):
+        impact = 0.0
+    return impact, URGENCY_RANK.get(str(ev.get('urgency', '')).lower(), 0), _recency(ev.get('date'))
+
+
+def _competitor(ev: Dict[str, Any]) -> Hashable:
+    return ev.get('competitor') or 'Unknown'
+
+
+@dataclass
+class SelectionConfig:
+    k: int = 10
+    # Most events per competitor; a dict maps competitors to quotas, "*" is the default
+    per_competitor: Quota = 3
+    backfill: bool = True
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> "SelectionConfig":
+        cfg = config or {}
+        quota = cfg.get("analyst_per_competitor", cls.per_competitor)
+        return cls(
+            k=int(cfg.get("analyst_top_k", cls.k)),
+            per_competitor=quota if isinstance(quota, dict) or quota is None else int(quota),
+            backfill=bool(cfg.get("analyst_backfill", cls.backfill)),
+        )
+
+
+@dataclass(order=True)
+class _Entry:
+    key: Tuple[Any, ...]
+    seq: int                      # negated arrival order: earlier events win ties
+    item: Any = field(compare=False)
+    group: Hashable = field(compare=False)
+
+
+class TopK:
+    """Streaming top-k with per-group quotas (O(log k) per pushed item)."""
+
+    def __init__(self, k: int, key: Callable[[Any], Tuple[Any, ...]] = priority_key,
+                 group: Callable[[Any], Hashable] = _competitor, quota: Quota = None,
+                 backfill: bool = True) -> None:
+        self.k = max(0, int(k))
+        self.key = key
+        self.group = group
+        self.quota = quota
+        self.backfill = backfill
+        self._heap: List[_Entry] = []              # selected, worst first
+        self._groups: Dict[Hashable, List[_Entry]] = {}  # selected per group, worst first
+        self._spare: List[_Entry] = []             # best over-quota events, worst first
+        self._seq = count()
+        self.seen = 0
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> "TopK":
+        sel = SelectionConfig.from_config(config)
+        return cls(sel.k, quota=sel.per_competitor, backfill=sel.backfill)
+
+    def _limit(self, group: Hashable) -> Optional[int]:
+        if isinstance(self.quota, dict):
+            limit = self.quota.get(group, self.quota.get("*"))
+            return None if limit is None else int(limit)
+        return self.quota
+
+    def _spill(self, entry: _Entry) -> None:
+        if not self.backfill:
+            return
+        if len(self._spare) < self.k:
+            heapq.heappush(self._spare, entry)
+        elif entry > self._spare[0]:
+            heapq.heapreplace(self._spare, entry)
+
+    def push(self, item: Any) -> bool:
+        """Offer one item; True when it is selected (for now)."""
+        self.seen += 1
+        if not self.k:
+            return False
+        g = self.group(item)
+        entry = _Entry(self.key(item), -next(self._seq), item, g)
+        members = self._groups.setdefault(g, [])
+        limit = self._limit(g)
+        if limit is not None and len(members) >= limit:
+            if not members or entry < members[0]:
+                self._spill(entry)
+                return False
+            # Replace the group's weakest selected item; the selection keeps its size
+            worst = heapq.heapreplace(members, entry)
+            self._heap.remove(worst)
+            self._heap.append(entry)
+            heapq.heapify(self._heap)
+            self._spill(worst)
+            return True
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif entry > self._heap[0]:
+            evicted = heapq.heapreplace(self._heap, entry)
+            evicted_members = self._groups[evicted.group]
+            evicted_members.remove(evicted)
+            heapq.heapify(evicted_members)
+        else:
+            return False
+        heapq.heappush(members, entry)
+        return True
+
+    def extend(self, items: Iterable[Any]) -> "TopK":
+        for item in items:
+            self.push(item)
+        return self
+
+    def __len__(self) -> int:
+        return min(self.k, len(self._heap) + (len(self._spare) if self.backfill else 0))
+
+    def items(self) -> List[Any]:
+        """Selected items, best first (backfilled from over-quota items when slots are left)."""
+        chosen = sorted(self._heap, reverse=True)
+        if self.backfill and len(chosen) < self.k:
+            # Slots are only left when no item was ever evicted, so the spares hold the best leftovers
+            chosen += sorted(self._spare, reverse=True)[:self.k - len(chosen)]
+            chosen.sort(reverse=True)
+        return [e.item for e in chosen]
+
+
+def top_k(items: Iterable[Any], k: int, quota: Quota = None, backfill: bool = True,
+          key: Callable[[Any], Tuple[Any, ...]] = priority_key,
+          group: Callable[[Any], Hashable] = _competitor) -> List[Any]:
+    """The `k` best items by `key`, at most `quota` per group, best first."""
+    return TopK(k, key=key, group=group, quota=quota, backfill=backfill).extend(items).items()
+
+
+def select_for_analysis(scored: Iterable[Dict[str, Any]], config: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    """Scored events the pipeline sends to the strategic analyst (`analyst_top_k`, `analyst_per_competitor`)."""
+    return TopK.from_config(config).extend(scored).items()
@@ -0,0 +1,21 @@
+"""Trend analysis building blocks used by the trend analysis agent."""
+
+from .bursts import BurstAlert, BurstConfig, BurstDetector, shared_detector
+from .charts import ChartRenderer, chart_spec, shared_renderer
+from .counters import FacetCounts, TrendCounts, event_facets
+from .history import TrendEventHistory
+from .registry import AnalyzerRegistry, AnalyzerRun
+from .snapshots import TrendDelta, TrendSnapshotStore, shared_snapshot_store
+from .stats import SeriesStats, TrendSeries, classify_trend, trend_statistics
+from .tags import TREND_TAGS, TrendTagger
+from .workspace import TrendWorkspace
+
+__all__ = [
+    "BurstAlert", "BurstConfig", "BurstDetector", "shared_detector",
+    "ChartRenderer", "chart_spec", "shared_renderer",
+    "FacetCounts", "TrendCounts", "event_facets", "TrendEventHistory",
+    "AnalyzerRegistry", "AnalyzerRun",
+    "TrendDelta", "TrendSnapshotStore", "shared_snapshot_store",
+    "SeriesStats", "TrendSeries", "classify_trend", "trend_statistics",
+    "TREND_TAGS", "TrendTagger", "TrendWorkspace",
+]
@@ -0,0 +1,210 @@
+"""Streaming burst detection per (competitor, event type, region).
+
+Each key keeps two exponentially decayed event counts: a fast one (hours)
+and a slow baseline (days). A decayed count divided by its mean lifetime is
+a rate estimate, so every event is an O(1) update. An event raises an alert
+when the fast rate exceeds the baseline rate by `ratio_threshold`, with at
+least `min_events` recent events behind it. Event ids already observed are
+not counted again, so re-fetched articles do not inflate the rates; they get
+their key's active alert back instead of losing it. Events whose date is
+missing or does not parse are skipped (and counted in `undated`) rather than
+stamped with the current time, which would pile a whole fetch onto one
+instant and read as a spike.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import OrderedDict, deque
+from dataclasses import asdict, dataclass, replace
+from datetime import datetime
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+
+from competitive_intel.utils.dates import shared_date_parser
+
+BurstKey = Tuple[str, str, str]  # (competitor, event_type, region)
+
+_URGENCY_LEVELS = ["low", "medium", "high", "immediate"]
+
+
+@dataclass(frozen=True)
+class BurstConfig:
+    half_life_hours: float = 6.0
+    baseline_half_life_hours: float = 168.0
+    ratio_threshold: float = 3.0
+    min_events: float = 3.0
+    # Prior baseline for new or quiet keys, events/day
+    baseline_floor_per_day: float = 0.5
+    # New alerts for a key are suppressed this long after one was raised
+    cooldown_hours: float = 6.0
+    max_seen_ids: int = 200_000
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> "BurstConfig":
+        cfg = config or {}
+        return cls(
+            half_life_hours=float(cfg.get("burst_half_life_hours", cls.half_life_hours)),
+            baseline_half_life_hours=float(cfg.get("burst_baseline_half_life_hours", cls.baseline_half_life_hours)),
+            ratio_threshold=float(cfg.get("burst_ratio_threshold", cls.ratio_threshold)),
+            min_events=float(cfg.get("burst_min_events", cls.min_events)),
+            baseline_floor_per_day=float(cfg.get("burst_baseline_floor_per_day", cls.baseline_floor_per_day)),
+            cooldown_hours=float(cfg.get("burst_cooldown_hours", cls.cooldown_hours)),
+        )
+
+
+@dataclass
+class BurstAlert:
+    competitor: str
+    event_type: str
+    region: str
+    at: datetime
+    rate_per_day: float
+    baseline_per_day: float
+    ratio: float
+    recent_events: float
+    severity: str  # "medium" | "high"
+    new: bool      # False while an already reported burst continues
+
+    @property
+    def impact_boost(self) -> float:
+        return 2.0 if self.severity == "high" else 1.0
+
+    def escalate_urgency(self, urgency: str) -> str:
+        level = _URGENCY_LEVELS.index(urgency) if urgency in _URGENCY_LEVELS else 1
+        level = len(_URGENCY_LEVELS) - 1 if self.severity == "high" else min(level + 1, len(_URGENCY_LEVELS) - 1)
+        return _URGENCY_LEVELS[level]
+
+    def to_dict(self) -> Dict[str, Any]:
+        out = asdict(self)
+        out['at'] = self.at.isoformat()
+        return out
+
+
+class BurstDetector:
+    """Decayed-rate burst detector; one `observe` call per event."""
+
+    def __init__(self, config: Optional[BurstConfig] = None, max_alerts: int = 1000) -> None:
+        self.config = config or BurstConfig()
+        self._fast_decay = math.log(2) / self.config.half_life_hours
+        self._slow_decay = math.log(2) / self.config.baseline_half_life_hours
+        # key -> [fast count, slow count, last event hour, last alert hour]
+        self._state: Dict[BurstKey, List[float]] = {}
+        self._seen: "OrderedDict[Any, None]" = OrderedDict()
+        # key -> alert of its ongoing burst; cleared by its first non-bursting event
+        self._active: Dict[BurstKey, BurstAlert] = {}
+        self.alerts: Deque[BurstAlert] = deque(maxlen=max_alerts)
+        self.observed = 0
+        self.undated = 0
+
+    def _is_duplicate(self, event_id: Any) -> bool:
+        if event_id is None:
+            return False
+        if event_id in self._seen:
+            return True
+        self._seen[event_id] = None
+        if len(self._seen) > self.config.max_seen_ids:
+            self._seen.popitem(last=False)
+        return False
+
+    def observe(self, competitor: str, event_type: str, region: str, ts: datetime,
+                event_id: Any = None) -> Optional[BurstAlert]:
+        """Record one event; returns an alert while its key is bursting."""
+        key = (competitor or "Unknown", event_type or "unknown", region or "")
+        if self._is_duplicate(event_id):
+            active = self._active.get(key)
+            return replace(active, new=False) if active is not None else None
+        cfg = self.config
+        hour = ts.timestamp() / 3600.0
+        st = self._state.get(key)
+        if st is None:
+            st = self._state[key] = [0.0, 0.0, hour, -math.inf]
+        dt = hour - st[2]
+        if dt >= 0:
+            st[0] *= math.exp(-self._fast_decay * dt)
+            st[1] *= math.exp(-self._slow_decay * dt)
+            st[2] = hour
+            fast_w = slow_w = 1.0
+        else:
+            # Late event: add its contribution already decayed to the key's clock
+            fast_w = math.exp(self._fast_decay * dt)
+            slow_w = math.exp(self._slow_decay * dt)
+        # Baseline before this event, so the event cannot mask its own burst
+        baseline = max(st[1] * self._slow_decay * 24.0, cfg.baseline_floor_per_day)
+        st[0] += fast_w
+        st[1] += slow_w
+        self.observed += 1
+
+        rate = st[0] * self._fast_decay * 24.0
+        ratio = rate / baseline
+        if st[0] < cfg.min_events or ratio < cfg.ratio_threshold:
+            self._active.pop(key, None)
+            return None
+        new = hour - st[3] >= cfg.cooldown_hours
+        if new:
+            st[3] = hour
+        alert = BurstAlert(
+            competitor=key[0], event_type=key[1], region=key[2], at=ts,
+            rate_per_day=round(rate, 2), baseline_per_day=round(baseline, 2), ratio=round(ratio, 2),
+            recent_events=round(st[0], 2),
+            severity="high" if ratio >= 2 * cfg.ratio_threshold else "medium",
+            new=new,
+        )
+        if new:
+            self.alerts.append(alert)
+        self._active[key] = alert
+        return alert
+
+    @staticmethod
+    def _timestamp(event: Dict[str, Any]) -> Optional[datetime]:
+        ts = event.get('timestamp') or event.get('date')
+        if ts is None or isinstance(ts, datetime):
+            return ts
+        return shared_date_parser().parse(ts)
+
+    def observe_event(self, event: Dict[str, Any], ts: Optional[datetime] = None) -> Optional[BurstAlert]:
+        """Observe one event dict; events without a usable date are skipped."""
+        ts = ts or self._timestamp(event)
+        if ts is None:
+            self.undated += 1
+            return None
+        return self.observe(
+            str(event.get('competitor') or ''),
+            str(event.get('event_type') or ''),
+            str(event.get('region') or ''),
+            ts,
+            event.get('id'),
+        )
+
+    def observe_batch(self, events: Iterable[Dict[str, Any]]) -> List[Optional[BurstAlert]]:
+        """Observe events in time order; alerts are returned in input order (None for undated events)."""
+        events = list(events)
+        stamps = [(self._timestamp(ev), i) for i, ev in enumerate(events)]
+        self.undated += sum(1 for ts, _ in stamps if ts is None)
+        stamped = sorted(((ts, i) for ts, i in stamps if ts is not None), key=lambda x: x[0].timestamp())
+        out: List[Optional[BurstAlert]] = [None] * len(events)
+        for ts, i in stamped:
+            out[i] = self.observe_event(events[i], ts)
+        return out
+
+    def rate(self, competitor: str, event_type: str, region: str = "", at: Optional[datetime] = None) -> float:
+        """Current fast rate for a key, events/day."""
+        st = self._state.get((competitor, event_type, region))
+        if st is None:
+            return 0.0
+        dt = max(0.0, (at or datetime.now()).timestamp() / 3600.0 - st[2])
+        return st[0] * math.exp(-self._fast_decay * dt) * self._fast_decay * 24.0
+
+    def __len__(self) -> int:
+        return len(self._state)
+
+
+_shared: Dict[BurstConfig, BurstDetector] = {}
+
+
+def shared_detector(config: Optional[BurstConfig] = None) -> BurstDetector:
+    """Process-wide detector per config, so rates carry over between pipeline runs."""
+    config = config or BurstConfig()
+    det = _shared.get(config)
+    if det is None:
+        det = _shared[config] = BurstDetector(config)
+    return det
@@ -0,0 +1,204 @@
+"""Trend dashboard charts, rendered off the request path and cached.
+
+`chart_spec` reduces trend insights to the four dashboard panels
+(significance, trend types, confidence histogram, brand involvement) as a
+plain dict; its hash keys the cache. `ChartRenderer` returns the spec as
+JSON right away and renders PNG/SVG on one background worker, importing
+matplotlib (Agg backend) only when a figure is first rendered. The UI and
+PDF exporters ask for the same snapshot and get the cached bytes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import threading
+from collections import Counter, OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from enum import Enum
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+
+FORMATS = ("png", "svg", "json")
+
+Rendered = Union[bytes, Dict[str, Any]]
+
+
+def _value(v: Any) -> Any:
+    return v.value if isinstance(v, Enum) else v
+
+
+def chart_spec(trends: Iterable[Any], bins: int = 10) -> Dict[str, Any]:
+    """Dashboard panels for trend insights (`MobileTrendInsight` objects or summary dicts)."""
+    significance: Counter = Counter()
+    types: Counter = Counter()
+    brands: Counter = Counter()
+    confidence = [0] * bins
+    n = 0
+    for t in trends:
+        n += 1
+        if isinstance(t, dict):
+            sig, kind, conf = t.get('significance'), t.get('type'), t.get('confidence')
+            affected = t.get('affected_brands') or list(t.get('brand_counts') or {})
+        else:
+            sig, kind, conf = (getattr(t, 'significance', None), getattr(t, 'trend_type', None),
+                               getattr(t, 'confidence_score', None))
+            affected = getattr(t, 'affected_brands', None) or []
+        significance[str(_value(sig) or 'Unknown')] += 1
+        types[str(_value(kind) or 'Unknown')] += 1
+        conf = min(max(float(conf or 0.0), 0.0), 1.0)
+        confidence[min(int(conf * bins), bins - 1)] += 1
+        brands.update(str(b) for b in affected if b)
+    return {
+        'trends': n,
+        'significance': dict(sorted(significance.items())),
+        'trend_types': dict(sorted(types.items())),
+        'confidence_histogram': {'edges': [i / bins for i in range(bins + 1)], 'counts': confidence},
+        'brands': dict(brands.most_common(10)),
+    }
+
+
+def spec_key(spec: Dict[str, Any]) -> str:
+    """Stable hash of a chart spec (the trend-snapshot key for the cache)."""
+    return hashlib.sha256(json.dumps(spec, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+
+
+def _draw(spec: Dict[str, Any], fmt: str) -> bytes:
+    # Imported on first render, on the worker thread; the object API avoids pyplot's global state
+    import matplotlib
+    matplotlib.use("Agg", force=False)
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(15, 12))
+    FigureCanvasAgg(fig)
+    fig.suptitle('Mobile Market Trend Analysis Dashboard', fontsize=16, fontweight='bold')
+    axes = fig.subplots(2, 2)
+
+    sig = spec['significance']
+    if sig:
+        axes[0, 0].pie(list(sig.values()), labels=list(sig), autopct='%1.1f%%')
+        axes[0, 0].set_title('Trend Significance Distribution')
+    else:
+        axes[0, 0].text(0.5, 0.5, 'No data', ha='center')
+        axes[0, 0].axis('off')
+
+    types = spec['trend_types']
+    axes[0, 1].bar(range(len(types)), list(types.values()))
+    axes[0, 1].set_xticks(range(len(types)))
+    axes[0, 1].set_xticklabels([t.replace(' ', '\n') for t in types], rotation=45)
+    axes[0, 1].set_title('Trend Categories')
+
+    hist = spec['confidence_histogram']
+    edges = hist['edges']
+    axes[1, 0].bar(edges[:-1], hist['counts'], width=edges[1] - edges[0], align='edge', alpha=0.7)
+    axes[1, 0].set_xlabel('Confidence Score')
+    axes[1, 0].set_ylabel('Frequency')
+    axes[1, 0].set_title('Trend Confidence Distribution')
+
+    brands = spec['brands']
+    axes[1, 1].bar(range(len(brands)), list(brands.values()))
+    axes[1, 1].set_xticks(range(len(brands)))
+    axes[1, 1].set_xticklabels(list(brands), rotation=45)
+    axes[1, 1].set_title('Brand Involvement in Trends')
+
+    fig.tight_layout()
+    buf = io.BytesIO()
+    fig.savefig(buf, format=fmt)
+    return buf.getvalue()
+
+
+class ChartRenderer:
+    """LRU cache of rendered dashboards with a single background render worker."""
+
+    def __init__(self, cache_size: int = 64) -> None:
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[Tuple[str, str], bytes]" = OrderedDict()
+        self._pending: Dict[Tuple[str, str], Future] = {}
+        self._lock = threading.Lock()
+        # One worker: matplotlib figures are not meant to be drawn concurrently
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="trend-charts")
+        self.renders = 0
+
+    def _store(self, key: Tuple[str, str], fut: Future) -> None:
+        with self._lock:
+            self._pending.pop(key, None)
+            if fut.exception() is None:
+                self._cache[key] = fut.result()
+                self._cache.move_to_end(key)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+    def _render(self, spec: Dict[str, Any], fmt: str) -> bytes:
+        self.renders += 1
+        return _draw(spec, fmt)
+
+    def submit(self, trends: Iterable[Any], fmt: str = "png") -> Tuple[str, Future]:
+        """Queue a render (no-op when cached or already queued); returns (key, future)."""
+        if fmt not in FORMATS:
+            raise ValueError(f"unsupported chart format: {fmt}")
+        spec = chart_spec(trends)
+        key = spec_key(spec)
+        fut: Future = Future()
+        if fmt == "json":
+            fut.set_result(spec)
+            return key, fut
+        with self._lock:
+            cached = self._cache.get((key, fmt))
+            if cached is not None:
+                self._cache.move_to_end((key, fmt))
+                fut.set_result(cached)
+                return key, fut
+            pending = self._pending.get((key, fmt))
+            if pending is not None:
+                return key, pending
+            fut = self._pool.submit(self._render, spec, fmt)
+            self._pending[(key, fmt)] = fut
+        fut.add_done_callback(lambda f, k=(key, fmt): self._store(k, f))
+        return key, fut
+
+    def render(self, trends: Iterable[Any], fmt: str = "png",
+               timeout: Optional[float] = 30.0) -> Optional[Rendered]:
+        """Rendered chart (bytes, or the spec dict for "json").
+
+        None when matplotlib is not installed or the render is still running
+        after `timeout` seconds.
+        """
+        _, fut = self.submit(trends, fmt)
+        try:
+            return fut.result(timeout=timeout)
+        except (ImportError, FutureTimeout):
+            return None
+
+    def get(self, key: str, fmt: str = "png", timeout: Optional[float] = 0.0) -> Optional[bytes]:
+        """Chart for a key from `submit`: cached bytes, or the queued render's result.
+
+        None when nothing was submitted for the key, the render failed, or it
+        is still running after `timeout` seconds.
+        """
+        with self._lock:
+            cached = self._cache.get((key, fmt))
+            pending = self._pending.get((key, fmt))
+        if cached is not None or pending is None:
+            return cached
+        try:
+            return pending.result(timeout=timeout)
+        except (ImportError, FutureTimeout):
+            return None
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=True)
+
+
+_shared: Optional[ChartRenderer] = None
+_shared_lock = threading.Lock()
+
+
+def shared_renderer() -> ChartRenderer:
+    """Process-wide renderer, so the pipeline, UI and PDF exporters share one cache."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = ChartRenderer()
+        return _shared
@@ -0,0 +1,124 @@
+"""Streaming counters behind the trend analyzers.
+
+Each event contributes to a few facets: all events, its event type, each of
+its trend tags (alone, with its event type, and paired with another tag)
+and its event type's launch month. Every facet keeps a Counter of brands,
+so both "how many" and "which brands" are answered without touching the
+events. `TrendEventHistory` keeps one `FacetCounts` per day plus running
+totals for the current window. The window is moved by adding or
+subtracting whole-day summaries.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from itertools import combinations
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+ANY = "*"
+Facet = Tuple[Hashable, ...]
+
+
+def event_facets(event_type: Any, tags: Sequence[str], month: Optional[int]) -> List[Facet]:
+    et = str(event_type) if event_type is not None else None
+    facets: List[Facet] = [(ANY, ())]
+    if et is not None:
+        facets.append((et, ()))
+    for t in tags:
+        facets.append((ANY, (t,)))
+        if et is not None:
+            facets.append((et, (t,)))
+    facets.extend((ANY, pair) for pair in combinations(sorted(tags), 2))
+    if et is not None and month is not None:
+        facets.append(("month", et, month))
+    return facets
+
+
+class FacetCounts:
+    """facet -> Counter of brand (None for events without a competitor)."""
+
+    __slots__ = ("data",)
+
+    def __init__(self) -> None:
+        self.data: Dict[Facet, Counter] = {}
+
+    def add(self, facets: Iterable[Facet], brand: Optional[str], n: int = 1) -> None:
+        data = self.data
+        for f in facets:
+            c = data.get(f)
+            if c is None:
+                c = data[f] = Counter()
+            c[brand] += n
+            if n < 0 and c[brand] <= 0:
+                del c[brand]
+                if not c:
+                    del data[f]
+
+    def merge(self, other: "FacetCounts", sign: int = 1) -> None:
+        data = self.data
+        for f, brands in other.data.items():
+            c = data.get(f)
+            if c is None:
+                c = data[f] = Counter()
+            for b, n in brands.items():
+                c[b] += sign * n
+                if c[b] <= 0:
+                    del c[b]
+            if not c:
+                del data[f]
+
+    def __bool__(self) -> bool:
+        return bool(self.data)
+
+
+class TrendCounts:
+    """Read-only view over one or more `FacetCounts` (window totals + boundary day).
+
+    The view reads the history's live totals; use it before adding more events.
+    """
+
+    def __init__(self, *parts: FacetCounts) -> None:
+        self._parts = parts
+
+    def _brands(self, facet: Facet) -> Counter:
+        out: Counter = Counter()
+        for p in self._parts:
+            c = p.data.get(facet)
+            if c:
+                out.update(c)
+        return out
+
+    @staticmethod
+    def _facet(event_type: Optional[str], tags: Sequence[str]) -> Facet:
+        return (event_type or ANY, tuple(sorted(tags)))
+
+    def count(self, event_type: Optional[str] = None, tags: Sequence[str] = ()) -> int:
+        return sum(self._brands(self._facet(event_type, tags)).values())
+
+    def brand_counts(self, event_type: Optional[str] = None, tags: Sequence[str] = ()) -> Counter:
+        """Events per brand (events without a competitor are left out)."""
+        c = self._brands(self._facet(event_type, tags))
+        c.pop(None, None)
+        return c
+
+    def brands(self, event_type: Optional[str] = None, tags: Sequence[str] = ()) -> List[str]:
+        """Distinct brands, most active first."""
+        return [b for b, _ in self.brand_counts(event_type, tags).most_common()]
+
+    def count_and_brands(self, event_type: Optional[str] = None, tags: Sequence[str] = ()) -> Tuple[int, List[str]]:
+        c = self._brands(self._facet(event_type, tags))
+        n = sum(c.values())
+        c.pop(None, None)
+        return n, [b for b, _ in c.most_common()]
+
+    def month_counts(self, event_type: str) -> Counter:
+        out: Counter = Counter()
+        for p in self._parts:
+            for f, brands in p.data.items():
+                if len(f) == 3 and f[0] == "month" and f[1] == event_type:
+                    out[f[2]] += sum(brands.values())
+        return out
+
+    @property
+    def total(self) -> int:
+        return self.count()
@@ -0,0 +1,199 @@
+"""Bounded, time-indexed event history for the trend analysis agent.
+
+Events are kept in per-day buckets whose day ordinals are held in a sorted
+list, so a time window is found with a binary search and only the buckets
+inside it are touched. Days older than the retention period are evicted.
+
+With a `keyer`, each day also keeps a `FacetCounts` summary and the history
+maintains running totals for the last requested window. Moving the window
+adds/subtracts whole-day summaries, and only the boundary day is counted
+event by event.
+"""
+
+from __future__ import annotations
+
+import bisect
+import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .counters import ANY, Facet, FacetCounts, TrendCounts
+from .stats import TrendSeries
+
+Event = Dict[str, Any]
+# keyer(event, timestamp) -> (facets, brand)
+Keyer = Callable[[Event, datetime.datetime], Tuple[Sequence[Facet], Optional[str]]]
+
+
+def _naive(ts: datetime.datetime) -> datetime.datetime:
+    # Trend windows are computed against naive local time
+    return ts.astimezone().replace(tzinfo=None) if ts.tzinfo is not None else ts
+
+
+class TrendEventHistory:
+    """Day-partitioned event store with window slicing, eviction and counters."""
+
+    def __init__(self, parse_date: Callable[[Any], Optional[datetime.datetime]], retention_days: int = 365,
+                 keyer: Optional[Keyer] = None) -> None:
+        # parse_date returns None for unparseable dates; those events are counted, not stored.
+        # A parser with `parse_many` (e.g. DateParser) parses whole batches in `extend`.
+        self.parse_date = parse_date
+        self.retention_days = retention_days
+        self.keyer = keyer
+        self._days: List[int] = []  # sorted day ordinals
+        self._buckets: Dict[int, List[Tuple[datetime.datetime, Event, Any]]] = {}
+        self._day_counts: Dict[int, FacetCounts] = {}
+        self._size = 0
+        self.undated = 0
+        # Running totals over full days >= _win_start (None until first counts())
+        self._win_start: Optional[int] = None
+        self._win_totals = FacetCounts()
+
+    def add(self, event: Event) -> bool:
+        """Store one event; False when its date could not be parsed."""
+        return self._insert(event, self.parse_date(event.get('date', '')))
+
+    def _insert(self, event: Event, ts: Optional[datetime.datetime]) -> bool:
+        if ts is None:
+            self.undated += 1
+            return False
+        ts = _naive(ts)
+        day = ts.toordinal()
+        bucket = self._buckets.get(day)
+        if bucket is None:
+            bucket = self._buckets[day] = []
+            bisect.insort(self._days, day)
+        keys = None
+        if self.keyer is not None:
+            keys = self.keyer(event, ts)
+            self._day_counts.setdefault(day, FacetCounts()).add(*keys)
+            if self._win_start is not None and day >= self._win_start:
+                self._win_totals.add(*keys)
+        bucket.append((ts, event, keys))
+        self._size += 1
+        return True
+
+    def extend(self, events: Iterable[Event]) -> int:
+        """Store events; returns how many had a parseable date."""
+        parse_many = getattr(self.parse_date, 'parse_many', None)
+        if parse_many is None:
+            return sum(self.add(event) for event in events)
+        events = list(events)
+        stamps = parse_many([ev.get('date', '') for ev in events]).tolist()
+        return sum(self._insert(ev, ts) for ev, ts in zip(events, stamps))
+
+    def evict_before(self, cutoff: datetime.datetime) -> int:
+        """Drop whole days before `cutoff`; returns the number of events removed."""
+        idx = bisect.bisect_left(self._days, cutoff.toordinal())
+        removed = 0
+        for day in self._days[:idx]:
+            removed += len(self._buckets.pop(day))
+            summary = self._day_counts.pop(day, None)
+            if summary is not None and self._win_start is not None and day >= self._win_start:
+                self._win_totals.merge(summary, -1)
+        del self._days[:idx]
+        self._size -= removed
+        return removed
+
+    def evict_expired(self, now: Optional[datetime.datetime] = None, keep_days: int = 0) -> int:
+        """Evict days outside max(retention, keep_days) before `now`."""
+        now = now or datetime.datetime.now()
+        days = max(self.retention_days, keep_days)
+        return self.evict_before(now - datetime.timedelta(days=days))
+
+    def window(self, days: int, now: Optional[datetime.datetime] = None) -> List[Event]:
+        """Events dated at or after `now - days`, oldest day first."""
+        now = now or datetime.datetime.now()
+        cutoff = now - datetime.timedelta(days=days)
+        start = bisect.bisect_left(self._days, cutoff.toordinal())
+        out: List[Event] = []
+        for day in self._days[start:]:
+            bucket = self._buckets[day]
+            if day == cutoff.toordinal():
+                # Only the boundary day needs a per-event check
+                out.extend(ev for ts, ev, _ in bucket if ts >= cutoff)
+            else:
+                out.extend(ev for _, ev, _ in bucket)
+        return out
+
+    def _move_window(self, start: int) -> None:
+        if self._win_start is None:
+            lo, hi, sign = start, None, 1
+        elif start > self._win_start:
+            lo, hi, sign = self._win_start, start, -1  # days leaving the window
+        elif start < self._win_start:
+            lo, hi, sign = start, self._win_start, 1  # window grew back
+        else:
+            return
+        i = bisect.bisect_left(self._days, lo)
+        j = len(self._days) if hi is None else bisect.bisect_left(self._days, hi)
+        for day in self._days[i:j]:
+            self._win_totals.merge(self._day_counts[day], sign)
+        self._win_start = start
+
+    def counts(self, days: int, now: Optional[datetime.datetime] = None) -> TrendCounts:
+        """Facet counts for events dated at or after `now - days` (needs a keyer).
+
+        Cost is proportional to the days the window moved by plus the events
+        on the boundary day, not to the events in the window.
+        """
+        if self.keyer is None:
+            raise ValueError("TrendEventHistory.counts() needs a keyer")
+        now = now or datetime.datetime.now()
+        cutoff = now - datetime.timedelta(days=days)
+        boundary_day = cutoff.toordinal()
+        self._move_window(boundary_day + 1)
+        boundary = FacetCounts()
+        for ts, _, keys in self._buckets.get(boundary_day, ()):
+            if ts >= cutoff:
+                boundary.add(*keys)
+        return TrendCounts(self._win_totals, boundary)
+
+    def daily_series(self, days: int, now: Optional[datetime.datetime] = None) -> TrendSeries:
+        """Per-day counts for the last `days` whole days up to `now` (needs a keyer).
+
+        One row per (facet, brand) seen in the window, plus an all-brands row
+        per facet; launch-month facets are left out.
+        """
+        if self.keyer is None:
+            raise ValueError("TrendEventHistory.daily_series() needs a keyer")
+        now = now or datetime.datetime.now()
+        last = now.toordinal()
+        first = last - days + 1
+        i = bisect.bisect_left(self._days, first)
+        j = bisect.bisect_right(self._days, last)
+        index: Dict[Any, int] = {}
+        rows: List[int] = []
+        cols: List[int] = []
+        vals: List[int] = []
+        for day in self._days[i:j]:
+            col = day - first
+            for facet, brands in self._day_counts[day].data.items():
+                if len(facet) != 2:
+                    continue
+                total = 0
+                for brand, n in brands.items():
+                    total += n
+                    if brand is not None:
+                        rows.append(index.setdefault((facet, brand), len(index)))
+                        cols.append(col)
+                        vals.append(n)
+                rows.append(index.setdefault((facet, ANY), len(index)))
+                cols.append(col)
+                vals.append(total)
+        matrix = np.zeros((len(index), days), dtype=np.int64)
+        matrix[rows, cols] = vals
+        return TrendSeries(list(index), matrix, datetime.date.fromordinal(first))
+
+    @property
+    def day_count(self) -> int:
+        return len(self._days)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Event]:
+        for day in self._days:
+            for _, ev, _ in self._buckets[day]:
+                yield ev
@@ -0,0 +1,94 @@
+"""Registry of trend analyzers, run concurrently over read-only inputs.
+
+An analyzer is any callable `(counts, series) -> list of insights`. The
+registry runs every registered analyzer in a thread pool, times each one
+and isolates failures: an analyzer that raises contributes no insights and
+its error is recorded in its `AnalyzerRun`. Results come back in
+registration order whatever order the analyzers finish in.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+Analyzer = Callable[..., List[Any]]
+
+
+@dataclass
+class AnalyzerRun:
+    name: str
+    seconds: float
+    insights: int
+    error: Optional[str] = None
+
+
+class AnalyzerRegistry:
+    """Named analyzers in registration order, with a lazily created worker pool."""
+
+    def __init__(self, max_workers: Optional[int] = None) -> None:
+        # max_workers=1 runs the analyzers in the calling thread
+        self.max_workers = max_workers
+        self._analyzers: Dict[str, Analyzer] = {}
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+
+    def register(self, name: str, analyzer: Optional[Analyzer] = None):
+        """Add or replace an analyzer; usable as a decorator when `analyzer` is omitted."""
+        if analyzer is None:
+            def decorator(fn: Analyzer) -> Analyzer:
+                self._analyzers[name] = fn
+                return fn
+            return decorator
+        self._analyzers[name] = analyzer
+        return analyzer
+
+    def unregister(self, name: str) -> None:
+        self._analyzers.pop(name, None)
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._analyzers)
+
+    def __len__(self) -> int:
+        return len(self._analyzers)
+
+    def _executor(self) -> ThreadPoolExecutor:
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers or min(8, max(1, len(self))),
+                                                thread_name_prefix="trend-analyzer")
+            return self._pool
+
+    @staticmethod
+    def _timed(name: str, analyzer: Analyzer, args: Tuple[Any, ...]) -> Tuple[List[Any], AnalyzerRun]:
+        t0 = time.perf_counter()
+        try:
+            out = list(analyzer(*args) or [])
+            error = None
+        except Exception as e:
+            out, error = [], f"{type(e).__name__}: {e}"
+        return out, AnalyzerRun(name, time.perf_counter() - t0, len(out), error)
+
+    def run(self, *args: Any) -> Tuple[List[Any], List[AnalyzerRun]]:
+        """Run every analyzer on `args`; returns (insights, one AnalyzerRun per analyzer)."""
+        items = list(self._analyzers.items())
+        if self.max_workers == 1 or len(items) <= 1:
+            done = [self._timed(name, fn, args) for name, fn in items]
+        else:
+            pool = self._executor()
+            futures = [pool.submit(self._timed, name, fn, args) for name, fn in items]
+            done = [f.result() for f in futures]
+        insights: List[Any] = []
+        for out, _ in done:
+            insights.extend(out)
+        return insights, [run for _, run in done]
+
+    def shutdown(self) -> None:
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True)
+                self._pool = None
@@ -0,0 +1,278 @@
+"""Persisted trend snapshots, one SQLite partition per run date, and their diff.
+
+Each run stores one row per (brand, trend): the trend's key (its id without
+the date suffix), title, direction, significance, confidence and a strength
+(the brand's events in the trend's facet, or the confidence when unknown).
+Brand `*` rows describe the market as a whole. `diff` joins two run dates in
+SQL and labels every (brand, trend) pair new, strengthening, weakening or
+disappeared, so reports show week-over-week changes without re-analysing raw
+events.
+"""
+
+from __future__ import annotations
+
+import datetime
+import re
+import sqlite3
+import threading
+from dataclasses import asdict, dataclass
+from enum import Enum
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from .counters import ANY
+
+DEFAULT_SNAPSHOT_PATH = "trend_snapshots.sqlite"
+
+STATUSES = ("new", "strengthening", "weakening", "disappeared")
+_SIG_RANK = {"Low": 1, "Medium": 2, "High": 3, "Critical": 4}
+_DATE_SUFFIX = re.compile(r"_\d{8}$")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS trend_snapshots (
+    run_date TEXT NOT NULL,
+    brand TEXT NOT NULL,
+    trend_key TEXT NOT NULL,
+    title TEXT,
+    trend_type TEXT,
+    direction TEXT,
+    significance TEXT,
+    confidence REAL,
+    strength REAL,
+    PRIMARY KEY (run_date, brand, trend_key)
+) WITHOUT ROWID
+"""
+
+DateLike = Union[datetime.date, str]
+
+
+@dataclass
+class SnapshotRow:
+    trend_key: str
+    brand: str
+    title: str
+    trend_type: str
+    direction: str
+    significance: str
+    confidence: float
+    strength: float
+
+
+@dataclass
+class TrendDelta:
+    brand: str
+    trend_key: str
+    title: str
+    status: str  # new | strengthening | weakening | disappeared | unchanged
+    strength_before: Optional[float]
+    strength_after: Optional[float]
+    significance_before: Optional[str]
+    significance_after: Optional[str]
+
+    @property
+    def change(self) -> Optional[float]:
+        """Relative strength change; None for new or disappeared trends."""
+        if self.strength_before is None or self.strength_after is None:
+            return None
+        return (self.strength_after - self.strength_before) / max(self.strength_before, 1e-9)
+
+    def to_dict(self) -> Dict[str, Any]:
+        out = asdict(self)
+        out['change'] = None if self.change is None else round(self.change, 3)
+        return out
+
+
+def _value(v: Any) -> Any:
+    return v.value if isinstance(v, Enum) else v
+
+
+def _iso(d: DateLike) -> str:
+    return d if isinstance(d, str) else d.isoformat()
+
+
+def _slug(text: str) -> str:
+    return re.sub(r"[^A-Z0-9]+", "_", text.upper()).strip("_") or "TREND"
+
+
+def snapshot_rows(insights: Iterable[Any]) -> List[SnapshotRow]:
+    """Rows for trend insights: `MobileTrendInsight` objects or the fallback summary dicts."""
+    rows: Dict[Tuple[str, str], SnapshotRow] = {}
+    for ins in insights:
+        if isinstance(ins, dict):
+            title = str(ins.get('title', ''))
+            key = _slug(title)
+            trend_type = str(ins.get('type', ''))
+            direction = str(ins.get('direction', ''))
+            significance = str(ins.get('significance', ''))
+            confidence = float(ins.get('confidence', 0.0) or 0.0)
+            data = ins.get('data') or {}
+            total = float(sum(v for v in data.values() if isinstance(v, (int, float))))
+            brand_events = dict(ins.get('brand_counts') or {})
+        else:
+            title = str(getattr(ins, 'title', ''))
+            key = _DATE_SUFFIX.sub("", str(getattr(ins, 'trend_id', '') or _slug(title)))
+            trend_type = str(_value(getattr(ins, 'trend_type', '')))
+            direction = str(_value(getattr(ins, 'direction', '')))
+            significance = str(_value(getattr(ins, 'significance', '')))
+            confidence = float(getattr(ins, 'confidence_score', 0.0) or 0.0)
+            stats = (getattr(ins, 'key_metrics', None) or {}).get('trend_statistics') or {}
+            total = float(stats.get('events') or 0.0)
+            brand_events = dict(stats.get('brand_events') or {})
+            for brand in getattr(ins, 'affected_brands', None) or []:
+                brand_events.setdefault(brand, None)
+
+        def add(brand: str, strength: Optional[float]) -> None:
+            rows[(brand, key)] = SnapshotRow(key, brand, title, trend_type, direction, significance,
+                                             confidence, float(strength) if strength else confidence)
+
+        add(ANY, total)
+        for brand, n in brand_events.items():
+            if brand:
+                add(str(brand), n)
+    return list(rows.values())
+
+
+def _status(before: Optional[float], after: Optional[float], sig_before: Optional[str],
+            sig_after: Optional[str], min_change: float) -> str:
+    if before is None:
+        return "new"
+    if after is None:
+        return "disappeared"
+    rank = _SIG_RANK.get(sig_after or "", 0) - _SIG_RANK.get(sig_before or "", 0)
+    if rank:
+        return "strengthening" if rank > 0 else "weakening"
+    change = (after - before) / max(before, 1e-9)
+    if change >= min_change:
+        return "strengthening"
+    if change <= -min_change:
+        return "weakening"
+    return "unchanged"
+
+
+class TrendSnapshotStore:
+    """SQLite-backed trend snapshots keyed by run date."""
+
+    def __init__(self, path: str = DEFAULT_SNAPSHOT_PATH) -> None:
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(_SCHEMA)
+
+    def save(self, insights: Iterable[Any], run_date: Optional[DateLike] = None) -> int:
+        """Replace the partition for `run_date` (default today); returns rows written."""
+        day = _iso(run_date or datetime.date.today())
+        rows = snapshot_rows(insights)
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM trend_snapshots WHERE run_date = ?", (day,))
+            self._conn.executemany(
+                "INSERT INTO trend_snapshots VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(day, r.brand, r.trend_key, r.title, r.trend_type, r.direction, r.significance,
+                  r.confidence, r.strength) for r in rows],
+            )
+        return len(rows)
+
+    def run_dates(self) -> List[datetime.date]:
+        with self._lock:
+            cur = self._conn.execute("SELECT DISTINCT run_date FROM trend_snapshots ORDER BY run_date")
+            return [datetime.date.fromisoformat(d) for (d,) in cur.fetchall()]
+
+    def load(self, run_date: DateLike) -> List[SnapshotRow]:
+        with self._lock:
+            cur = self._conn.execute(
+                "SELECT trend_key, brand, title, trend_type, direction, significance, confidence, strength "
+                "FROM trend_snapshots WHERE run_date = ? ORDER BY brand, trend_key", (_iso(run_date),))
+            return [SnapshotRow(*r) for r in cur.fetchall()]
+
+    def baseline_date(self, run_date: DateLike, days: int = 7) -> Optional[datetime.date]:
+        """Latest run at least `days` before `run_date`, else the latest earlier run."""
+        day = datetime.date.fromisoformat(_iso(run_date))
+        cutoff = (day - datetime.timedelta(days=days)).isoformat()
+        with self._lock:
+            found = self._conn.execute(
+                "SELECT MAX(run_date) FROM trend_snapshots WHERE run_date <= ?", (cutoff,)).fetchone()[0]
+            if found is None:
+                found = self._conn.execute(
+                    "SELECT MAX(run_date) FROM trend_snapshots WHERE run_date < ?", (day.isoformat(),)).fetchone()[0]
+        return datetime.date.fromisoformat(found) if found else None
+
+    def diff(self, run_date: Optional[DateLike] = None, baseline: Optional[DateLike] = None, days: int = 7,
+             min_change: float = 0.2, include_unchanged: bool = False) -> List[TrendDelta]:
+        """Changes per (brand, trend) from `baseline` (default: `days` earlier) to `run_date`.
+
+        A trend strengthens or weakens when its significance level moves, or
+        else when its strength changes by at least `min_change` (relative).
+        """
+        current = _iso(run_date or datetime.date.today())
+        base = baseline or self.baseline_date(current, days)
+        if base is None:
+            return []
+        base = _iso(base)
+        with self._lock:
+            cur = self._conn.execute(
+                """
+                SELECT c.brand, c.trend_key, c.title, b.strength, c.strength, b.significance, c.significance
+                FROM trend_snapshots c
+                LEFT JOIN trend_snapshots b
+                    ON b.run_date = ? AND b.brand = c.brand AND b.trend_key = c.trend_key
+                WHERE c.run_date = ?
+                UNION ALL
+                SELECT b.brand, b.trend_key, b.title, b.strength, NULL, b.significance, NULL
+                FROM trend_snapshots b
+                WHERE b.run_date = ? AND NOT EXISTS (
+                    SELECT 1 FROM trend_snapshots c
+                    WHERE c.run_date = ? AND c.brand = b.brand AND c.trend_key = b.trend_key)
+                ORDER BY 1, 2
+                """, (base, current, base, current))
+            rows = cur.fetchall()
+        out = []
+        for brand, key, title, before, after, sig_before, sig_after in rows:
+            status = _status(before, after, sig_before, sig_after, min_change)
+            if status != "unchanged" or include_unchanged:
+                out.append(TrendDelta(brand, key, title, status, before, after, sig_before, sig_after))
+        return out
+
+    def diff_by_brand(self, *args: Any, **kwargs: Any) -> Dict[str, Dict[str, List[TrendDelta]]]:
+        """`diff` grouped as brand -> status -> deltas (brand `*` is the whole market)."""
+        out: Dict[str, Dict[str, List[TrendDelta]]] = {}
+        for d in self.diff(*args, **kwargs):
+            out.setdefault(d.brand, {}).setdefault(d.status, []).append(d)
+        return out
+
+    def delta_report(self, run_date: Optional[DateLike] = None, days: int = 7,
+                     min_change: float = 0.2) -> Dict[str, Any]:
+        """Plain-dict deltas for the daily brief."""
+        current = _iso(run_date or datetime.date.today())
+        base = self.baseline_date(current, days)
+        brands: Dict[str, Dict[str, List[str]]] = {}
+        counts = {status: 0 for status in STATUSES}
+        for d in self.diff(current, base, min_change=min_change) if base else []:
+            label = "Market" if d.brand == ANY else d.brand
+            brands.setdefault(label, {}).setdefault(d.status, []).append(d.title)
+            counts[d.status] += 1
+        return {
+            'run_date': current,
+            'baseline_date': base.isoformat() if base else None,
+            'counts': counts,
+            'brands': brands,
+        }
+
+    def prune_before(self, run_date: DateLike) -> int:
+        """Delete partitions older than `run_date`; returns rows removed."""
+        with self._lock, self._conn:
+            cur = self._conn.execute("DELETE FROM trend_snapshots WHERE run_date < ?", (_iso(run_date),))
+            return cur.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_shared: Dict[str, TrendSnapshotStore] = {}
+
+
+def shared_snapshot_store(path: str = DEFAULT_SNAPSHOT_PATH) -> TrendSnapshotStore:
+    """Process-wide store per database path."""
+    store = _shared.get(path)
+    if store is None:
+        store = _shared[path] = TrendSnapshotStore(path)
+    return store
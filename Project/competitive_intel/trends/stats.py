@@ -0,0 +1,230 @@
+"""Vectorized trend statistics over many daily count series at once.
+
+Rows of a (series x days) count matrix are tested together with NumPy:
+least-squares slope, Mann-Kendall trend test (with tie correction), a
+z-score of the most recent days against a rolling baseline of earlier
+blocks, and a single CUSUM change point per series. The change point is
+tested with the distribution of the maximum CUSUM (the Kolmogorov bound of
+a Brownian bridge), not as if its split had been fixed in advance.
+`TrendSeries` keeps the matrix together with the (facet, brand) key of
+every row.
+"""
+
+from __future__ import annotations
+
+import datetime
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy import stats as sp_stats
+
+from .counters import ANY, Facet
+
+SeriesKey = Tuple[Facet, Optional[Hashable]]  # (facet, brand); brand ANY = all brands
+
+
+@dataclass
+class SeriesStats:
+    """Per-row statistics, each an array aligned with the input rows."""
+    total: np.ndarray
+    active_days: np.ndarray
+    slope: np.ndarray          # events/day, least squares
+    mk_s: np.ndarray           # Mann-Kendall S
+    mk_z: np.ndarray
+    mk_p: np.ndarray           # two-sided
+    mk_tau: np.ndarray         # Kendall's tau (S over the number of pairs)
+    recent_z: np.ndarray       # last block vs rolling baseline of earlier blocks
+    change_day: np.ndarray     # index of the first day after the change point, -1 if none
+    change_ratio: np.ndarray   # mean after / mean before
+    change_p: np.ndarray       # of the maximum CUSUM under "no change"
+
+    def row(self, i: int) -> Dict[str, Any]:
+        return {name: getattr(self, name)[i].item() for name in self.__dataclass_fields__}
+
+
+def _mann_kendall(y: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    m, n = y.shape
+    s = np.zeros(m, dtype=np.int64)
+    for lag in range(1, n):
+        s += np.sign(y[:, lag:] - y[:, :-lag]).sum(axis=1, dtype=np.int64)
+
+    # Tie correction: group equal values per row without a Python loop
+    var = np.full(m, n * (n - 1) * (2 * n + 5), dtype=np.float64)
+    if m and n:
+        flat = np.sort(y, axis=1).ravel()
+        starts = np.ones(flat.size, dtype=bool)
+        starts[1:] = flat[1:] != flat[:-1]
+        starts[::n] = True  # runs never cross rows
+        idx = np.flatnonzero(starts)
+        t = np.diff(np.append(idx, flat.size)).astype(np.float64)
+        var -= np.bincount(idx // n, weights=t * (t - 1) * (2 * t + 5), minlength=m)
+    var /= 18.0
+
+    z = np.zeros(m, dtype=np.float64)
+    ok = var > 0
+    z[ok] = (s[ok] - np.sign(s[ok])) / np.sqrt(var[ok])
+    p = 2 * sp_stats.norm.sf(np.abs(z))
+    return s, z, p
+
+
+def _recent_z(y: np.ndarray, block: int) -> np.ndarray:
+    m, n = y.shape
+    n_blocks = n // block
+    z = np.zeros(m, dtype=np.float64)
+    if n_blocks < 3:
+        return z
+    # Blocks end on the last day; leading days that do not fill a block are ignored
+    sums = y[:, n - n_blocks * block:].reshape(m, n_blocks, block).sum(axis=2)
+    baseline, recent = sums[:, :-1], sums[:, -1]
+    mu = baseline.mean(axis=1)
+    sd = baseline.std(axis=1, ddof=1)
+    # Poisson floor keeps sparse, flat baselines from producing huge z-scores
+    sd = np.maximum(sd, np.sqrt(np.maximum(mu, 1.0)))
+    return (recent - mu) / sd
+
+
+def _change_points(y: np.ndarray, min_segment: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    m, n = y.shape
+    day = np.full(m, -1, dtype=np.int64)
+    ratio = np.ones(m, dtype=np.float64)
+    p = np.ones(m, dtype=np.float64)
+    if n < 2 * min_segment:
+        return day, ratio, p
+    c1 = np.cumsum(y, axis=1)
+    c2 = np.cumsum(y * y, axis=1)
+    total, total2 = c1[:, -1:], c2[:, -1:]
+    k = np.arange(1, n + 1, dtype=np.float64)  # days in the left segment
+    cusum = np.abs(c1 - k * total / n)
+    cusum[:, :min_segment - 1] = -1
+    cusum[:, n - min_segment:] = -1
+    split = cusum.argmax(axis=1)  # last index of the left segment
+    rows = np.arange(m)
+    # The split is where the CUSUM peaks, so its significance is that of the peak:
+    # max |CUSUM| / (sd * sqrt(n)) tends to sup |Brownian bridge| (Kolmogorov distribution)
+    # under "no change". Peaks restricted to the middle make the bound conservative.
+    sd = np.sqrt(np.maximum(total2[:, 0] / n - (total[:, 0] / n) ** 2, 0) * n / (n - 1))
+    ok = sd > 0
+    p[ok] = sp_stats.kstwobign.sf(cusum[rows, split][ok] / (sd[ok] * np.sqrt(n)))
+    n1 = split + 1.0
+    s1 = c1[rows, split]
+    mu1, mu2 = s1 / n1, (total[:, 0] - s1) / (n - n1)
+    day[ok] = split[ok] + 1
+    ratio = (mu2 + 0.5) / (mu1 + 0.5)
+    return day, ratio, p
+
+
+def trend_statistics(y: np.ndarray, recent_days: int = 7, min_segment: int = 7) -> SeriesStats:
+    """Statistics for every row of a (series x days) count matrix."""
+    y = np.asarray(y, dtype=np.float64)
+    if y.ndim != 2:
+        raise ValueError("expected a (series x days) matrix")
+    m, n = y.shape
+    x = np.arange(n, dtype=np.float64) - (n - 1) / 2.0
+    sxx = float((x * x).sum())
+    slope = (y @ x) / sxx if sxx else np.zeros(m)
+    s, z, p = _mann_kendall(y)
+    pairs = n * (n - 1) / 2.0
+    day, ratio, cp = _change_points(y, min_segment)
+    return SeriesStats(
+        total=y.sum(axis=1),
+        active_days=(y > 0).sum(axis=1),
+        slope=slope,
+        mk_s=s,
+        mk_z=z,
+        mk_p=p,
+        mk_tau=s / pairs if pairs else np.zeros(m),
+        recent_z=_recent_z(y, recent_days),
+        change_day=day,
+        change_ratio=ratio,
+        change_p=cp,
+    )
+
+
+class TrendSeries:
+    """Daily count matrix for the trend window, one row per (facet, brand)."""
+
+    def __init__(self, keys: Sequence[SeriesKey], matrix: np.ndarray, first_day: datetime.date) -> None:
+        self.keys = list(keys)
+        self.index: Dict[SeriesKey, int] = {k: i for i, k in enumerate(self.keys)}
+        self.matrix = matrix
+        self.first_day = first_day
+        self._stats: Optional[SeriesStats] = None
+
+    @property
+    def days(self) -> int:
+        return self.matrix.shape[1]
+
+    @property
+    def last_day(self) -> datetime.date:
+        return self.first_day + datetime.timedelta(days=self.days - 1)
+
+    @property
+    def period_label(self) -> str:
+        return f"Last {self.days} days ({self.first_day:%Y-%m-%d} to {self.last_day:%Y-%m-%d})"
+
+    @property
+    def stats(self) -> SeriesStats:
+        if self._stats is None:
+            self._stats = trend_statistics(self.matrix)
+        return self._stats
+
+    def get(self, event_type: Optional[str] = None, tags: Sequence[str] = (),
+            brand: Hashable = ANY) -> Optional[Dict[str, Any]]:
+        """Statistics of one series, or None when it had no events."""
+        i = self.index.get(((event_type or ANY, tuple(sorted(tags))), brand))
+        return None if i is None else self.stats.row(i)
+
+    def brand_stats(self, event_type: Optional[str] = None, tags: Sequence[str] = ()) -> Dict[Hashable, Dict[str, Any]]:
+        facet = (event_type or ANY, tuple(sorted(tags)))
+        return {brand: self.stats.row(i) for (f, brand), i in self.index.items()
+                if f == facet and brand != ANY and brand is not None}
+
+    def change_date(self, row: Dict[str, Any]) -> Optional[datetime.date]:
+        if row['change_day'] < 0:
+            return None
+        return self.first_day + datetime.timedelta(days=int(row['change_day']))
+
+
+def classify_trend(row: Optional[Dict[str, Any]], alpha: float = 0.05,
+                   min_active_days: int = 10) -> Tuple[str, str, float]:
+    """(direction, significance, confidence) for one series' statistics.
+
+    Direction comes from the Mann-Kendall test, then from a significant
+    change point (a level shift), then from the recent z-score (Volatile).
+    Confidence is the evidence for that direction (1 - p of the strongest
+    test), scaled down for series active on fewer than `min_active_days`
+    days. A p-value is no evidence of stability, so a Stable series'
+    confidence comes from effect sizes instead: how close Kendall's tau is
+    to 0 and how ordinary the recent block is.
+    """
+    if row is None:
+        return "Stable", "Low", 0.0
+    p, cp, z = row['mk_p'], row['change_p'], abs(row['recent_z'])
+    if p < alpha:
+        direction = "Increasing" if row['mk_s'] > 0 else "Decreasing"
+    elif cp < alpha and row['change_day'] >= 0:
+        direction = "Increasing" if row['change_ratio'] > 1 else "Decreasing"
+    elif z >= 2:
+        direction = "Volatile"
+    else:
+        direction = "Stable"
+
+    best = min(p, cp)
+    if best < 0.001 and z >= 3:
+        significance = "Critical"
+    elif best < 0.01 or z >= 3:
+        significance = "High"
+    elif best < alpha or z >= 2:
+        significance = "Medium"
+    else:
+        significance = "Low"
+
+    if direction == "Volatile":
+        evidence = 1.0 - 2 * float(sp_stats.norm.sf(z))
+    elif direction == "Stable":
+        evidence = (1.0 - min(1.0, abs(row['mk_tau']))) * (1.0 - z / 2.0)
+    else:
+        evidence = 1.0 - best
+    coverage = min(1.0, row['active_days'] / float(min_active_days))
+    return direction, significance, round(evidence * coverage, 3)
@@ -0,0 +1,99 @@
+"""Single-pass trend keyword tagging shared by all trend analyzers.
+
+Every trend keyword group is a tag. One `KeywordMatcher` scan of an event's
+description sets all of its tags at once, encoded as a bitmask. Tags that
+need more than a substring (`5g` word boundaries, megapixel counts) are
+confirmed with their regex only when their keywords were found.
+Bitmasks are cached per (event id, description hash), so events that stay
+in the trend window are not re-tagged on the next call, while an event whose
+description was corrected or enriched under the same id is.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from competitive_intel.utils.keywords import KeywordMatcher
+
+# tag -> (keywords, confirming regex or None). Keywords reproduce the
+# case-insensitive patterns the analyzers used with `str.contains`.
+TREND_TAGS: Dict[str, Tuple[List[str], Optional[str]]] = {
+    "5g": (["5g"], r"\b5g\b"),
+    "ai": (["ai", "artificial intelligence", "machine learning", "ml", "neural", "smart"], None),
+    "performance": (["processor", "chipset", "performance", "speed", "ram", "storage", "benchmark"], None),
+    "price_up": (["increase", "raise", "higher"], None),
+    "price_down": (["decrease", "reduce", "lower", "discount"], None),
+    "premium": (["premium", "flagship", "ultra", "pro max"], None),
+    "camera": (["camera", "mp", "megapixel", "photo", "photography", "video", "lens", "zoom"], None),
+    "megapixel": (["mp", "megapixel"], r"\d+mp|\d+\s*megapixel"),
+    "video": (["video", "4k", "8k", "recording"], None),
+    "charging": (["fast charging", "wireless charging", "mah", "battery", "power", "charge"], None),
+    "display": (["display", "screen", "oled", "amoled", "refresh rate", "120hz", "90hz", "foldable"], None),
+    "partnership": (["partnership", "collaboration", "alliance", "deal"], None),
+}
+
+
+class TrendTagger:
+    """Tags event descriptions in one scan and caches the bitmasks per event id and description."""
+
+    def __init__(self, tags: Optional[Dict[str, Tuple[List[str], Optional[str]]]] = None,
+                 cache_size: int = 200_000) -> None:
+        tags = tags or TREND_TAGS
+        self.names: List[str] = list(tags)
+        self.bits: Dict[str, int] = {name: 1 << i for i, name in enumerate(self.names)}
+        self._matcher = KeywordMatcher({name: kws for name, (kws, _) in tags.items()})
+        self._confirm = {name: re.compile(rx) for name, (_, rx) in tags.items() if rx}
+        self._cache: "OrderedDict[Any, int]" = OrderedDict()
+        self.cache_size = cache_size
+        self.hits = 0
+        self.misses = 0
+
+    def tag_text(self, text: Any) -> int:
+        if not isinstance(text, str) or not text:
+            return 0
+        mask = 0
+        lowered = None
+        for name, n in self._matcher.group_hits(text).items():
+            if not n:
+                continue
+            rx = self._confirm.get(name)
+            if rx is not None:
+                lowered = lowered if lowered is not None else text.lower()
+                if not rx.search(lowered):
+                    continue
+            mask |= self.bits[name]
+        return mask
+
+    def tag_event(self, event: Dict[str, Any]) -> int:
+        desc = event.get('description')
+        if not isinstance(desc, str) or not desc:
+            return 0
+        event_id = event.get('id')
+        # str hashes are cached on the object, so this costs one hash per new description
+        key = (event_id, hash(desc)) if isinstance(event_id, (str, int)) and event_id != "" else desc
+        mask = self._cache.get(key)
+        if mask is not None:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return mask
+        self.misses += 1
+        mask = self.tag_text(desc)
+        self._cache[key] = mask
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return mask
+
+    def names_of(self, mask: int) -> List[str]:
+        return [name for name in self.names if mask & self.bits[name]]
+
+    def masks(self, events: Iterable[Dict[str, Any]]) -> np.ndarray:
+        return np.fromiter((self.tag_event(ev) for ev in events), dtype=np.int64)
+
+    def matrix(self, events: Sequence[Dict[str, Any]], names: Optional[Sequence[str]] = None) -> Dict[str, np.ndarray]:
+        """Boolean column per tag, aligned with `events`."""
+        masks = self.masks(events)
+        return {name: (masks & self.bits[name]) != 0 for name in (names or self.names)}
@@ -0,0 +1,217 @@
+"""Columnar trend workspace: the columns the trend analyzers read, as typed arrays.
+
+Only event_type, competitor, region (dictionary-encoded), date
+(`datetime64[us]`), impact (float64), the trend-tag bitmask and the
+description are projected; nested `entities`, `metadata` and
+`impact_breakdown` are left behind. Facet counts and daily series are
+computed with `np.bincount`, so the trend analyzers can run on a workspace
+as well as on the live history. The NumPy columns are the workspace's
+storage; neither pyarrow nor polars is a dependency. `to_arrow()` /
+`to_polars()` only convert the columns for callers that already use them.
+
+Building a workspace tags and date-parses every event, work the DataFrame
+path leaves to the analyzers, so a cold build is slower than
+`pd.DataFrame(events)` (see benchmarks/bench_trend_workspace.py); with a
+tagger and date parser that have seen the events it is about as fast.
+"""
+
+from __future__ import annotations
+
+import datetime
+from collections import Counter
+from itertools import combinations
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from competitive_intel.utils.dates import DateParser, shared_date_parser
+
+from .counters import ANY, FacetCounts, TrendCounts
+from .stats import TrendSeries
+from .tags import TrendTagger
+
+try:
+    import pyarrow as pa
+except Exception:
+    pa = None  # type: ignore
+
+try:
+    import polars as pl
+except Exception:
+    pl = None  # type: ignore
+
+_ORDINAL_1970 = datetime.date(1970, 1, 1).toordinal()
+
+
+def _encode(values: Iterable[Any]) -> Tuple[np.ndarray, List[Any]]:
+    lookup: Dict[Any, int] = {}
+    codes = np.fromiter((lookup.setdefault(v, len(lookup)) for v in values), dtype=np.int32)
+    return codes, list(lookup)
+
+
+def _impact(ev: Dict[str, Any]) -> float:
+    v = ev.get('impact', ev.get('impact_score'))
+    try:
+        return float(v) if v is not None else np.nan
+    except (TypeError, ValueError):
+        return np.nan
+
+
+class TrendWorkspace:
+    """Typed columns for a set of trend events (rows with unparseable dates are dropped)."""
+
+    COLUMNS = ("event_type", "competitor", "region", "date", "impact", "tags", "description")
+
+    def __init__(self, columns: Dict[str, np.ndarray], categories: Dict[str, List[Any]],
+                 tag_names: Sequence[str], undated: int = 0) -> None:
+        self.columns = columns
+        self.categories = categories
+        self.tag_names = list(tag_names)
+        self.undated = undated
+
+    @classmethod
+    def from_events(cls, events: Sequence[Dict[str, Any]], parser: Optional[DateParser] = None,
+                    tagger: Optional[TrendTagger] = None) -> "TrendWorkspace":
+        events = list(events)
+        parser = parser or shared_date_parser()
+        tagger = tagger or TrendTagger()
+        dates = parser.parse_many([ev.get('date', '') for ev in events])
+        keep = ~np.isnat(dates)
+        if not keep.all():
+            events = [ev for ev, k in zip(events, keep) if k]
+            dates = dates[keep]
+        et, et_cats = _encode(ev.get('event_type') for ev in events)
+        comp, comp_cats = _encode(ev.get('competitor') for ev in events)
+        region, region_cats = _encode(ev.get('region') for ev in events)
+        columns = {
+            "event_type": et,
+            "competitor": comp,
+            "region": region,
+            "date": dates,
+            "impact": np.fromiter((_impact(ev) for ev in events), dtype=np.float64, count=len(events)),
+            "tags": tagger.masks(events),
+            "description": np.array([ev.get('description') for ev in events], dtype=object),
+        }
+        categories = {"event_type": et_cats, "competitor": comp_cats, "region": region_cats}
+        return cls(columns, categories, tagger.names, undated=int((~keep).sum()))
+
+    def __len__(self) -> int:
+        return len(self.columns["date"])
+
+    @property
+    def nbytes(self) -> int:
+        """Array memory (the description strings themselves are shared with the events)."""
+        return sum(col.nbytes for col in self.columns.values())
+
+    def select(self, mask: np.ndarray) -> "TrendWorkspace":
+        return TrendWorkspace({k: v[mask] for k, v in self.columns.items()}, self.categories,
+                              self.tag_names, self.undated)
+
+    def window(self, days: int, now: Optional[datetime.datetime] = None) -> "TrendWorkspace":
+        """Rows dated at or after `now - days`."""
+        now = now or datetime.datetime.now()
+        cutoff = np.datetime64(now - datetime.timedelta(days=days), 'us')
+        return self.select(self.columns["date"] >= cutoff)
+
+    # ---- facets ----
+    def _facet_masks(self) -> List[Tuple[Tuple[str, Tuple[str, ...]], Optional[np.ndarray]]]:
+        """(facet, row mask) for every non-month facet; None means all rows."""
+        et = self.columns["event_type"]
+        tags = self.columns["tags"]
+        et_masks = [(str(name), et == code) for code, name in enumerate(self.categories["event_type"])
+                    if name is not None]
+        tag_masks = []
+        for i, name in enumerate(self.tag_names):
+            m = (tags & (1 << i)) != 0
+            if m.any():
+                tag_masks.append((name, m))
+        out: List[Tuple[Tuple[str, Tuple[str, ...]], Optional[np.ndarray]]] = [((ANY, ()), None)]
+        out.extend(((name, ()), m) for name, m in et_masks)
+        for tag, tm in tag_masks:
+            out.append(((ANY, (tag,)), tm))
+            out.extend(((name, (tag,)), tm & em) for name, em in et_masks)
+        for (t1, m1), (t2, m2) in combinations(sorted(tag_masks), 2):
+            out.append(((ANY, (t1, t2)), m1 & m2))
+        return out
+
+    def facet_counts(self) -> FacetCounts:
+        comp = self.columns["competitor"]
+        brands = self.categories["competitor"]
+        nb = len(brands)
+        fc = FacetCounts()
+        for facet, mask in self._facet_masks():
+            per_brand = np.bincount(comp if mask is None else comp[mask], minlength=nb)
+            nz = np.flatnonzero(per_brand)
+            if len(nz):
+                fc.data[facet] = Counter({brands[i]: int(per_brand[i]) for i in nz})
+        # Launch-month facets, as event_facets() builds them
+        months = self.columns["date"].astype('datetime64[M]').astype(np.int64) % 12 + 1
+        et = self.columns["event_type"]
+        for code, name in enumerate(self.categories["event_type"]):
+            if name is None:
+                continue
+            sel = et == code
+            per = np.bincount(months[sel] * nb + comp[sel], minlength=13 * nb).reshape(13, nb)
+            for month in np.flatnonzero(per.sum(axis=1)):
+                row = per[month]
+                fc.data[("month", str(name), int(month))] = Counter(
+                    {brands[i]: int(row[i]) for i in np.flatnonzero(row)})
+        return fc
+
+    def counts(self) -> TrendCounts:
+        return TrendCounts(self.facet_counts())
+
+    def daily_series(self, days: int, now: Optional[datetime.datetime] = None) -> TrendSeries:
+        """Same rows as `TrendEventHistory.daily_series` for the last `days` whole days."""
+        now = now or datetime.datetime.now()
+        last = now.toordinal()
+        first = last - days + 1
+        day = self.columns["date"].astype('datetime64[D]').astype(np.int64) + _ORDINAL_1970 - first
+        inside = (day >= 0) & (day < days)
+        comp = self.columns["competitor"]
+        brands = self.categories["competitor"]
+        nb = len(brands)
+        keys: List[Any] = []
+        rows: List[np.ndarray] = []
+        for facet, mask in self._facet_masks():
+            sel = inside if mask is None else inside & mask
+            if not sel.any():
+                continue
+            d, b = day[sel], comp[sel]
+            grid = np.bincount(b * days + d, minlength=nb * days).reshape(nb, days)
+            for i in np.flatnonzero(grid.any(axis=1)):
+                if brands[i] is not None:
+                    keys.append((facet, brands[i]))
+                    rows.append(grid[i])
+            keys.append((facet, ANY))
+            rows.append(grid.sum(axis=0))
+        matrix = np.vstack(rows) if rows else np.zeros((0, days), dtype=np.int64)
+        return TrendSeries(keys, matrix, datetime.date.fromordinal(first))
+
+    # ---- optional backends ----
+    def to_arrow(self):
+        """pyarrow Table with dictionary-encoded string columns (needs pyarrow)."""
+        if pa is None:
+            raise ImportError("pyarrow is not installed; pip install pyarrow")
+        cols = self.columns
+        arrays = {}
+        for name in ("event_type", "competitor", "region"):
+            cats = [None if c is None else str(c) for c in self.categories[name]]
+            arrays[name] = pa.DictionaryArray.from_arrays(pa.array(cols[name]), pa.array(cats, type=pa.string()))
+        arrays["date"] = pa.array(cols["date"])
+        arrays["impact"] = pa.array(cols["impact"], from_pandas=True)
+        arrays["tags"] = pa.array(cols["tags"])
+        arrays["description"] = pa.array(cols["description"].tolist(), type=pa.string())
+        return pa.table(arrays)
+
+    def to_polars(self):
+        """polars DataFrame of the same columns (needs polars)."""
+        if pl is None:
+            raise ImportError("polars is not installed; pip install polars")
+        if pa is not None:
+            return pl.from_arrow(self.to_arrow())
+        cols = self.columns
+        data = {name: [self.categories[name][c] for c in cols[name]] for name in ("event_type", "competitor", "region")}
+        data.update(date=cols["date"], impact=cols["impact"], tags=cols["tags"],
+                    description=cols["description"].tolist())
+        return pl.DataFrame(data)
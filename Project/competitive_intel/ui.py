@@ -12,10 +12,14 @@ if _project_root not in sys.path:
     sys.path.insert(0, _project_root)
 
 from competitive_intel.langgraph_pipeline import run_with_langgraph
+from competitive_intel.agents.impact_scoring_agent import impact_reasoning
 from competitive_intel.agents.report_generator_agent import ReportGeneratorInterface
+from competitive_intel.scoring.rescoring import shared_rescoring_service
+from competitive_intel.trends.charts import chart_spec, shared_renderer
 
 st.set_page_config(page_title="Competitive Intelligence Monitor", layout="wide")
 rg = ReportGeneratorInterface()
+trend_charts = shared_renderer()
 
 # Custom CSS for a professional, readable theme and components
 st.markdown(
@@ -140,10 +144,32 @@ def render_dashboard(data: Dict[str, Any]) -> None:
                         st.dataframe(pd.DataFrame(rows), use_container_width=True)
             except Exception:
                 st.write("Trends available (objects)")
+            # Dashboard the pipeline queued on the background renderer; never wait for it here
+            chart_key = (data.get('daily_report') or {}).get('trend_chart')
+            chart = trend_charts.get(chart_key, timeout=0) if chart_key else None
+            if chart:
+                st.image(chart, use_container_width=True)
+            else:
+                spec = chart_spec(trends)
+                if spec.get('brands'):
+                    st.bar_chart(pd.Series(spec['brands'], name='trends'))
+                if chart_key:
+                    st.caption("Full trend dashboard is still rendering; it appears on the next refresh.")
 
     with tab_impact:
         st.markdown("<div class='section-title'>Impact Scoring</div>", unsafe_allow_html=True)
-        st.dataframe(data.get('scored', []), use_container_width=True)
+        # Events whose recency bucket changed since the run are re-scored in place
+        scored = data.get('scored', [])
+        shared_rescoring_service().apply(scored)
+        # Highest-impact rows first; reasoning text is rendered only for the rows shown
+        limit = len(scored)
+        if len(scored) > 50:
+            limit = st.slider("Events shown", 10, len(scored), 50)
+            st.caption(f"Top {limit} of {len(scored)} scored events by impact")
+        shown = sorted(scored, key=lambda ev: ev.get('impact') or 0.0, reverse=True)[:limit]
+        st.dataframe([{**{k: v for k, v in ev.items() if k != 'impact_explanation'},
+                       'impact_reasoning': impact_reasoning(ev)} for ev in shown],
+                     use_container_width=True)
 
     with tab_strategy:
         st.markdown("<div class='section-title'>Strategic Analysis</div>", unsafe_allow_html=True)
@@ -310,6 +336,16 @@ def render_dashboard(data: Dict[str, Any]) -> None:
         st.markdown("<div class='section-title'>Companies</div>", unsafe_allow_html=True)
         chips = " ".join([f"<span class='pill pill-blue'>{c}</span>" for c in summary.get('companies_mentioned', [])])
         st.markdown(f"<div class='company-chips'>{chips}</div>", unsafe_allow_html=True)
+        deltas = daily.get('trend_deltas') or {}
+        if deltas.get('baseline_date'):
+            st.markdown(f"<div class='section-title'>Trend Changes since {deltas['baseline_date']}</div>", unsafe_allow_html=True)
+            delta_rows = [{'brand': brand, 'change': status, 'trends': ', '.join(titles)}
+                          for brand, changes in sorted(deltas.get('brands', {}).items())
+                          for status, titles in changes.items()]
+            if delta_rows:
+                st.dataframe(pd.DataFrame(delta_rows), use_container_width=True)
+            else:
+                st.write("No material trend changes.")
 
         try:
             # Provide combined Daily Brief + Strategy (exec summary) + Actions as a PDF
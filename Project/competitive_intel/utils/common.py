@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Any, Dict
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from .dates import shared_date_parser
 
 
 def coerce_datetime(value: Any) -> datetime:
@@ -15,30 +17,89 @@ def coerce_datetime(value: Any) -> datetime:
     return datetime.now()
 
 
+COMPETITOR_CANON = {
+    'oppo': 'OPPO',
+    'vivo': 'vivo',
+    'xiami': 'Xiaomi',
+    'xiaomi': 'Xiaomi',
+    'samsung': 'Samsung',
+    'apple': 'Apple',
+    'huawei': 'Huawei',
+    'oneplus': 'OnePlus',
+    'nothing': 'Nothing',
+    'google': 'Google'
+}
+
+
 def normalize_event_dict(raw: Dict[str, Any]) -> Dict[str, Any]:
-    """Map heterogeneous keys to a common structure used across agents."""
+    """Map heterogeneous keys to a common structure used across agents.
+
+    `date` is parsed with the shared date parser and is None when the item has
+    no date or it cannot be parsed; `date_raw` keeps the value as given.
+    """
     comp = raw.get('competitor') or raw.get('company') or raw.get('brand') or 'Unknown'
-    comp_map = {
-        'oppo': 'OPPO',
-        'vivo': 'vivo',
-        'xiami': 'Xiaomi',
-        'xiaomi': 'Xiaomi',
-        'samsung': 'Samsung',
-        'apple': 'Apple',
-        'huawei': 'Huawei',
-        'oneplus': 'OnePlus',
-        'nothing': 'Nothing',
-        'google': 'Google'
-    }
-    comp_canon = comp_map.get(str(comp).lower(), comp)
+    comp_canon = COMPETITOR_CANON.get(str(comp).lower(), comp)
+    raw_date = raw.get('date') or raw.get('published') or raw.get('timestamp')
     return {
         'id': raw.get('id') or raw.get('event_id') or raw.get('link') or raw.get('title'),
         'competitor': comp_canon,
         'event_type': raw.get('event_type') or raw.get('content_type') or 'unknown',
         'description': raw.get('description') or raw.get('summary') or raw.get('raw_text') or raw.get('title') or '',
-        'date': coerce_datetime(raw.get('date') or raw.get('published') or raw.get('timestamp')),
+        'date': raw_date if isinstance(raw_date, datetime) or raw_date is None else shared_date_parser().parse(raw_date),
+        'date_raw': raw_date,
         'source': raw.get('source') or raw.get('source_url') or raw.get('link') or '',
         'region': raw.get('region') or '',
     }
 
 
+DEMO_TEMPLATES = [
+    ("product_launch", "launch", "announces new flagship with AI camera and 5G"),
+    ("pricing_change", "pricing", "introduces price cuts across key models"),
+    ("partnership", "partnership", "signs operator partnership in {region}"),
+    ("marketing_campaign", "marketing", "launches regional marketing push focusing on camera"),
+    ("expansion", "expansion", "expands retail footprint in {region}")
+]
+
+
+def generate_demo_items(competitors: List[str], regions: List[str], max_items: int = 10, days: int = 7,
+                        now: Optional[datetime] = None,
+                        spikes: Optional[List[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
+    """Synthetic raw articles used when retrieval returns nothing (offline demo, benchmarks).
+
+    Each entry of `spikes` ({'competitor', 'event_type', 'region', 'count', 'hours'})
+    adds `count` articles of that kind spread over the last `hours` hours, e.g. to
+    exercise burst detection.
+    """
+    now = now or datetime.now()
+    raw_items = []
+    for idx, comp in enumerate(competitors):
+        for i in range(max_items):
+            region = regions[(idx + i) % len(regions)]
+            t = DEMO_TEMPLATES[(idx + i) % len(DEMO_TEMPLATES)]
+            age_hours = max(0, min(days*24 - 1, (idx + i) * 6))
+            raw_items.append({
+                'title': f"{comp} {t[1].replace('_',' ')} in {region}",
+                'summary': t[2].format(region=region),
+                'company': comp,
+                'region': region,
+                'published': (now - timedelta(hours=age_hours)).isoformat(),
+                'source': f"{comp} News",
+                'link': f"https://example.com/{comp.lower()}-{t[0]}-{region.lower()}"
+            })
+    templates = {t[0]: t for t in DEMO_TEMPLATES}
+    for spike in spikes or []:
+        comp, region = spike['competitor'], spike['region']
+        t = templates.get(spike.get('event_type', ''), DEMO_TEMPLATES[1])
+        count = int(spike.get('count', 10))
+        hours = float(spike.get('hours', 6))
+        for i in range(count):
+            raw_items.append({
+                'title': f"{comp} {t[1].replace('_',' ')} in {region}",
+                'summary': t[2].format(region=region),
+                'company': comp,
+                'region': region,
+                'published': (now - timedelta(hours=hours * i / max(count, 1))).isoformat(),
+                'source': f"{comp} News",
+                'link': f"https://example.com/{comp.lower()}-{t[0]}-{region.lower()}-spike-{i}"
+            })
+    return raw_items
@@ -0,0 +1,137 @@
+"""Memoized, vectorized date parsing shared by the trend agent and impact scorer.
+
+Distinct strings are parsed once, format by format over the whole batch with
+`pd.to_datetime`, and cached as naive local `datetime64[us]` values. Strings
+no format accepts are tried as ISO 8601 and then as RFC 822 (the
+"Mon, 12 Oct 2026 04:00:00 GMT" form RSS feeds use). The rest become NaT and
+are recorded in `failures` instead of being replaced with "now".
+"""
+
+from __future__ import annotations
+
+import datetime
+import email.utils
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+# Tried in order; the same order the trend agent used with strptime
+DATE_FORMATS = ['%Y-%m-%d', '%d/%m/%Y', '%m/%d/%Y', '%Y-%m-%d %H:%M:%S']
+
+NaT = np.datetime64('NaT', 'us')
+_NAT_INT = int(NaT.astype(np.int64))
+_EPOCH = datetime.datetime(1970, 1, 1)
+_US = datetime.timedelta(microseconds=1)
+
+
+def _naive(ts: datetime.datetime) -> datetime.datetime:
+    # Aware values are converted to naive local time, like the trend windows
+    return ts.astimezone().replace(tzinfo=None) if ts.tzinfo is not None else ts
+
+
+class DateParser:
+    """Parses date values to `datetime64[us]`, caching every distinct string."""
+
+    def __init__(self, formats: Sequence[str] = DATE_FORMATS, iso_fallback: bool = True,
+                 max_cache: int = 500_000, rfc822_fallback: bool = True) -> None:
+        self.formats = list(formats)
+        self.iso_fallback = iso_fallback
+        self.rfc822_fallback = rfc822_fallback
+        self.max_cache = max_cache
+        self._cache: Dict[str, int] = {}
+        self.failures: Counter = Counter()
+        self.hits = 0
+        self.misses = 0
+
+    def _parse_strings(self, strings: List[str]) -> np.ndarray:
+        out = np.full(len(strings), NaT)
+        todo = np.arange(len(strings))
+        for fmt in self.formats:
+            if not len(todo):
+                break
+            parsed = pd.to_datetime(pd.Index([strings[i] for i in todo]), format=fmt, errors='coerce')
+            ok = ~parsed.isna()
+            out[todo[ok]] = parsed[ok].values.astype('datetime64[us]')
+            todo = todo[~ok]
+        if self.iso_fallback:
+            left = []
+            for i in todo:
+                try:
+                    out[i] = np.datetime64(_naive(datetime.datetime.fromisoformat(strings[i].strip().replace('Z', '+00:00'))), 'us')
+                except ValueError:
+                    left.append(i)
+            todo = left
+        if self.rfc822_fallback:
+            for i in todo:
+                try:
+                    out[i] = np.datetime64(_naive(email.utils.parsedate_to_datetime(strings[i].strip())), 'us')
+                except (TypeError, ValueError, IndexError):
+                    pass
+        return out
+
+    def parse_many(self, values: Iterable[Any]) -> np.ndarray:
+        """One `datetime64[us]` per value; NaT where the value is not a date."""
+        values = list(values)
+        # Microseconds since the epoch; the cache holds these ints (NaT for bad strings)
+        out = [_NAT_INT] * len(values)
+        pending: Dict[str, List[int]] = {}
+        cache = self._cache
+        failures = self.failures
+        hits = 0
+        for i, v in enumerate(values):
+            if isinstance(v, str):
+                hit = cache.get(v)
+                if hit is None:
+                    pending.setdefault(v, []).append(i)
+                    continue
+                hits += 1
+                out[i] = hit
+                if hit == _NAT_INT:
+                    failures[v] += 1
+            elif isinstance(v, datetime.datetime):
+                out[i] = (_naive(v) - _EPOCH) // _US
+            elif isinstance(v, datetime.date):
+                out[i] = (datetime.datetime(v.year, v.month, v.day) - _EPOCH) // _US
+            elif isinstance(v, np.datetime64):
+                out[i] = int(v.astype('datetime64[us]').astype(np.int64))
+            else:
+                failures[type(v).__name__] += 1
+        self.hits += hits
+        if pending:
+            strings = list(pending)
+            self.misses += sum(len(idx) for idx in pending.values())
+            parsed = self._parse_strings(strings).view(np.int64).tolist()
+            if len(cache) + len(strings) > self.max_cache:
+                cache.clear()
+            for s, ts in zip(strings, parsed):
+                cache[s] = ts
+                idx = pending[s]
+                for i in idx:
+                    out[i] = ts
+                if ts == _NAT_INT:
+                    failures[s] += len(idx)
+        return np.array(out, dtype=np.int64).view('datetime64[us]')
+
+    def parse(self, value: Any) -> Optional[datetime.datetime]:
+        """Single value as a naive datetime, or None when it cannot be parsed."""
+        ts = self.parse_many([value])[0]
+        return None if np.isnat(ts) else ts.item()
+
+    __call__ = parse
+
+    @property
+    def failure_count(self) -> int:
+        return sum(self.failures.values())
+
+
+_shared: Optional[DateParser] = None
+
+
+def shared_date_parser() -> DateParser:
+    """Process-wide parser, so the trend agent and impact scorer share one cache."""
+    global _shared
+    if _shared is None:
+        _shared = DateParser()
+    return _shared
@@ -0,0 +1,94 @@
+"""Normalized event store shared by the pipeline stages.
+
+The normalize stage canonicalizes competitor names, dates, ids and sources
+once; classification, trends and scoring read those fields from here instead
+of re-deriving them per stage.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from .common import normalize_event_dict
+from .language import detect_language
+
+
+class NormalizedEvent(dict):
+    """A `normalize_event_dict` record plus the text fields classification needs.
+
+    `language` is taken from the raw item (native-language feeds set it) or
+    detected from the text's script.
+    """
+
+    @classmethod
+    def from_raw(cls, raw: Dict[str, Any]) -> "NormalizedEvent":
+        rec = cls(normalize_event_dict(raw))
+        rec['title'] = raw.get('title') or ''
+        rec['link'] = raw.get('link') or ''
+        rec['text'] = (rec['description'] or f"{rec['title']}. {raw.get('summary','') or raw.get('description','')}").strip()
+        rec['language'] = raw.get('language') or detect_language(f"{rec['title']} {rec['text']}")
+        return rec
+
+
+def _content_suffix(rec: NormalizedEvent) -> str:
+    # The raw date string, not the parsed one: it is the same on every fetch
+    raw_date = rec.get('date_raw')
+    content = f"{rec.get('description') or rec.get('text') or ''}\x1f{'' if raw_date is None else raw_date}"
+    return hashlib.blake2b(content.encode('utf-8'), digest_size=4).hexdigest()
+
+
+class NormalizedEventStore:
+    """Insertion-ordered normalized events keyed by a unique event id.
+
+    An item whose id is taken keeps the first record when its description and
+    raw date match it (an exact duplicate is dropped). Otherwise its id gets a
+    suffix hashed from its description and raw date rather than its position
+    in the feed, so a re-fetched article keeps its id.
+    """
+
+    def __init__(self) -> None:
+        self._events: Dict[str, NormalizedEvent] = {}
+        self.duplicates = 0
+
+    def add(self, raw: Dict[str, Any]) -> str:
+        """Store one raw item; returns its id (the first record's id for an exact duplicate)."""
+        rec = NormalizedEvent.from_raw(raw)
+        key = str(rec.get('id') or f"E{len(self._events) + 1:06d}")
+        first = self._events.get(key)
+        if first is not None:
+            suffix = _content_suffix(rec)
+            if _content_suffix(first) == suffix:
+                self.duplicates += 1
+                return key
+            # Distinct items can share a link/title; keep them apart
+            key = f"{key}#{suffix}"
+            if key in self._events:
+                self.duplicates += 1
+                return key
+        rec['id'] = key
+        self._events[key] = rec
+        return key
+
+    def ingest(self, items: Iterable[Dict[str, Any]]) -> List[str]:
+        return [self.add(it) for it in items]
+
+    def get(self, key: Any, default: Optional[NormalizedEvent] = None) -> Optional[NormalizedEvent]:
+        return self._events.get(key, default)
+
+    def records(self, keys: Optional[Iterable[str]] = None) -> List[NormalizedEvent]:
+        if keys is None:
+            return list(self._events.values())
+        return [self._events[k] for k in keys]
+
+    def __getitem__(self, key: str) -> NormalizedEvent:
+        return self._events[key]
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._events
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def __iter__(self) -> Iterator[NormalizedEvent]:
+        return iter(self._events.values())
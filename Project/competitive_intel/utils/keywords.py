@@ -0,0 +1,93 @@
+"""Single-pass keyword matching over several keyword groups.
+
+All keywords are compiled into one alternation, so a text is scanned once
+instead of once per keyword (or once per group). Matching keeps the plain
+substring semantics of `keyword in text.lower()`. `hit_matrix` matches a whole
+column of texts and returns the group hits as a boolean matrix.
+"""
+
+from __future__ import annotations
+
+import bisect
+import itertools
+import re
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Sequence, Set
+
+import numpy as np
+
+
+class KeywordMatcher:
+    """Match many keyword groups in one scan of the (lower-cased) text."""
+
+    def __init__(self, groups: Mapping[str, Iterable[str]]) -> None:
+        self.groups: Dict[str, List[str]] = {g: [k.lower() for k in kws] for g, kws in groups.items()}
+        keywords = sorted({k for kws in self.groups.values() for k in kws}, key=len, reverse=True)
+        self._keyword_groups: Dict[str, Set[str]] = {k: set() for k in keywords}
+        for g, kws in self.groups.items():
+            for k in kws:
+                self._keyword_groups[k].add(g)
+        # A match for "launch in" also implies "launch"; expand matches to every
+        # keyword contained in the matched one so overlapping keywords still count.
+        self._implied: Dict[str, FrozenSet[str]] = {
+            k: frozenset(o for o in keywords if o in k) for k in keywords
+        }
+        # Zero-width lookahead finds a match starting at every position; the
+        # longest-first ordering makes the captured keyword the longest there.
+        alternation = "|".join(re.escape(k) for k in keywords)
+        self._pattern = re.compile(f"(?=({alternation}))") if keywords else None
+
+    def matched_keywords(self, text: str) -> Set[str]:
+        if not text or self._pattern is None:
+            return set()
+        found: Set[str] = set()
+        for m in self._pattern.finditer(text.lower()):
+            found.update(self._implied[m.group(1)])
+        return found
+
+    def group_hits(self, text: str) -> Dict[str, int]:
+        """Number of distinct keywords hit per group (every group is present)."""
+        hits = {g: 0 for g in self.groups}
+        for k in self.matched_keywords(text):
+            for g in self._keyword_groups[k]:
+                hits[g] += 1
+        return hits
+
+    def group_scores(self, text: str) -> Dict[str, float]:
+        """Share of each group's keywords found in the text (0-1)."""
+        hits = self.group_hits(text)
+        return {g: (hits[g] / len(kws) if kws else 0.0) for g, kws in self.groups.items()}
+
+    def hit_matrix(self, texts: Sequence[Any]) -> np.ndarray:
+        """Boolean (len(texts), len(groups)) matrix: row i, column g is set when
+        text i contains any keyword of group g. Columns follow `self.groups`;
+        non-strings hit nothing.
+
+        The distinct lower-cased texts are joined into one string and each
+        keyword is found with `str.find`, jumping to the next text after a hit,
+        so the work grows with texts hit rather than texts times keywords.
+        """
+        names = list(self.groups)
+        col = {g: j for j, g in enumerate(names)}
+        lookup: Dict[str, int] = {}
+        codes = np.fromiter((lookup.setdefault(t, len(lookup)) if isinstance(t, str) else -1 for t in texts),
+                            dtype=np.int64, count=len(texts))
+        distinct = np.zeros((len(lookup) + 1, len(names)), dtype=bool)  # last row: non-strings
+        if lookup:
+            lowered = [t.lower() for t in lookup]
+            # ends[i]: where text i+1 starts; keywords never contain the NUL separator
+            ends = list(itertools.accumulate(len(t) + 1 for t in lowered))
+            column = "\0".join(lowered) + "\0"
+            for k, groups in self._keyword_groups.items():
+                cols = [col[g] for g in groups]
+                if not k:
+                    distinct[:-1, cols] = True
+                    continue
+                rows = []
+                find, pos = column.find, column.find(k)
+                while pos >= 0:
+                    i = bisect.bisect_right(ends, pos)
+                    rows.append(i)
+                    pos = find(k, ends[i])
+                if rows:
+                    distinct[np.ix_(rows, cols)] = True
+        return distinct[codes]
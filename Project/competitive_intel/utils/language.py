@@ -0,0 +1,64 @@
+"""Fast script-based language identification and regional feed locales.
+
+Arabic, Hindi (Devanagari) and Chinese (Han) are told apart from English by
+their Unicode script alone, which needs no model and is enough to pick a
+keyword pack. Latin-script text is reported as English.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Dict, Optional, Tuple
+
+_SCRIPTS = [
+    ("ar", re.compile("[\u0600-\u06ff\u0750-\u077f\u08a0-\u08ff\ufb50-\ufdff\ufe70-\ufeff]")),
+    ("hi", re.compile("[\u0900-\u097f]")),
+    ("zh", re.compile("[\u3400-\u4dbf\u4e00-\u9fff]")),
+]
+_LETTERS = re.compile(r"[^\W\d_]")
+
+# Languages we have keyword packs and native feeds for
+SUPPORTED_LANGUAGES = ("en", "ar", "hi", "zh")
+
+# Native language per target region
+REGION_LANGUAGES: Dict[str, str] = {
+    "KSA": "ar",
+    "UAE": "ar",
+    "EG": "ar",
+    "IN": "hi",
+    "CN": "zh",
+}
+
+# Google News locale per (region, language): (hl, gl, ceid language)
+_FEED_LANG = {"en": ("en", "en"), "ar": ("ar", "ar"), "hi": ("hi", "hi"), "zh": ("zh-CN", "zh-Hans")}
+_FEED_COUNTRY = {"KSA": "SA", "UAE": "AE", "EG": "EG", "IN": "IN", "CN": "CN"}
+
+
+def detect_language(text: str, sample: int = 400, min_share: float = 0.3) -> str:
+    """Return 'ar', 'hi', 'zh' or 'en' from the dominant script of the text.
+
+    Only the first `sample` characters are inspected. A non-Latin script must
+    make up at least `min_share` of the letters, so brand names or quotes in
+    another script do not flip the language.
+    """
+    head = (text or "")[:sample]
+    letters = len(_LETTERS.findall(head))
+    if not letters:
+        return "en"
+    best, best_count = "en", 0
+    for lang, pattern in _SCRIPTS:
+        n = len(pattern.findall(head))
+        if n > best_count:
+            best, best_count = lang, n
+    return best if best_count / letters >= min_share else "en"
+
+
+def native_language(region: str) -> Optional[str]:
+    return REGION_LANGUAGES.get((region or "").upper())
+
+
+def feed_locale(region: str, lang: str) -> Tuple[str, str, str]:
+    """(hl, gl, ceid language) query parameters for a Google News RSS feed."""
+    hl, ceid_lang = _FEED_LANG.get(lang, _FEED_LANG["en"])
+    gl = _FEED_COUNTRY.get((region or "").upper(), (region or "").upper())
+    return hl, gl, ceid_lang
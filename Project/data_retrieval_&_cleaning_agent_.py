@@ -17,11 +17,15 @@ import logging, json, asyncio, re, os, time, html
 import feedparser
 import hashlib
 import math
+import urllib.parse
 
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.messages import HumanMessage, AIMessage
 
+from competitive_intel.classification.language_packs import BRAND_NAMES, MOBILE_TERMS
+from competitive_intel.utils.language import detect_language, feed_locale, native_language
+
 # Logging
 logger = logging.getLogger("ci_agents")
 logger.setLevel(logging.INFO)
@@ -154,7 +158,7 @@ class SearchAgent:
     """Enhanced agent responsible for fetching raw data about mobile phone companies"""
 
     def __init__(self):
-        self.base_url = "https://news.google.com/rss/search?q={query}&hl={lang}&gl={country}&ceid={country}:en"
+        self.base_url = "https://news.google.com/rss/search?q={query}&hl={lang}&gl={country}&ceid={country}:{ceid_lang}"
         self.request_delay = 0.7  # Slightly longer delay to be more polite
         self.max_articles_per_query = 30  # Limit results per query
 
@@ -170,6 +174,8 @@ class SearchAgent:
         # Use config values if available, otherwise defaults
         max_articles = search_config.get("max_articles_per_company", self.max_articles_per_query)
         timeframe_days = search_config.get("search_timeframe_days", 7)
+        # Also pull Arabic/Hindi/Chinese feeds for regions with a native-language pack
+        native_feeds = search_config.get("native_language_feeds", False)
 
         for company_name, profile in competitor_profiles.items():
             # Search in the company's focus regions that also match our target regions
@@ -183,6 +189,13 @@ class SearchAgent:
                 all_articles.extend(articles)
                 time.sleep(self.request_delay)  # Be polite to avoid rate limiting
 
+                native = native_language(region) if native_feeds else None
+                if native:
+                    print(f"   Searching for {company_name} in {region} ({native})...")
+                    articles = self._fetch_news(company_name, region, profile, max_articles, timeframe_days, lang=native)
+                    all_articles.extend(articles)
+                    time.sleep(self.request_delay)
+
         print(f"✅ Search Agent: Found {len(all_articles)} raw articles")
 
         return {
@@ -193,8 +206,11 @@ class SearchAgent:
         }
 
     def _fetch_news(self, company: str, country: str, profile: CompetitorProfile,
-                   max_articles: int, timeframe_days: int) -> List[Dict]:
-        """Fetch news for a specific mobile company with enhanced domain-specific queries"""
+                   max_articles: int, timeframe_days: int, lang: str = "en") -> List[Dict]:
+        """Fetch news for a specific mobile company with enhanced domain-specific queries
+
+        lang: "en" (default) or a native-language pack ("ar", "hi", "zh")
+        """
         # Enhanced mobile industry search terms with AI focus
         query_terms = [
             f'"{company}"',
@@ -237,6 +253,11 @@ class SearchAgent:
             for product in COMPETITOR_PROFILES[company].key_products[:3]:
                 query_terms.append(f'"{product}"')
 
+        # Native-language feeds: brand spellings and device terms from the language pack
+        if lang != "en":
+            query_terms = [f'"{company}"'] + [f'"{name}"' for name in BRAND_NAMES.get(lang, {}).get(company, [])]
+            query_terms += MOBILE_TERMS.get(lang, [])
+
         # Enhanced exclusion terms to avoid financial/news articles
         exclude_terms = [
             '-gold', '-silver', '-stock', '-market', '-investment',
@@ -247,17 +268,27 @@ class SearchAgent:
             '-financial results', '-stock price', '-market cap'
         ]
 
-        query = " OR ".join(query_terms) + " " + " ".join(exclude_terms)
+        # The exclusions are English words; native-language queries go without them
+        query = " OR ".join(query_terms)
+        if lang == "en":
+            query += " " + " ".join(exclude_terms)
 
         # Add timeframe restriction for recent articles only
         date_restriction = datetime.now() - timedelta(days=timeframe_days)
         query += f" after:{date_restriction.strftime('%Y-%m-%d')}"
 
-        formatted_url = self.base_url.format(
-            query=query.replace(' ', '%20'),
-            lang="en",  # Always use English for consistency
-            country=country.lower()
-        )
+        if lang == "en":
+            formatted_url = self.base_url.format(
+                query=urllib.parse.quote(query),
+                lang="en",  # English feeds for consistency; native feeds are opt-in
+                country=country.lower(),
+                ceid_lang="en"
+            )
+        else:
+            hl, gl, ceid_lang = feed_locale(country, lang)
+            formatted_url = self.base_url.format(
+                query=urllib.parse.quote(query), lang=hl, country=gl, ceid_lang=ceid_lang
+            )
 
         print(f"      Search URL: {formatted_url[:120]}...")  # Debug: show the URL
 
@@ -292,11 +323,14 @@ class SearchAgent:
                     'launch', 'release', 'announce', 'new', 'model', 'series'
                 ]
 
+                if lang != "en":
+                    mobile_keywords = mobile_keywords + MOBILE_TERMS.get(lang, []) + BRAND_NAMES.get(lang, {}).get(company, [])
+
                 if not any(keyword in title or keyword in summary for keyword in mobile_keywords):
                     continue  # Skip this article
 
                 # Calculate a relevance score based on keyword matches
-                relevance_score = self._calculate_relevance_score(title, summary, company, profile)
+                relevance_score = self._calculate_relevance_score(title, summary, company, profile, lang)
 
                 # Skip articles with very low relevance
                 if relevance_score < 2:
@@ -317,7 +351,9 @@ class SearchAgent:
                     'os_ecosystem': profile.os_ecosystem,
                     'relevance_score': relevance_score,
                     'source': self._extract_source(entry.link),
-                    'id': self._generate_article_id(entry)  # Unique ID for each article
+                    'id': self._generate_article_id(entry),  # Unique ID for each article
+                    # Native feeds also carry English articles; each is classified in its own language
+                    'language': detect_language(f"{entry.title} {entry.summary if hasattr(entry, 'summary') else ''}")
                 }
                 articles.append(article_data)
 
@@ -329,15 +365,20 @@ class SearchAgent:
             return []
 
     def _calculate_relevance_score(self, title: str, summary: str, company: str,
-                                 profile: CompetitorProfile) -> int:
+                                 profile: CompetitorProfile, lang: str = "en") -> int:
         """Calculate a relevance score based on keyword matches"""
         score = 0
         text = f"{title} {summary}".lower()
 
-        # Company name mentions
-        if company.lower() in text:
+        # Company name mentions (native spellings count for native-language feeds)
+        if company.lower() in text or any(name in text for name in BRAND_NAMES.get(lang, {}).get(company, [])):
             score += 3
 
+        # Native-language device terms
+        for term in MOBILE_TERMS.get(lang, []):
+            if term in text:
+                score += 1
+
         # Product mentions
         for product in profile.key_products:
             if product.lower() in text:
@@ -9,13 +9,14 @@ Original file is located at
 
 import re
 import json
-import pandas as pd
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from enum import Enum
 import logging
 
+from competitive_intel.classification.aggregator import ClassificationAggregator
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -34,6 +35,7 @@ class ClassificationResult:
     reasoning: str
     extracted_entities: Dict[str, List[str]]
     metadata: Dict[str, any]
+    labels: List[EventType] = field(default_factory=list)  # primary label first
 
 class MobileCompanyEventClassifier:
     """
@@ -252,12 +254,15 @@ class MobileCompanyEventClassifier:
 
         return final_score, matches
 
-    def classify_event(self, text: str, metadata: Optional[Dict] = None) -> ClassificationResult:
+    def classify_event(self, text: str, metadata: Optional[Dict] = None,
+                       multi_label: bool = False, label_threshold: float = 0.1) -> ClassificationResult:
         """
         Main classification method
         Args:
             text: Input text to classify
             metadata: Optional metadata (source, timestamp, etc.)
+            multi_label: Also emit every other event type scoring >= label_threshold
+            label_threshold: Minimum score for a secondary label
         """
         if metadata is None:
             metadata = {}
@@ -301,23 +306,32 @@ class MobileCompanyEventClassifier:
             matching_patterns = all_matches[predicted_type]
             reasoning = f"Classified as {predicted_type.value} (confidence: {confidence:.2f}) based on patterns: {', '.join(matching_patterns[:3])}"
 
+        # Multi-label: reuse the per-type scores, strongest first
+        labels = [predicted_type]
+        if multi_label and predicted_type != EventType.UNKNOWN:
+            labels += [et for et, score in sorted(scores.items(), key=lambda x: x[1], reverse=True)
+                       if et != predicted_type and score >= label_threshold]
+
         # Extract entities
         entities = self.extract_entities(text)
 
         # Add classification timestamp
         metadata['classification_timestamp'] = datetime.now().isoformat()
         metadata['all_scores'] = {event_type.value: score for event_type, score in scores.items()}
+        metadata['labels'] = [et.value for et in labels]
 
         return ClassificationResult(
             event_type=predicted_type,
             confidence_score=confidence,
             reasoning=reasoning,
             extracted_entities=entities,
-            metadata=metadata
+            metadata=metadata,
+            labels=labels
         )
 
-    def classify_batch(self, texts: List[str], metadata_list: Optional[List[Dict]] = None) -> List[ClassificationResult]:
-        """Classify multiple texts at once"""
+    def classify_batch(self, texts: List[str], metadata_list: Optional[List[Dict]] = None,
+                       aggregator: Optional[ClassificationAggregator] = None) -> List[ClassificationResult]:
+        """Classify multiple texts at once, feeding `aggregator` as results are produced"""
         if metadata_list is None:
             metadata_list = [{}] * len(texts)
 
@@ -326,48 +340,25 @@ class MobileCompanyEventClassifier:
             metadata = metadata_list[i] if i < len(metadata_list) else {}
             result = self.classify_event(text, metadata)
             results.append(result)
+            if aggregator is not None:
+                aggregator.add_result(result)
 
         return results
 
-    def generate_report(self, results: List[ClassificationResult]) -> Dict:
-        """Generate a summary report from classification results"""
-        if not results:
-            return {"error": "No results to analyze"}
+    def generate_report(self, results: List[ClassificationResult],
+                        aggregator: Optional[ClassificationAggregator] = None) -> Dict:
+        """Generate a summary report from classification results
 
-        # Count events by type
-        event_counts = {}
-        for result in results:
-            event_type = result.event_type.value
-            event_counts[event_type] = event_counts.get(event_type, 0) + 1
-
-        # Calculate average confidence by event type
-        confidence_by_type = {}
-        for event_type in event_counts:
-            confidences = [r.confidence_score for r in results if r.event_type.value == event_type]
-            confidence_by_type[event_type] = sum(confidences) / len(confidences) if confidences else 0
-
-        # Extract most mentioned companies
-        all_companies = []
-        for result in results:
-            all_companies.extend(result.extracted_entities.get('companies', []))
-
-        company_counts = {}
-        for company in all_companies:
-            company_counts[company] = company_counts.get(company, 0) + 1
-
-        top_companies = sorted(company_counts.items(), key=lambda x: x[1], reverse=True)[:5]
-
-        # High confidence results
-        high_confidence_results = [r for r in results if r.confidence_score >= 0.7]
-
-        return {
-            "total_events": len(results),
-            "event_distribution": event_counts,
-            "average_confidence_by_type": confidence_by_type,
-            "top_mentioned_companies": dict(top_companies),
-            "high_confidence_events": len(high_confidence_results),
-            "classification_accuracy_estimate": len(high_confidence_results) / len(results) if results else 0
-        }
+        Pass the aggregator filled by `classify_batch` (or merged from shards)
+        to read the report from its counters instead of re-scanning results.
+        """
+        if aggregator is None:
+            aggregator = ClassificationAggregator()
+            for result in results:
+                aggregator.add_result(result)
+        if not aggregator.total:
+            return {"error": "No results to analyze"}
+        return aggregator.report()
 
 # Example usage and testing
 def run_example_classification():
@@ -438,7 +429,7 @@ def setup_for_colab():
         import pandas as pd
     except ImportError:
         print("Installing pandas...")
-        !pip install pandas
+        # !pip install pandas
 
     print("✅ Setup complete! Ready to classify mobile industry events.")
 
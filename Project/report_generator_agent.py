@@ -7,23 +7,17 @@ Original file is located at
     https://colab.research.google.com/drive/1hWc8D1CtuCrFkfTw9ecSdP_RaY1DWF_k
 """
 
-!pip install fpdf2 plotly seaborn matplotlib pandas
+# !pip install fpdf2 plotly seaborn matplotlib pandas
 
 
 
 import json
 import datetime
-from dataclasses import dataclass, asdict
-from typing import List, Dict, Any, Optional
+from dataclasses import dataclass
+from typing import List, Dict, Any
 from enum import Enum
-import matplotlib.pyplot as plt
-import seaborn as sns
-import pandas as pd
-from fpdf import FPDF
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
-import numpy as np
+# pandas, plotly and fpdf are imported inside the methods that draw or export,
+# so importing this module for the brief generators stays fast
 
 
 class EventType(Enum):
@@ -154,8 +148,12 @@ class MobileMarketReportGenerator:
 
         return report
 
-    def create_visual_dashboard(self, events: List[CompetitiveEvent]) -> go.Figure:
-        """Create interactive visual dashboard"""
+    def create_visual_dashboard(self, events: List[CompetitiveEvent]) -> Any:
+        """Create interactive visual dashboard (a plotly Figure)"""
+        import pandas as pd
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
+
         # Prepare data
         df = pd.DataFrame([{
             'competitor': e.competitor,
@@ -210,6 +208,8 @@ class MobileMarketReportGenerator:
 
     def export_to_pdf(self, report_data: Dict[str, Any], filename: str = None):
         """Export report to PDF format"""
+        from fpdf import FPDF
+
         if filename is None:
             filename = f"mobile_market_report_{datetime.datetime.now().strftime('%Y%m%d')}.pdf"
 
@@ -529,7 +529,7 @@ def run_demo():
     print("\n📄 Exporting to PDF...")
     pdf_filename = agent.export_to_pdf(daily_brief)
 
-    print(f"\n✅ Demo completed! Reports generated successfully.")
+    print("\n✅ Demo completed! Reports generated successfully.")
     print(f"PDF Report: {pdf_filename}")
 
 if __name__ == "__main__":
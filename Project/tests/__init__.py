@@ -0,0 +1 @@
+"""Behaviour tests; run from the Project directory with `python -m pytest -q`."""
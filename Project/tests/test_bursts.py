@@ -0,0 +1,49 @@
+"""Burst detection on spread-out feeds versus a real spike."""
+
+from datetime import datetime, timedelta
+from email.utils import format_datetime
+
+from competitive_intel.trends.bursts import BurstDetector
+
+START = datetime(2025, 10, 1, 8, 0)
+
+
+def article(i, when):
+    return {"id": f"a{i}", "competitor": "Samsung", "event_type": "product_launch", "region": "US",
+            "date": when}
+
+
+def test_spread_out_rfc_dated_events_raise_no_alerts():
+    events = [article(i, format_datetime(START + timedelta(hours=17 * i))) for i in range(10)]
+    events += [article(10, "not a date"), article(11, None)]
+    detector = BurstDetector()
+
+    alerts = detector.observe_batch(events)
+
+    assert not any(alerts) and not detector.alerts
+    assert detector.observed == 10 and detector.undated == 2
+
+
+def test_spike_after_a_quiet_baseline_is_reported_once():
+    quiet = [article(i, START + timedelta(days=2 * i)) for i in range(5)]
+    spike_at = START + timedelta(days=11)
+    spike = [article(100 + i, spike_at + timedelta(minutes=10 * i)) for i in range(8)]
+    detector = BurstDetector()
+
+    alerts = detector.observe_batch(quiet + spike)
+
+    assert not any(alerts[:len(quiet)])
+    assert len(detector.alerts) == 1
+    alert = detector.alerts[0]
+    assert (alert.competitor, alert.event_type, alert.region) == ("Samsung", "product_launch", "US")
+    assert alert.severity == "high" and alert.new
+    assert alerts[-1] is not None and not alerts[-1].new
+
+
+def test_refetched_events_are_not_counted_twice():
+    events = [article(i, START + timedelta(minutes=i)) for i in range(3)]
+    detector = BurstDetector()
+    detector.observe_batch(events)
+    detector.observe_batch(events)
+
+    assert detector.observed == 3
@@ -0,0 +1,53 @@
+"""Confidence gate of the classification cascade."""
+
+from competitive_intel.agents.event_classification_agent import EventClassificationInterface
+from competitive_intel.classification.cascade import CascadeConfig, needs_escalation, run_cascade
+
+
+def event(confidence, scores=None, description="", event_type="product_launch"):
+    return {"event_type": event_type, "labels": [event_type], "confidence": confidence,
+            "description": description, "metadata": {"all_scores": scores or {}}}
+
+
+def test_gate_escalates_low_confidence_and_close_calls_only():
+    cfg = CascadeConfig()
+    assert needs_escalation(event(0.125), cfg)
+    assert not needs_escalation(event(0.5, {"product_launch": 0.5, "pricing_change": 0.1}), cfg)
+    assert needs_escalation(event(0.5, {"product_launch": 0.5, "pricing_change": 0.48}), cfg)
+
+
+def test_only_gated_events_reach_the_llm_in_batches():
+    events = [event(0.125, description=f"weak {i}") for i in range(5)]
+    events += [event(0.6, {"product_launch": 0.6}, description=f"strong {i}") for i in range(5)]
+    batches = []
+
+    def escalate(texts):
+        batches.append(list(texts))
+        return ["pricing_change"] * len(texts)
+
+    metrics = run_cascade(events, escalate, CascadeConfig(batch_size=2))
+
+    assert [len(b) for b in batches] == [2, 2, 1]
+    assert all(t.startswith("weak") for b in batches for t in b)
+    assert metrics["escalated"] == 5 and metrics["llm_calls"] == 3 and metrics["llm_calls_avoided"] == 7
+    weak, strong = events[0], events[5]
+    assert weak["event_type"] == "pricing_change" and weak["classification_source"] == "llm"
+    assert weak["metadata"]["fast_event_type"] == "product_launch" and weak["labels"] == ["pricing_change"]
+    assert strong["event_type"] == "product_launch" and "classification_source" not in strong
+
+
+def test_cascade_without_llm_counts_candidates_and_keeps_fast_labels():
+    iface = EventClassificationInterface()
+    iface.escalator.api_key = None
+    items = [
+        {"title": "Samsung launches new flagship phone", "description": "Samsung launches new flagship phone",
+         "competitor": "Samsung"},
+        {"title": "Quarterly results", "description": "Quarterly results for the phone maker", "competitor": "Apple"},
+    ]
+
+    out = iface.classify_items(items, {"classification_mode": "cascade"})
+
+    metrics = iface.last_metrics
+    assert metrics["llm_available"] is False and metrics["llm_calls"] == 0 and metrics["llm_calls_avoided"] == 0
+    assert metrics["escalated"] == sum(needs_escalation(ev, CascadeConfig()) for ev in out)
+    assert all(ev.get("classification_source") != "llm" for ev in out)
@@ -0,0 +1,72 @@
+"""The streamed classification report must match the per-result report it replaced."""
+
+from collections import Counter, defaultdict
+
+from competitive_intel.classification.aggregator import ClassificationAggregator
+from event_classification_agent import MobileCompanyEventClassifier
+
+TEXTS = [
+    "Samsung launches new flagship phone in India",
+    "Apple announces price cut and discount in US",
+    "Xiaomi starts marketing campaign with influencers",
+    "Oppo expands retail stores into Saudi Arabia",
+    "Vivo unveils foldable, available for pre-order",
+    "Google quarterly results beat estimates",
+    "Huawei partners with carrier in Saudi Arabia",
+    "Samsung Galaxy price drops by 20% ahead of sales",
+    "Apple launches iPhone with new camera",
+    "Xiaomi cuts price of budget phone in India",
+]
+
+
+def legacy_report(results):
+    """The report as `generate_report` computed it before the aggregator existed."""
+    type_counts = Counter(r.event_type.value for r in results)
+    confidences = defaultdict(list)
+    for r in results:
+        confidences[r.event_type.value].append(r.confidence_score)
+    companies = Counter(c for r in results for c in r.extracted_entities.get("companies", []))
+    high = sum(1 for r in results if r.confidence_score >= 0.7)
+    return {
+        "total_events": len(results),
+        "event_distribution": dict(type_counts),
+        "average_confidence_by_type": {t: sum(v) / len(v) for t, v in confidences.items()},
+        "top_mentioned_companies": dict(sorted(companies.items(), key=lambda x: x[1], reverse=True)[:5]),
+        "high_confidence_events": high,
+        "classification_accuracy_estimate": high / len(results),
+    }
+
+
+def assert_matches_legacy(report, expected):
+    for key, value in expected.items():
+        if key == "average_confidence_by_type":
+            assert report[key].keys() == value.keys()
+            for event_type, mean in value.items():
+                assert abs(report[key][event_type] - mean) < 1e-12
+        else:
+            assert report[key] == value, key
+    # Same ranking, ties included, not just the same counts.
+    assert list(report["top_mentioned_companies"]) == list(expected["top_mentioned_companies"])
+
+
+def test_streamed_report_matches_legacy_report():
+    classifier = MobileCompanyEventClassifier()
+    aggregator = ClassificationAggregator()
+    results = classifier.classify_batch(TEXTS, aggregator=aggregator)
+    expected = legacy_report(results)
+
+    assert_matches_legacy(classifier.generate_report(results), expected)
+    assert_matches_legacy(classifier.generate_report(results, aggregator=aggregator), expected)
+
+
+def test_merged_shards_match_single_pass():
+    classifier = MobileCompanyEventClassifier()
+    left, right = ClassificationAggregator(), ClassificationAggregator()
+    results = classifier.classify_batch(TEXTS[:4], aggregator=left) + classifier.classify_batch(TEXTS[4:], aggregator=right)
+    left.merge(right)
+
+    assert_matches_legacy(classifier.generate_report(results, aggregator=left), legacy_report(results))
+
+
+def test_empty_batch_reports_error():
+    assert MobileCompanyEventClassifier().generate_report([]) == {"error": "No results to analyze"}
@@ -0,0 +1,39 @@
+"""Deduplication and stable ids in the normalized event store."""
+
+from competitive_intel.utils.event_store import NormalizedEventStore
+
+ARTICLE = {"title": "Galaxy launch", "link": "https://example.com/a", "description": "Samsung launches a phone",
+           "date": "Mon, 06 Oct 2025 09:00:00 GMT", "competitor": "Samsung"}
+
+
+def test_exact_duplicates_are_dropped():
+    store = NormalizedEventStore()
+    ids = store.ingest([ARTICLE, dict(ARTICLE)])
+
+    assert ids[0] == ids[1] == "https://example.com/a"
+    assert len(store) == 1 and store.duplicates == 1
+    assert store[ids[0]]["date_raw"] == ARTICLE["date"]
+
+
+def test_distinct_items_sharing_a_link_are_kept_apart():
+    other = dict(ARTICLE, description="Samsung cuts the price of a phone")
+    store = NormalizedEventStore()
+    first, second = store.ingest([ARTICLE, other])
+
+    assert first == "https://example.com/a" and second.startswith(first + "#")
+    assert len(store) == 2 and store.duplicates == 0
+
+
+def test_ids_do_not_depend_on_feed_position():
+    updates = [dict(ARTICLE, description=f"Update {i}", date=f"Mon, 06 Oct 2025 1{i}:00:00 GMT") for i in range(3)]
+    first = NormalizedEventStore()
+    first.ingest([ARTICLE] + updates)
+    refetch = NormalizedEventStore()
+    refetch.ingest([ARTICLE] + updates[::-1])
+
+    assert {r["description"]: r["id"] for r in first} == {r["description"]: r["id"] for r in refetch}
+
+
+def test_items_without_id_get_sequential_ids():
+    store = NormalizedEventStore()
+    assert store.ingest([{"description": "one"}, {"description": "two"}]) == ["E000001", "E000002"]
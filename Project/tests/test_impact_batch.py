@@ -0,0 +1,56 @@
+"""Batch impact scoring matches scoring signals one at a time."""
+
+import datetime as dt
+import random
+
+import pytest
+
+import impact_scoring_agent as scoring
+
+NOW = dt.datetime(2025, 11, 28, 14, 30, tzinfo=dt.timezone.utc)
+
+
+class FrozenDatetime(dt.datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return NOW if tz else NOW.replace(tzinfo=None)
+
+
+@pytest.fixture
+def frozen_now(monkeypatch):
+    monkeypatch.setattr(scoring, "datetime", FrozenDatetime)
+
+
+def signals(n, seed=0):
+    rnd = random.Random(seed)
+    words = ["revolutionary", "new", "snapdragon", "ultra", "fold", "stc", "dxomark", "pre-order", "black friday",
+             "ramadan", "saudi", "india", "billion", "20%", "price", "Galaxy", "iPhone"]
+
+    def timestamp():
+        when = NOW - dt.timedelta(minutes=rnd.randint(-600, 60 * 24 * 120))
+        return rnd.choice([when, when.replace(tzinfo=None), when.strftime("%Y-%m-%d"), None, "garbage"])
+
+    return [{
+        "competitor": rnd.choice(["Apple", "Samsung", "Xiaomi", "OPPO", "Acme", None]),
+        "event_type": rnd.choice(["product_launch", "pricing_change", "flash_sale", "carrier_deal", "other", None]),
+        "text": " ".join(rnd.choice(words) for _ in range(rnd.randint(0, 8))),
+        "timestamp": timestamp(),
+        "labels": rnd.choice([None, ["product_launch", "pricing_change"]]),
+        "region": rnd.choice(["KSA", "UAE", "IN", "US", None]),
+    } for _ in range(n)]
+
+
+def fields(score):
+    return (score.final_score, score.competitor_size_score, score.event_significance_score,
+            score.timing_score, score.urgency, score.reasoning)
+
+
+def test_score_signals_matches_score_signal(frozen_now):
+    batch_input = signals(500)
+    one_by_one = scoring.ImpactScoringAgent(scoring.default_mobile_competitors())
+    batched = scoring.ImpactScoringAgent(scoring.default_mobile_competitors())
+
+    single = [fields(one_by_one.score_signal(s)) for s in batch_input]
+    batch = [fields(s) for s in batched.score_signals(batch_input, now=NOW)]
+
+    assert batch == single
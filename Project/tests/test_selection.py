@@ -0,0 +1,58 @@
+"""Streaming top-k selection equals a full sort followed by a greedy pass."""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from competitive_intel.scoring.selection import priority_key, select_for_analysis
+
+
+def sort_then_greedy(scored, k, quota, backfill=True):
+    ranked = sorted(scored, key=priority_key, reverse=True)  # stable: earlier events win ties
+    chosen, skipped, taken = [], [], {}
+    for ev in ranked:
+        if len(chosen) == k:
+            break
+        comp = ev.get("competitor") or "Unknown"
+        limit = quota.get(comp, quota.get("*")) if isinstance(quota, dict) else quota
+        if limit is not None and taken.get(comp, 0) >= limit:
+            skipped.append(ev)
+            continue
+        taken[comp] = taken.get(comp, 0) + 1
+        chosen.append(ev)
+    if backfill and len(chosen) < k:
+        chosen += skipped[:k - len(chosen)]
+        chosen.sort(key=priority_key, reverse=True)
+    return chosen
+
+
+def scored_events(n, seed):
+    rnd = random.Random(seed)
+    start = datetime(2025, 10, 1)
+    return [{
+        "id": i,
+        "competitor": rnd.choice(["Apple", "Samsung", "Xiaomi", "OPPO", None]),
+        "impact": rnd.choice([3.0, 5.5, 7.0, 8.5, 9.0]),
+        "urgency": rnd.choice(["low", "medium", "high", "immediate"]),
+        "date": rnd.choice([start + timedelta(days=rnd.randint(0, 3)), None]),
+    } for i in range(n)]
+
+
+@pytest.mark.parametrize("k, quota", [(10, 3), (5, 1), (10, None), (8, {"Apple": 1, "*": 2})])
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_sort_and_greedy_with_quotas(k, quota, seed):
+    scored = scored_events(60, seed)
+    config = {"analyst_top_k": k, "analyst_per_competitor": quota}
+
+    assert [e["id"] for e in select_for_analysis(scored, config)] == [e["id"] for e in sort_then_greedy(scored, k, quota)]
+
+
+def test_backfill_fills_slots_left_by_quotas():
+    scored = [{"id": i, "competitor": "Apple", "impact": 9.0 - i} for i in range(4)] + [{"id": 9, "competitor": "Samsung", "impact": 1.0}]
+
+    with_backfill = select_for_analysis(scored, {"analyst_top_k": 4, "analyst_per_competitor": 2})
+    without = select_for_analysis(scored, {"analyst_top_k": 4, "analyst_per_competitor": 2, "analyst_backfill": False})
+
+    assert [e["id"] for e in with_backfill] == [0, 1, 2, 9]
+    assert [e["id"] for e in without] == [0, 1, 9]
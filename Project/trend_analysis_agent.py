@@ -21,26 +21,30 @@ Output: Weekly/Monthly trend reports with predictive insights
 """
 
 # Commented out IPython magic to ensure Python compatibility.
-!pip -q install numpy pandas matplotlib seaborn scipy
+# !pip -q install numpy pandas matplotlib seaborn scipy
 
 import warnings
 warnings.filterwarnings('ignore')
 
-import matplotlib.pyplot as plt
 # %matplotlib inline
 
 # ===== Mobile Trend Analysis Agent (Full Class) =====
 import json
 import datetime
 import numpy as np
-import pandas as pd
 from typing import Dict, List, Tuple, Optional, Any
 from dataclasses import dataclass, asdict
 from enum import Enum
 from collections import defaultdict, Counter
-import matplotlib.pyplot as plt
-import seaborn as sns
-from scipy import stats
+
+from competitive_intel.trends.charts import shared_renderer
+from competitive_intel.trends.counters import TrendCounts, event_facets
+from competitive_intel.trends.history import TrendEventHistory
+from competitive_intel.trends.registry import AnalyzerRegistry, AnalyzerRun
+from competitive_intel.trends.stats import TrendSeries, classify_trend
+from competitive_intel.trends.tags import TrendTagger
+from competitive_intel.trends.workspace import TrendWorkspace
+from competitive_intel.utils.dates import shared_date_parser
 
 class MobileTrendType(Enum):
     """Types of mobile market trends"""
@@ -97,10 +101,37 @@ class MobileTrendAnalysisAgent:
     across competitive activities over time
     """
 
-    def __init__(self):
-        """Initialize the Mobile Trend Analysis Agent"""
-        self.mobile_events_history: List[Dict[str, Any]] = []
+    def __init__(self, history_days: int = 365, analyzer_workers: Optional[int] = None):
+        """Initialize the Mobile Trend Analysis Agent
+
+        history_days: days of events kept for analysis (older days are evicted;
+        a call with a longer time_window_days keeps that many instead)
+        analyzer_workers: threads for the trend analyzers (1 runs them in sequence)
+        """
+        # Dates are parsed in batches and memoized; the impact scorer shares this parser
+        self.date_parser = shared_date_parser()
+        # Keyword tags for every analyzer, computed in one pass and cached per event id
+        self.tagger = TrendTagger()
+        # Window counters are updated as events arrive and leave the window
+        self.mobile_events_history = TrendEventHistory(self.date_parser, retention_days=history_days,
+                                                       keyer=self._trend_keys)
         self.trend_insights: List[MobileTrendInsight] = []
+        self.max_stored_insights = 500
+        # Analyzers take (counts, series) and run concurrently; register more with
+        # agent.analyzers.register(name, fn). Timings/errors of the last run:
+        self.analyzers = AnalyzerRegistry(max_workers=analyzer_workers)
+        for name, analyzer in [
+            ('technology', self._analyze_technology_trends),
+            ('pricing', self._analyze_pricing_trends),
+            ('features', self._analyze_feature_trends),
+            ('launch_patterns', self._analyze_launch_patterns),
+            ('market_movements', self._analyze_market_movements),
+            ('brand_strategies', self._analyze_brand_strategies),
+            ('camera', self._analyze_camera_trends),
+            ('performance', self._analyze_performance_trends),
+        ]:
+            self.analyzers.register(name, analyzer)
+        self.last_analyzer_runs: List[AnalyzerRun] = []
         self.mobile_brands = [
             'Apple', 'Samsung', 'Oppo', 'Xiaomi', 'Vivo', 'OnePlus',
             'Huawei', 'Google', 'Nothing', 'Realme', 'Honor', 'Motorola'
@@ -127,121 +158,167 @@ class MobileTrendAnalysisAgent:
         Main method to analyze mobile market trends
         """
         try:
-            # Store events for analysis
-            self.mobile_events_history.extend(mobile_events)
+            # Store events for analysis (day-bucketed; dates are parsed once on insert)
+            stored = self.mobile_events_history.extend(mobile_events)
+            if stored < len(mobile_events):
+                print(f"Skipped {len(mobile_events) - stored} events with unparseable dates "
+                      f"({self.mobile_events_history.undated} so far)")
+
+            # Evict expired days, then move the window counters to the time window
+            now = datetime.datetime.now()
+            self.mobile_events_history.evict_expired(now, keep_days=time_window_days)
+            counts = self.mobile_events_history.counts(time_window_days, now)
+
+            if not counts.total:
+                return []
 
-            # Filter events by time window
-            cutoff_date = datetime.datetime.now() - datetime.timedelta(days=time_window_days)
-            recent_events = [
-                event for event in self.mobile_events_history
-                if self._parse_date(event.get('date', '')) >= cutoff_date
-            ]
+            # Daily series per (brand, tag) for trend tests; statistics are computed lazily, all series at once
+            series = self.mobile_events_history.daily_series(time_window_days, now)
+            return self._run_analyzers(counts, series)
 
-            if not recent_events:
-                return []
+        except Exception as e:
+            print(f"Error in mobile trend analysis: {str(e)}")
+            return []
 
-            # Convert to DataFrame for analysis
-            df = pd.DataFrame(recent_events)
-
-            # Ensure required columns exist
-            for col in ['event_type','competitor','description','date','source','impact_score']:
-                if col not in df.columns:
-                    df[col] = None
-
-            # Run different trend analyses
-            trend_insights: List[MobileTrendInsight] = []
-            trend_insights.extend(self._analyze_technology_trends(df))
-            trend_insights.extend(self._analyze_pricing_trends(df))
-            trend_insights.extend(self._analyze_feature_trends(df))
-            trend_insights.extend(self._analyze_launch_patterns(df))
-            trend_insights.extend(self._analyze_market_movements(df))
-            trend_insights.extend(self._analyze_brand_strategies(df))
-            trend_insights.extend(self._analyze_camera_trends(df))
-            trend_insights.extend(self._analyze_performance_trends(df))
-
-            # Store insights
-            self.trend_insights.extend(trend_insights)
-
-            # Sort by significance and confidence
-            sig_rank = {'CRITICAL': 4, 'HIGH': 3, 'MEDIUM': 2, 'LOW': 1}
-            trend_insights.sort(
-                key=lambda x: (sig_rank[x.significance.value], x.confidence_score),
-                reverse=True
-            )
-            return trend_insights
+    def analyze_workspace(self, workspace: TrendWorkspace,
+                          time_window_days: int = 90) -> List[MobileTrendInsight]:
+        """
+        Run the trend analyzers over a columnar TrendWorkspace (e.g. a stored or
+        exported event set) without adding its events to the history
+        """
+        try:
+            now = datetime.datetime.now()
+            window = workspace.window(time_window_days, now)
+            counts = window.counts()
+            if not counts.total:
+                return []
+            return self._run_analyzers(counts, window.daily_series(time_window_days, now))
 
         except Exception as e:
             print(f"Error in mobile trend analysis: {str(e)}")
             return []
 
-    def _analyze_technology_trends(self, df: pd.DataFrame) -> List[MobileTrendInsight]:
+    def build_workspace(self, mobile_events: List[Dict[str, Any]]) -> TrendWorkspace:
+        """Project events onto the typed columns the analyzers read"""
+        return TrendWorkspace.from_events(mobile_events, self.date_parser, self.tagger)
+
+    def _run_analyzers(self, counts: TrendCounts, series: TrendSeries) -> List[MobileTrendInsight]:
+        """Run every registered analyzer on window counts and daily series, store and rank the insights"""
+        # Compute the lazy statistics once, before the analyzers share the series
+        series.stats
+        trend_insights, self.last_analyzer_runs = self.analyzers.run(counts, series)
+        for run in self.last_analyzer_runs:
+            if run.error:
+                print(f"Error in {run.name} trend analyzer: {run.error}")
+
+        # Store insights (recent runs only; TrendSnapshotStore keeps the history)
+        self.trend_insights.extend(trend_insights)
+        del self.trend_insights[:-self.max_stored_insights]
+
+        # Sort by significance and confidence
+        sig_rank = {'Critical': 4, 'High': 3, 'Medium': 2, 'Low': 1}
+        trend_insights.sort(
+            key=lambda x: (sig_rank[x.significance.value], x.confidence_score),
+            reverse=True
+        )
+        return trend_insights
+
+    def _trend_keys(self, event: Dict[str, Any], ts: datetime.datetime):
+        """Counter facets and brand for one event (see TrendEventHistory keyer)"""
+        tags = self.tagger.names_of(self.tagger.tag_event(event))
+        return event_facets(event.get('event_type'), tags, ts.month), event.get('competitor')
+
+    def _trend_fields(self, series: TrendSeries, event_type: Optional[str] = None, tags: Tuple[str, ...] = (),
+                      direction: Optional[TrendDirection] = None) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Insight fields and key metrics from the statistics of one facet's daily series"""
+        row = series.get(event_type, tags)
+        stat_direction, significance, confidence = classify_trend(row)
+        brand_rows = series.brand_stats(event_type, tags)
+        rising = sorted(brand for brand, brand_row in brand_rows.items()
+                        if classify_trend(brand_row)[0] == "Increasing")
+        metrics: Dict[str, Any] = {'rising_brands': rising}
+        if row is not None:
+            change = series.change_date(row) if row['change_p'] < 0.05 else None
+            metrics.update({
+                'events': int(row['total']),
+                'brand_events': {brand: int(brand_row['total']) for brand, brand_row in brand_rows.items()},
+                'slope_per_week': round(row['slope'] * 7, 3),
+                'mann_kendall_p': round(row['mk_p'], 4),
+                'recent_week_z': round(row['recent_z'], 2),
+                'change_point': change.isoformat() if change else None,
+                'change_ratio': round(row['change_ratio'], 2) if change else None,
+            })
+        fields = {
+            'direction': direction or TrendDirection(stat_direction),
+            'significance': TrendSignificance(significance),
+            'confidence_score': confidence,
+            'time_period': series.period_label,
+        }
+        return fields, metrics
+
+    def _analyze_technology_trends(self, counts: TrendCounts, series: TrendSeries) -> List[MobileTrendInsight]:
         """Analyze technology advancement trends in mobile market"""
         trends: List[MobileTrendInsight] = []
         try:
             # Better 5G detection
-            if 'description' in df and df['description'].str.contains(r'\b5G\b', case=False, na=False).any():
-                fiveg_events = df[df['description'].str.contains(r'\b5G\b', case=False, na=False)]
-                if len(fiveg_events) > 2:
-                    trend = MobileTrendInsight(
-                        trend_id=f"TECH_5G_{datetime.datetime.now().strftime('%Y%m%d')}",
-                        trend_type=MobileTrendType.TECHNOLOGY,
-                        title="5G Technology Acceleration in Mobile Phones",
-                        description="Increasing focus on 5G capabilities across mobile phone launches",
-                        direction=TrendDirection.INCREASING,
-                        significance=TrendSignificance.HIGH,
-                        confidence_score=0.8,
-                        time_period="Last 90 days",
-                        affected_brands=list(fiveg_events['competitor'].dropna().unique()),
-                        key_metrics={
-                            'fiveg_mentions': len(fiveg_events),
-                            'brands_adopting': len(fiveg_events['competitor'].dropna().unique()),
-                            'growth_rate': 'High'
-                        },
-                        supporting_evidence=[
-                            f"{len(fiveg_events)} 5G-related mobile announcements",
-                            f"Adoption by {len(fiveg_events['competitor'].dropna().unique())} major brands",
-                            "Increased marketing focus on 5G capabilities"
-                        ],
-                        implications=[
-                            "5G is becoming standard feature expectation",
-                            "Network infrastructure development driving adoption",
-                            "Competitive pressure to include 5G in all segments"
-                        ],
-                        predictions=[
-                            "5G will be in 80%+ of mid-range phones by 2025",
-                            "5G-only phones may emerge in premium segment",
-                            "Focus will shift to 5G optimization and applications"
-                        ],
-                        recommendations=[
-                            "Ensure all new phone models include 5G",
-                            "Focus on 5G performance optimization",
-                            "Develop 5G-specific use cases and features"
-                        ],
-                        created_at=datetime.datetime.now()
-                    )
-                    trends.append(trend)
+            fiveg_count, fiveg_brands = counts.count_and_brands(tags=('5g',))
+            if fiveg_count > 2:
+                fields, trend_stats = self._trend_fields(series, tags=('5g',))
+                trend = MobileTrendInsight(
+                    trend_id=f"TECH_5G_{datetime.datetime.now().strftime('%Y%m%d')}",
+                    trend_type=MobileTrendType.TECHNOLOGY,
+                    title="5G Technology Acceleration in Mobile Phones",
+                    description="Increasing focus on 5G capabilities across mobile phone launches",
+                    **fields,
+                    affected_brands=fiveg_brands,
+                    key_metrics={
+                        'trend_statistics': trend_stats,
+                        'fiveg_mentions': fiveg_count,
+                        'brands_adopting': len(fiveg_brands),
+                        'growth_rate': 'High'
+                    },
+                    supporting_evidence=[
+                        f"{fiveg_count} 5G-related mobile announcements",
+                        f"Adoption by {len(fiveg_brands)} major brands",
+                        "Increased marketing focus on 5G capabilities"
+                    ],
+                    implications=[
+                        "5G is becoming standard feature expectation",
+                        "Network infrastructure development driving adoption",
+                        "Competitive pressure to include 5G in all segments"
+                    ],
+                    predictions=[
+                        "5G will be in 80%+ of mid-range phones by 2025",
+                        "5G-only phones may emerge in premium segment",
+                        "Focus will shift to 5G optimization and applications"
+                    ],
+                    recommendations=[
+                        "Ensure all new phone models include 5G",
+                        "Focus on 5G performance optimization",
+                        "Develop 5G-specific use cases and features"
+                    ],
+                    created_at=datetime.datetime.now()
+                )
+                trends.append(trend)
 
             # AI/Machine Learning integration
-            ai_keywords = ['AI', 'artificial intelligence', 'machine learning', 'ML', 'neural', 'smart']
-            ai_pattern = '|'.join(ai_keywords)
-            ai_events = df[df['description'].str.contains(ai_pattern, case=False, na=False)]
-            if len(ai_events) > 1:
+            ai_count, ai_brands = counts.count_and_brands(tags=('ai',))
+            if ai_count > 1:
+                fields, trend_stats = self._trend_fields(series, tags=('ai',))
                 trend = MobileTrendInsight(
                     trend_id=f"TECH_AI_{datetime.datetime.now().strftime('%Y%m%d')}",
                     trend_type=MobileTrendType.TECHNOLOGY,
                     title="AI Integration in Mobile Devices",
                     description="Growing integration of AI capabilities in mobile phones",
-                    direction=TrendDirection.INCREASING,
-                    significance=TrendSignificance.HIGH,
-                    confidence_score=0.85,
-                    time_period="Last 90 days",
-                    affected_brands=list(ai_events['competitor'].dropna().unique()),
+                    **fields,
+                    affected_brands=ai_brands,
                     key_metrics={
-                        'ai_mentions': len(ai_events),
-                        'brands_implementing': len(ai_events['competitor'].dropna().unique())
+                        'trend_statistics': trend_stats,
+                        'ai_mentions': ai_count,
+                        'brands_implementing': len(ai_brands)
                     },
                     supporting_evidence=[
-                        f"{len(ai_events)} AI-related mobile announcements",
+                        f"{ai_count} AI-related mobile announcements",
                         "AI processors becoming standard in flagship phones",
                         "AI photography and video features proliferating"
                     ],
@@ -267,30 +344,27 @@ class MobileTrendAnalysisAgent:
             print(f"Error in technology trend analysis: {str(e)}")
         return trends
 
-    def _analyze_performance_trends(self, df: pd.DataFrame) -> List[MobileTrendInsight]:
+    def _analyze_performance_trends(self, counts: TrendCounts, series: TrendSeries) -> List[MobileTrendInsight]:
         """Analyze mobile performance enhancement trends"""
         trends: List[MobileTrendInsight] = []
         try:
-            performance_keywords = ['processor', 'chipset', 'performance', 'speed', 'RAM', 'storage', 'benchmark']
-            performance_pattern = '|'.join(performance_keywords)
-            performance_events = df[df['description'].str.contains(performance_pattern, case=False, na=False)]
-            if len(performance_events) > 2:
+            performance_count, performance_brands = counts.count_and_brands(tags=('performance',))
+            if performance_count > 2:
+                fields, trend_stats = self._trend_fields(series, tags=('performance',))
                 trend = MobileTrendInsight(
                     trend_id=f"PERFORMANCE_{datetime.datetime.now().strftime('%Y%m%d')}",
                     trend_type=MobileTrendType.PERFORMANCE,
                     title="Mobile Performance Enhancement Focus",
                     description="Increasing emphasis on mobile phone performance improvements",
-                    direction=TrendDirection.INCREASING,
-                    significance=TrendSignificance.HIGH,
-                    confidence_score=0.8,
-                    time_period="Last 90 days",
-                    affected_brands=list(performance_events['competitor'].dropna().unique()),
+                    **fields,
+                    affected_brands=performance_brands,
                     key_metrics={
-                        'performance_announcements': len(performance_events),
-                        'brands_focusing_performance': len(performance_events['competitor'].dropna().unique())
+                        'trend_statistics': trend_stats,
+                        'performance_announcements': performance_count,
+                        'brands_focusing_performance': len(performance_brands)
                     },
                     supporting_evidence=[
-                        f"{len(performance_events)} performance-related announcements",
+                        f"{performance_count} performance-related announcements",
                         "Advanced chipsets becoming standard",
                         "RAM and storage capacities increasing"
                     ],
@@ -376,12 +450,12 @@ Generated: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 """
                 for evidence in trend.supporting_evidence[:2]:
                     report += f"• {evidence}\n"
-                report += f"""
+                report += """
 *Predictions*:
 """
                 for prediction in trend.predictions[:2]:
                     report += f"• {prediction}\n"
-                report += f"""
+                report += """
 *Recommended Actions*:
 """
                 for rec in trend.recommendations[:2]:
@@ -438,7 +512,7 @@ Generated: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
 Average Confidence Score: {np.mean([t.confidence_score for t in trends]):.2%}
 Highest Confidence Trend: {max(trends, key=lambda x: x.confidence_score).title}
-Most Significant Trend: {max(trends, key=lambda x: {'CRITICAL': 4, 'HIGH': 3, 'MEDIUM': 2, 'LOW': 1}[x.significance.value]).title}
+Most Significant Trend: {max(trends, key=lambda x: {'Critical': 4, 'High': 3, 'Medium': 2, 'Low': 1}[x.significance.value]).title}
 
 ---
 *Report generated by Mobile Trend Analysis Agent*
@@ -460,50 +534,22 @@ Most Significant Trend: {max(trends, key=lambda x: {'CRITICAL': 4, 'HIGH': 3, 'M
                 predictions['next_180_days'].extend(trend.predictions[:1])
         return predictions
 
-    def visualize_trends(self, trends: List[MobileTrendInsight]) -> None:
-        """Create visualizations for mobile trends"""
+    def visualize_trends(self, trends: List[MobileTrendInsight], fmt: str = 'png',
+                         timeout: Optional[float] = 30.0) -> Any:
+        """Trend dashboard as PNG/SVG bytes, or its JSON spec for fmt='json'
+
+        Figures are drawn on the shared chart renderer's background worker and
+        cached per trend snapshot; matplotlib is imported on the first render.
+        """
         if not trends:
             print("No trends to visualize")
-            return
-
-        sns.set_theme()
-        fig, axes = plt.subplots(2, 2, figsize=(15, 12))
-        fig.suptitle('📱 Mobile Market Trend Analysis Dashboard', fontsize=16, fontweight='bold')
-
-        # 1) Trend Significance Distribution
-        significance_counts = Counter(trend.significance.value for trend in trends)
-        if len(significance_counts) > 0:
-            axes[0,0].pie(significance_counts.values(), labels=list(significance_counts.keys()), autopct='%1.1f%%')
-            axes[0,0].set_title('Trend Significance Distribution')
-        else:
-            axes[0,0].text(0.5,0.5,'No data', ha='center'); axes[0,0].axis('off')
-
-        # 2) Trend Types
-        type_counts = Counter(trend.trend_type.value for trend in trends)
-        axes[0,1].bar(range(len(type_counts)), list(type_counts.values()))
-        axes[0,1].set_xticks(range(len(type_counts)))
-        axes[0,1].set_xticklabels([t.replace(' ', '\n') for t in type_counts.keys()], rotation=45)
-        axes[0,1].set_title('Trend Categories')
-
-        # 3) Confidence Score Distribution
-        confidence_scores = [trend.confidence_score for trend in trends]
-        axes[1,0].hist(confidence_scores, bins=10, alpha=0.7)
-        axes[1,0].set_xlabel('Confidence Score'); axes[1,0].set_ylabel('Frequency')
-        axes[1,0].set_title('Trend Confidence Distribution')
-
-        # 4) Brand Involvement
-        all_brands = []
-        for trend in trends:
-            all_brands.extend([b for b in trend.affected_brands if b])
-        brand_counts = Counter(all_brands)
-        top_brands = dict(brand_counts.most_common(10))
-        axes[1,1].bar(range(len(top_brands)), list(top_brands.values()))
-        axes[1,1].set_xticks(range(len(top_brands)))
-        axes[1,1].set_xticklabels(list(top_brands.keys()), rotation=45)
-        axes[1,1].set_title('Brand Involvement in Trends')
-
-        plt.tight_layout()
-        plt.show()
+            return None
+        renderer = shared_renderer()
+        chart = renderer.render(trends, fmt, timeout=timeout)
+        if chart is None:
+            print("Chart not rendered (matplotlib missing or render still running); returning the JSON spec")
+            return renderer.render(trends, 'json')
+        return chart
 
     def _initialize_mobile_patterns(self) -> Dict[str, Any]:
         """Initialize mobile-specific trend patterns"""
@@ -521,22 +567,9 @@ Most Significant Trend: {max(trends, key=lambda x: {'CRITICAL': 4, 'HIGH': 3, 'M
             '2026': ['Foldable mainstream', 'Holographic displays', '200W charging']
         }
 
-    def _parse_date(self, date_str: Any) -> datetime.datetime:
-        """Parse various date formats"""
-        try:
-            if isinstance(date_str, datetime.datetime):
-                return date_str
-            elif isinstance(date_str, str):
-                for fmt in ['%Y-%m-%d', '%d/%m/%Y', '%m/%d/%Y', '%Y-%m-%d %H:%M:%S']:
-                    try:
-                        return datetime.datetime.strptime(date_str, fmt)
-                    except ValueError:
-                        continue
-                return datetime.datetime.now()
-            else:
-                return datetime.datetime.now()
-        except:
-            return datetime.datetime.now()
+    def _parse_date(self, date_str: Any) -> Optional[datetime.datetime]:
+        """Parse various date formats (None when unparseable; failures are in self.date_parser.failures)"""
+        return self.date_parser.parse(date_str)
 
     def export_trends_data(self, trends: List[MobileTrendInsight], filename: str = None) -> str:
         """Export trend analysis data to JSON"""
@@ -554,42 +587,38 @@ Most Significant Trend: {max(trends, key=lambda x: {'CRITICAL': 4, 'HIGH': 3, 'M
 
         try:
             with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(trends_data, f, indent=2, ensure_ascii=False)
+                json.dump(trends_data, f, indent=2, ensure_ascii=False,
+                          default=lambda o: o.value if isinstance(o, Enum) else str(o))
             return f"Trends data exported to {filename}"
         except Exception as e:
             return f"Error exporting data: {str(e)}"
 
     # ===== Pricing, Camera, Feature, Launch, Market, Brand Analyses =====
-    def _analyze_pricing_trends(self, df: pd.DataFrame) -> List[MobileTrendInsight]:
+    def _analyze_pricing_trends(self, counts: TrendCounts, series: TrendSeries) -> List[MobileTrendInsight]:
         trends: List[MobileTrendInsight] = []
         try:
-            pricing_events = df[df['event_type'] == 'pricing_change']
-            if len(pricing_events) > 2:
-                price_increases = pricing_events[
-                    pricing_events['description'].str.contains('increase|raise|higher', case=False, na=False)
-                ]
-                price_decreases = pricing_events[
-                    pricing_events['description'].str.contains('decrease|reduce|lower|discount', case=False, na=False)
-                ]
-                if len(price_decreases) > len(price_increases):
+            pricing_count, pricing_brands = counts.count_and_brands(event_type='pricing_change')
+            if pricing_count > 2:
+                increase_count = counts.count('pricing_change', ('price_up',))
+                decrease_count, decrease_brands = counts.count_and_brands(event_type='pricing_change', tags=('price_down',))
+                if decrease_count > increase_count:
+                    fields, trend_stats = self._trend_fields(series, 'pricing_change', ('price_down',), direction=TrendDirection.DECREASING)
                     trend = MobileTrendInsight(
                         trend_id=f"PRICE_DOWN_{datetime.datetime.now().strftime('%Y%m%d')}",
                         trend_type=MobileTrendType.PRICING,
                         title="Mobile Phone Price Reduction Trend",
                         description="Increasing trend of mobile phone price reductions across brands",
-                        direction=TrendDirection.DECREASING,
-                        significance=TrendSignificance.HIGH,
-                        confidence_score=0.75,
-                        time_period="Last 90 days",
-                        affected_brands=list(pricing_events['competitor'].dropna().unique()),
+                        **fields,
+                        affected_brands=pricing_brands,
                         key_metrics={
-                            'price_reduction_events': len(price_decreases),
-                            'brands_reducing_prices': len(price_decreases['competitor'].dropna().unique()),
+                            'trend_statistics': trend_stats,
+                            'price_reduction_events': decrease_count,
+                            'brands_reducing_prices': len(decrease_brands),
                             'net_pricing_direction': 'Downward'
                         },
                         supporting_evidence=[
-                            f"{len(price_decreases)} price reduction events",
-                            f"{len(price_decreases['competitor'].dropna().unique())} brands reducing prices",
+                            f"{decrease_count} price reduction events",
+                            f"{len(decrease_brands)} brands reducing prices",
                             "Competitive pressure driving price competition"
                         ],
                         implications=[
@@ -611,24 +640,23 @@ Most Significant Trend: {max(trends, key=lambda x: {'CRITICAL': 4, 'HIGH': 3, 'M
                     )
                     trends.append(trend)
 
-            premium_events = df[df['description'].str.contains('premium|flagship|ultra|pro max', case=False, na=False)]
-            if len(premium_events) > 3:
+            premium_count, premium_brands = counts.count_and_brands(tags=('premium',))
+            if premium_count > 3:
+                fields, trend_stats = self._trend_fields(series, tags=('premium',))
                 trend = MobileTrendInsight(
                     trend_id=f"PREMIUM_FOCUS_{datetime.datetime.now().strftime('%Y%m%d')}",
                     trend_type=MobileTrendType.PRICING,
                     title="Premium Mobile Phone Segment Expansion",
                     description="Increased focus on premium smartphone segment across brands",
-                    direction=TrendDirection.INCREASING,
-                    significance=TrendSignificance.MEDIUM,
-                    confidence_score=0.7,
-                    time_period="Last 90 days",
-                    affected_brands=list(premium_events['competitor'].dropna().unique()),
+                    **fields,
+                    affected_brands=premium_brands,
                     key_metrics={
-                        'premium_launches': len(premium_events),
-                        'brands_in_premium': len(premium_events['competitor'].dropna().unique())
+                        'trend_statistics': trend_stats,
+                        'premium_launches': premium_count,
+                        'brands_in_premium': len(premium_brands)
                     },
                     supporting_evidence=[
-                        f"{len(premium_events)} premium phone announcements",
+                        f"{premium_count} premium phone announcements",
                         "Multiple brands launching ultra-premium models",
                         "Increased feature differentiation in premium segment"
                     ],
@@ -654,31 +682,28 @@ Most Significant Trend: {max(trends, key=lambda x: {'CRITICAL': 4, 'HIGH': 3, 'M
             print(f"Error in pricing trend analysis: {str(e)}")
         return trends
 
-    def _analyze_camera_trends(self, df: pd.DataFrame) -> List[MobileTrendInsight]:
+    def _analyze_camera_trends(self, counts: TrendCounts, series: TrendSeries) -> List[MobileTrendInsight]:
         trends: List[MobileTrendInsight] = []
         try:
-            camera_keywords = ['camera', 'MP', 'megapixel', 'photo', 'photography', 'video', 'lens', 'zoom']
-            camera_pattern = '|'.join(camera_keywords)
-            camera_events = df[df['description'].str.contains(camera_pattern, case=False, na=False)]
-            if len(camera_events) > 3:
-                mp_mentions = camera_events[camera_events['description'].str.contains(r'\d+MP|\d+\s*megapixel', case=False, na=False)]
-                if len(mp_mentions) > 2:
+            camera_count, camera_brands = counts.count_and_brands(tags=('camera',))
+            if camera_count > 3:
+                mp_count, mp_brands = counts.count_and_brands(tags=('camera', 'megapixel'))
+                if mp_count > 2:
+                    fields, trend_stats = self._trend_fields(series, tags=('camera', 'megapixel'))
                     trend = MobileTrendInsight(
                         trend_id=f"CAMERA_MP_{datetime.datetime.now().strftime('%Y%m%d')}",
                         trend_type=MobileTrendType.CAMERA,
                         title="Mobile Camera Megapixel Arms Race",
                         description="Continuous increase in mobile camera megapixel counts across brands",
-                        direction=TrendDirection.INCREASING,
-                        significance=TrendSignificance.HIGH,
-                        confidence_score=0.8,
-                        time_period="Last 90 days",
-                        affected_brands=list(mp_mentions['competitor'].dropna().unique()),
+                        **fields,
+                        affected_brands=mp_brands,
                         key_metrics={
-                            'camera_announcements': len(mp_mentions),
-                            'brands_upgrading_cameras': len(mp_mentions['competitor'].dropna().unique())
+                            'trend_statistics': trend_stats,
+                            'camera_announcements': mp_count,
+                            'brands_upgrading_cameras': len(mp_brands)
                         },
                         supporting_evidence=[
-                            f"{len(mp_mentions)} camera megapixel announcements",
+                            f"{mp_count} camera megapixel announcements",
                             "Multiple brands launching 100MP+ cameras",
                             "Camera quality becoming primary differentiator"
                         ],
@@ -701,24 +726,23 @@ Most Significant Trend: {max(trends, key=lambda x: {'CRITICAL': 4, 'HIGH': 3, 'M
                     )
                     trends.append(trend)
 
-            video_events = camera_events[camera_events['description'].str.contains('video|4K|8K|recording', case=False, na=False)]
-            if len(video_events) > 2:
+            video_count, video_brands = counts.count_and_brands(tags=('camera', 'video'))
+            if video_count > 2:
+                fields, trend_stats = self._trend_fields(series, tags=('camera', 'video'))
                 trend = MobileTrendInsight(
                     trend_id=f"VIDEO_FOCUS_{datetime.datetime.now().strftime('%Y%m%d')}",
                     trend_type=MobileTrendType.CAMERA,
                     title="Mobile Video Capabilities Enhancement",
                     description="Increasing focus on mobile video recording capabilities",
-                    direction=TrendDirection.INCREASING,
-                    significance=TrendSignificance.MEDIUM,
-                    confidence_score=0.75,
-                    time_period="Last 90 days",
-                    affected_brands=list(video_events['competitor'].dropna().unique()),
+                    **fields,
+                    affected_brands=video_brands,
                     key_metrics={
-                        'video_feature_announcements': len(video_events),
-                        'brands_enhancing_video': len(video_events['competitor'].dropna().unique())
+                        'trend_statistics': trend_stats,
+                        'video_feature_announcements': video_count,
+                        'brands_enhancing_video': len(video_brands)
                     },
                     supporting_evidence=[
-                        f"{len(video_events)} video capability announcements",
+                        f"{video_count} video capability announcements",
                         "4K/8K video becoming standard in premium phones",
                         "Advanced video stabilization features"
                     ],
@@ -744,29 +768,26 @@ Most Significant Trend: {max(trends, key=lambda x: {'CRITICAL': 4, 'HIGH': 3, 'M
             print(f"Error in camera trend analysis: {str(e)}")
         return trends
 
-    def _analyze_feature_trends(self, df: pd.DataFrame) -> List[MobileTrendInsight]:
+    def _analyze_feature_trends(self, counts: TrendCounts, series: TrendSeries) -> List[MobileTrendInsight]:
         trends: List[MobileTrendInsight] = []
         try:
-            charging_keywords = ['fast charging', 'wireless charging', 'mAh', 'battery', 'power', 'charge']
-            charging_pattern = '|'.join(charging_keywords)
-            charging_events = df[df['description'].str.contains(charging_pattern, case=False, na=False)]
-            if len(charging_events) > 2:
+            charging_count, charging_brands = counts.count_and_brands(tags=('charging',))
+            if charging_count > 2:
+                fields, trend_stats = self._trend_fields(series, tags=('charging',))
                 trend = MobileTrendInsight(
                     trend_id=f"CHARGING_TECH_{datetime.datetime.now().strftime('%Y%m%d')}",
                     trend_type=MobileTrendType.FEATURE,
                     title="Mobile Fast Charging Technology Race",
                     description="Rapid advancement in mobile phone charging technologies",
-                    direction=TrendDirection.INCREASING,
-                    significance=TrendSignificance.HIGH,
-                    confidence_score=0.85,
-                    time_period="Last 90 days",
-                    affected_brands=list(charging_events['competitor'].dropna().unique()),
+                    **fields,
+                    affected_brands=charging_brands,
                     key_metrics={
-                        'charging_announcements': len(charging_events),
-                        'brands_upgrading_charging': len(charging_events['competitor'].dropna().unique())
+                        'trend_statistics': trend_stats,
+                        'charging_announcements': charging_count,
+                        'brands_upgrading_charging': len(charging_brands)
                     },
                     supporting_evidence=[
-                        f"{len(charging_events)} charging technology announcements",
+                        f"{charging_count} charging technology announcements",
                         "Fast charging speeds increasing rapidly",
                         "Wireless charging becoming standard"
                     ],
@@ -789,26 +810,23 @@ Most Significant Trend: {max(trends, key=lambda x: {'CRITICAL': 4, 'HIGH': 3, 'M
                 )
                 trends.append(trend)
 
-            display_keywords = ['display', 'screen', 'OLED', 'AMOLED', 'refresh rate', '120Hz', '90Hz', 'foldable']
-            display_pattern = '|'.join(display_keywords)
-            display_events = df[df['description'].str.contains(display_pattern, case=False, na=False)]
-            if len(display_events) > 2:
+            display_count, display_brands = counts.count_and_brands(tags=('display',))
+            if display_count > 2:
+                fields, trend_stats = self._trend_fields(series, tags=('display',))
                 trend = MobileTrendInsight(
                     trend_id=f"DISPLAY_TECH_{datetime.datetime.now().strftime('%Y%m%d')}",
                     trend_type=MobileTrendType.DISPLAY,
                     title="Mobile Display Technology Evolution",
                     description="Advancement in mobile display technologies and refresh rates",
-                    direction=TrendDirection.INCREASING,
-                    significance=TrendSignificance.MEDIUM,
-                    confidence_score=0.8,
-                    time_period="Last 90 days",
-                    affected_brands=list(display_events['competitor'].dropna().unique()),
+                    **fields,
+                    affected_brands=display_brands,
                     key_metrics={
-                        'display_announcements': len(display_events),
-                        'brands_upgrading_displays': len(display_events['competitor'].dropna().unique())
+                        'trend_statistics': trend_stats,
+                        'display_announcements': display_count,
+                        'brands_upgrading_displays': len(display_brands)
                     },
                     supporting_evidence=[
-                        f"{len(display_events)} display technology announcements",
+                        f"{display_count} display technology announcements",
                         "High refresh rates becoming standard",
                         "OLED technology proliferating across segments"
                     ],
@@ -834,84 +852,81 @@ Most Significant Trend: {max(trends, key=lambda x: {'CRITICAL': 4, 'HIGH': 3, 'M
             print(f"Error in feature trend analysis: {str(e)}")
         return trends
 
-    def _analyze_launch_patterns(self, df: pd.DataFrame) -> List[MobileTrendInsight]:
+    def _analyze_launch_patterns(self, counts: TrendCounts, series: TrendSeries) -> List[MobileTrendInsight]:
         trends: List[MobileTrendInsight] = []
         try:
-            launch_events = df[df['event_type'] == 'product_launch']
-            if len(launch_events) > 3:
-                launch_events = launch_events.copy()
-                launch_events['datetime'] = pd.to_datetime(launch_events['date'], errors='coerce')
-                launch_events = launch_events.dropna(subset=['datetime'])
-                if len(launch_events) > 3:
-                    launch_events['month'] = launch_events['datetime'].dt.month
-                    monthly_launches = launch_events['month'].value_counts()
-                    peak_months = monthly_launches.head(2).index.tolist()
-                    trend = MobileTrendInsight(
-                        trend_id=f"LAUNCH_PATTERN_{datetime.datetime.now().strftime('%Y%m%d')}",
-                        trend_type=MobileTrendType.LAUNCH_PATTERN,
-                        title="Mobile Phone Launch Seasonality Pattern",
-                        description=f"Mobile phone launches concentrated in months {peak_months}",
-                        direction=TrendDirection.SEASONAL,
-                        significance=TrendSignificance.MEDIUM,
-                        confidence_score=0.7,
-                        time_period="Last 90 days",
-                        affected_brands=list(launch_events['competitor'].dropna().unique()),
-                        key_metrics={
-                            'total_launches': len(launch_events),
-                            'peak_months': peak_months,
-                            'brands_launching': len(launch_events['competitor'].dropna().unique())
-                        },
-                        supporting_evidence=[
-                            f"{len(launch_events)} product launches tracked",
-                            f"Peak launch activity in months {peak_months}",
-                            "Seasonal launch patterns emerging"
-                        ],
-                        implications=[
-                            "Strategic timing important for launch success",
-                            "Market attention divided during peak months",
-                            "Opportunity for counter-seasonal launches"
-                        ],
-                        predictions=[
-                            "Launch timing will become more strategic",
-                            "Off-season launches may gain more attention",
-                            "Global launch coordination will improve"
-                        ],
-                        recommendations=[
-                            "Time launches to avoid peak competition periods",
-                            "Consider counter-seasonal launch strategy",
-                            "Plan marketing budget allocation around launch seasons"
-                        ],
-                        created_at=datetime.datetime.now()
-                    )
-                    trends.append(trend)
+            launch_count, launch_brands = counts.count_and_brands(event_type='product_launch')
+            if launch_count > 3:
+                # Launch months counted on arrival from the parsed event dates
+                monthly_launches = counts.month_counts('product_launch')
+                peak_months = [month for month, _ in monthly_launches.most_common(2)]
+                fields, trend_stats = self._trend_fields(series, 'product_launch', direction=TrendDirection.SEASONAL)
+                trend = MobileTrendInsight(
+                    trend_id=f"LAUNCH_PATTERN_{datetime.datetime.now().strftime('%Y%m%d')}",
+                    trend_type=MobileTrendType.LAUNCH_PATTERN,
+                    title="Mobile Phone Launch Seasonality Pattern",
+                    description=f"Mobile phone launches concentrated in months {peak_months}",
+                    **fields,
+                    affected_brands=launch_brands,
+                    key_metrics={
+                        'trend_statistics': trend_stats,
+                        'total_launches': launch_count,
+                        'peak_months': peak_months,
+                        'brands_launching': len(launch_brands)
+                    },
+                    supporting_evidence=[
+                        f"{launch_count} product launches tracked",
+                        f"Peak launch activity in months {peak_months}",
+                        "Seasonal launch patterns emerging"
+                    ],
+                    implications=[
+                        "Strategic timing important for launch success",
+                        "Market attention divided during peak months",
+                        "Opportunity for counter-seasonal launches"
+                    ],
+                    predictions=[
+                        "Launch timing will become more strategic",
+                        "Off-season launches may gain more attention",
+                        "Global launch coordination will improve"
+                    ],
+                    recommendations=[
+                        "Time launches to avoid peak competition periods",
+                        "Consider counter-seasonal launch strategy",
+                        "Plan marketing budget allocation around launch seasons"
+                    ],
+                    created_at=datetime.datetime.now()
+                )
+                trends.append(trend)
         except Exception as e:
             print(f"Error in launch pattern analysis: {str(e)}")
         return trends
 
-    def _analyze_market_movements(self, df: pd.DataFrame) -> List[MobileTrendInsight]:
+    def _analyze_market_movements(self, counts: TrendCounts, series: TrendSeries) -> List[MobileTrendInsight]:
         trends: List[MobileTrendInsight] = []
         try:
-            brand_activity = df['competitor'].value_counts()
+            brand_activity = counts.brand_counts()
+            total_events = counts.total
             if len(brand_activity) > 3:
-                most_active_brands = brand_activity.head(3).index.tolist()
+                top_brands = brand_activity.most_common(3)
+                most_active_brands = [brand for brand, _ in top_brands]
+                top_share = sum(n for _, n in top_brands)
+                fields, trend_stats = self._trend_fields(series)
                 trend = MobileTrendInsight(
                     trend_id=f"BRAND_ACTIVITY_{datetime.datetime.now().strftime('%Y%m%d')}",
                     trend_type=MobileTrendType.MARKET_SHARE,
                     title="Mobile Brand Competitive Activity Levels",
                     description=f"Highest competitive activity from {', '.join(most_active_brands)}",
-                    direction=TrendDirection.VOLATILE,
-                    significance=TrendSignificance.MEDIUM,
-                    confidence_score=0.75,
-                    time_period="Last 90 days",
+                    **fields,
                     affected_brands=most_active_brands,
                     key_metrics={
-                        'total_events': len(df),
+                        'trend_statistics': trend_stats,
+                        'total_events': total_events,
                         'most_active_brands': most_active_brands,
-                        'activity_concentration': f"{brand_activity.head(3).sum()}/{len(df)} events from top 3 brands"
+                        'activity_concentration': f"{top_share}/{total_events} events from top 3 brands"
                     },
                     supporting_evidence=[
-                        f"{brand_activity.iloc[0]} events from {most_active_brands[0]}",
-                        f"Top 3 brands account for {(brand_activity.head(3).sum()/len(df)*100):.1f}% of activity",
+                        f"{top_brands[0][1]} events from {most_active_brands[0]}",
+                        f"Top 3 brands account for {(top_share/total_events*100):.1f}% of activity",
                         "Concentrated competitive activity from leading brands"
                     ],
                     implications=[
@@ -936,27 +951,26 @@ Most Significant Trend: {max(trends, key=lambda x: {'CRITICAL': 4, 'HIGH': 3, 'M
             print(f"Error in market movement analysis: {str(e)}")
         return trends
 
-    def _analyze_brand_strategies(self, df: pd.DataFrame) -> List[MobileTrendInsight]:
+    def _analyze_brand_strategies(self, counts: TrendCounts, series: TrendSeries) -> List[MobileTrendInsight]:
         trends: List[MobileTrendInsight] = []
         try:
-            partnership_events = df[df['description'].str.contains('partnership|collaboration|alliance|deal', case=False, na=False)]
-            if len(partnership_events) > 2:
+            partnership_count, partnership_brands = counts.count_and_brands(tags=('partnership',))
+            if partnership_count > 2:
+                fields, trend_stats = self._trend_fields(series, tags=('partnership',))
                 trend = MobileTrendInsight(
                     trend_id=f"PARTNERSHIP_{datetime.datetime.now().strftime('%Y%m%d')}",
                     trend_type=MobileTrendType.PARTNERSHIP,
                     title="Mobile Industry Partnership Trend",
                     description="Increasing strategic partnerships in mobile industry",
-                    direction=TrendDirection.INCREASING,
-                    significance=TrendSignificance.MEDIUM,
-                    confidence_score=0.7,
-                    time_period="Last 90 days",
-                    affected_brands=list(partnership_events['competitor'].dropna().unique()),
+                    **fields,
+                    affected_brands=partnership_brands,
                     key_metrics={
-                        'partnership_announcements': len(partnership_events),
-                        'brands_partnering': len(partnership_events['competitor'].dropna().unique())
+                        'trend_statistics': trend_stats,
+                        'partnership_announcements': partnership_count,
+                        'brands_partnering': len(partnership_brands)
                     },
                     supporting_evidence=[
-                        f"{len(partnership_events)} partnership announcements",
+                        f"{partnership_count} partnership announcements",
                         "Strategic alliances becoming more common",
                         "Collaboration across technology and content"
                     ],
@@ -982,96 +996,101 @@ Most Significant Trend: {max(trends, key=lambda x: {'CRITICAL': 4, 'HIGH': 3, 'M
             print(f"Error in brand strategy analysis: {str(e)}")
         return trends
 
-agent = MobileTrendAnalysisAgent()
-
-sample_mobile_events = [
-    {
-        'event_type': 'product_launch',
-        'competitor': 'Samsung',
-        'description': 'Samsung Galaxy S25 Ultra with 200MP camera, AI photography, and 5G enhancements',
-        'date': '2025-08-15',
-        'source': 'Samsung Official',
-        'impact_score': 8.5
-    },
-    {
-        'event_type': 'product_launch',
-        'competitor': 'Apple',
-        'description': 'iPhone 16 Pro: advanced on-device AI processing, optimized 5G modem',
-        'date': '2025-07-10',
-        'source': 'Apple Event',
-        'impact_score': 9.0
-    },
-    {
-        'event_type': 'pricing_change',
-        'competitor': 'Oppo',
-        'description': 'Oppo reduces Find X8 Pro price by 15% with fast charging upgrade promo',
-        'date': '2025-08-01',
-        'source': 'Oppo News',
-        'impact_score': 6.5
-    },
-    {
-        'event_type': 'feature_update',
-        'competitor': 'Xiaomi',
-        'description': 'Xiaomi 15 Pro adds 120W fast charging and wireless charging improvements',
-        'date': '2025-07-28',
-        'source': 'Xiaomi Launch',
-        'impact_score': 7.2
-    },
-    {
-        'event_type': 'marketing_campaign',
-        'competitor': 'OnePlus',
-        'description': 'OnePlus partners with professional photographers for AI photo campaign',
-        'date': '2025-08-20',
-        'source': 'OnePlus Marketing',
-        'impact_score': 6.0
-    },
-    {
-        'event_type': 'product_launch',
-        'competitor': 'Google',
-        'description': 'Google Pixel 10 with enhanced AI features and computational photography',
-        'date': '2025-08-10',
-        'source': 'Google I/O',
-        'impact_score': 7.8
-    },
-    {
-        'event_type': 'partnership',
-        'competitor': 'Vivo',
-        'description': 'Vivo announces partnership with Zeiss for next-gen camera tech',
-        'date': '2025-08-05',
-        'source': 'Vivo Press',
-        'impact_score': 6.8
-    },
-    {
-        'event_type': 'product_launch',
-        'competitor': 'Nothing',
-        'description': 'Nothing Phone 4 introduces unique design and AI-powered interface',
-        'date': '2025-07-30',
-        'source': 'Nothing Official',
-        'impact_score': 5.5
-    }
-]
-
-print("🔍 Analyzing mobile market trends...")
-trend_insights = agent.analyze_mobile_trends(sample_mobile_events, time_window_days=120)
-print(f"✅ Identified {len(trend_insights)} trends\n")
-
-for i, t in enumerate(trend_insights[:5], 1):
-    print(f"{i}. {t.title} — {t.trend_type.value} — {t.significance.value} ({t.confidence_score:.0%})")
-
-# ===== Report, Visuals, Export =====
-report = agent.generate_mobile_trend_report(trend_insights)
-print(report[:2000] + "..." if len(report) > 2000 else report)
-
-# Visualizations
-agent.visualize_trends(trend_insights)
-
-# Export JSON + Download (Colab)
-msg = agent.export_trends_data(trend_insights, filename="mobile_trends_report.json")
-print("\n" + msg)
-
-try:
-    from google.colab import files
-    files.download("mobile_trends_report.json")
-except Exception as e:
-    print("If running locally (not Colab), skip download:", e)
+if __name__ == "__main__":
+    agent = MobileTrendAnalysisAgent()
+
+    sample_mobile_events = [
+        {
+            'event_type': 'product_launch',
+            'competitor': 'Samsung',
+            'description': 'Samsung Galaxy S25 Ultra with 200MP camera, AI photography, and 5G enhancements',
+            'date': '2025-08-15',
+            'source': 'Samsung Official',
+            'impact_score': 8.5
+        },
+        {
+            'event_type': 'product_launch',
+            'competitor': 'Apple',
+            'description': 'iPhone 16 Pro: advanced on-device AI processing, optimized 5G modem',
+            'date': '2025-07-10',
+            'source': 'Apple Event',
+            'impact_score': 9.0
+        },
+        {
+            'event_type': 'pricing_change',
+            'competitor': 'Oppo',
+            'description': 'Oppo reduces Find X8 Pro price by 15% with fast charging upgrade promo',
+            'date': '2025-08-01',
+            'source': 'Oppo News',
+            'impact_score': 6.5
+        },
+        {
+            'event_type': 'feature_update',
+            'competitor': 'Xiaomi',
+            'description': 'Xiaomi 15 Pro adds 120W fast charging and wireless charging improvements',
+            'date': '2025-07-28',
+            'source': 'Xiaomi Launch',
+            'impact_score': 7.2
+        },
+        {
+            'event_type': 'marketing_campaign',
+            'competitor': 'OnePlus',
+            'description': 'OnePlus partners with professional photographers for AI photo campaign',
+            'date': '2025-08-20',
+            'source': 'OnePlus Marketing',
+            'impact_score': 6.0
+        },
+        {
+            'event_type': 'product_launch',
+            'competitor': 'Google',
+            'description': 'Google Pixel 10 with enhanced AI features and computational photography',
+            'date': '2025-08-10',
+            'source': 'Google I/O',
+            'impact_score': 7.8
+        },
+        {
+            'event_type': 'partnership',
+            'competitor': 'Vivo',
+            'description': 'Vivo announces partnership with Zeiss for next-gen camera tech',
+            'date': '2025-08-05',
+            'source': 'Vivo Press',
+            'impact_score': 6.8
+        },
+        {
+            'event_type': 'product_launch',
+            'competitor': 'Nothing',
+            'description': 'Nothing Phone 4 introduces unique design and AI-powered interface',
+            'date': '2025-07-30',
+            'source': 'Nothing Official',
+            'impact_score': 5.5
+        }
+    ]
+
+    print("🔍 Analyzing mobile market trends...")
+    trend_insights = agent.analyze_mobile_trends(sample_mobile_events, time_window_days=120)
+    print(f"✅ Identified {len(trend_insights)} trends\n")
+
+    for i, t in enumerate(trend_insights[:5], 1):
+        print(f"{i}. {t.title} — {t.trend_type.value} — {t.significance.value} ({t.confidence_score:.0%})")
+
+    # ===== Report, Visuals, Export =====
+    report = agent.generate_mobile_trend_report(trend_insights)
+    print(report[:2000] + "..." if len(report) > 2000 else report)
+
+    # Visualizations (rendered off the main thread, cached per trend snapshot)
+    dashboard = agent.visualize_trends(trend_insights)
+    if isinstance(dashboard, bytes):
+        with open("mobile_trends_dashboard.png", "wb") as f:
+            f.write(dashboard)
+        print("Dashboard saved to mobile_trends_dashboard.png")
+
+    # Export JSON + Download (Colab)
+    msg = agent.export_trends_data(trend_insights, filename="mobile_trends_report.json")
+    print("\n" + msg)
+
+    try:
+        from google.colab import files
+        files.download("mobile_trends_report.json")
+    except Exception as e:
+        print("If running locally (not Colab), skip download:", e)
 